@@ -0,0 +1,58 @@
+## 개별 전송 파이프라인 처리량 벤치마크
+# 실행 방법 (app 디렉토리에서): python -m benchmarks.delivery_benchmark
+import time
+
+from benchmarks.smtp_sink import SMTPSink
+from services import delivery_service
+from services.delivery_service import DeliveryPipeline, summarize_results
+
+# 벤치마크 설정
+RECIPIENT_COUNT = 400
+SERVER_LATENCY = 0.02           # 메시지당 SMTP 서버 응답 지연 (초)
+WORKER_COUNTS = [1, 2, 4, 8, 16]
+RATE_LIMIT = 150                # 속도 제한 확인용 초당 전송 수
+
+
+# 한 설정으로 전송하고 처리량 측정
+def run(workers: int, rate_per_sec: float, recipients, subject: str, body: str):
+    pipeline = DeliveryPipeline(workers=workers, rate_per_sec=rate_per_sec)
+    # 시작 직후 버킷에 쌓여 있는 토큰은 비워서 정상 상태 처리량을 측정
+    pipeline.rate_limiter._tokens = 0
+    try:
+        start = time.perf_counter()
+        results = pipeline.deliver(subject, body, recipients)
+        elapsed = time.perf_counter() - start
+    finally:
+        pipeline.close()
+    return len(results) / elapsed, summarize_results(results)
+
+
+def main():
+    sink = SMTPSink(latency=SERVER_LATENCY, reject_rate=0.01).start()
+    delivery_service.SMTP_HOST = sink.host
+    delivery_service.SMTP_PORT = sink.port
+    delivery_service.SMTP_USER = None
+    delivery_service.SMTP_FROM = "weather@example.com"
+
+    recipients = [f"user{i}@example.com" for i in range(RECIPIENT_COUNT)]
+    subject = "[날씨 알리미] 벤치마크"
+    body = "<html><body><p>벤치마크 본문</p></body></html>"
+
+    try:
+        print(f"수신자 {RECIPIENT_COUNT}명, 서버 지연 {SERVER_LATENCY * 1000:.0f}ms/메시지")
+        for rate in (0, RATE_LIMIT):
+            label = "제한 없음" if rate <= 0 else f"{rate}건/초"
+            for workers in WORKER_COUNTS:
+                throughput, summary = run(workers, rate, recipients, subject, body)
+                print(
+                    f"속도 제한 {label:>8} | 작업자 {workers:2d} | {throughput:7.1f}건/초 | "
+                    f"성공 {summary['sent']} 실패 {summary['failed']} | "
+                    f"p50 {summary['p50'] * 1000:5.1f}ms p95 {summary['p95'] * 1000:5.1f}ms"
+                )
+        print(f"SMTP 연결 수: {sink.connections}")
+    finally:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+## 날씨 데이터 요청 벤치마크
+# 실행 방법 (app 디렉토리에서): python -m benchmarks.fetch_benchmark
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from statistics import median
+
+from services import weather_service
+
+# 가짜 API 응답 지연 시간 (초)
+WEATHER_LATENCY = 0.30
+AIR_LATENCY = 0.20
+ROUNDS = 5
+
+
+# 지연 시간을 흉내내는 가짜 OpenWeatherMap 핸들러
+class SlowOWMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"           # keep-alive 지원
+
+    def do_GET(self):
+        if self.path.startswith("/onecall"):
+            time.sleep(WEATHER_LATENCY)
+            payload = {"current": {"temp": 20.0, "weather": [{"id": 800}]}, "hourly": [], "daily": []}
+        else:
+            time.sleep(AIR_LATENCY)
+            payload = {"list": [{"main": {"aqi": 2}}]}
+
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass                                # 요청 로그 출력 생략
+
+
+# 순차 요청 (기존 방식)
+async def fetch_sequential():
+    forecast = await weather_service.get_forecast()
+    aqi = await weather_service.get_aqi()
+    return forecast, aqi
+
+
+# 한 방식의 소요 시간 측정
+def measure(fetch) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        asyncio.run(fetch())
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowOWMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    # 엔드포인트를 로컬 서버로 교체
+    weather_service.OWM_ENDPOINT = f"{base_url}/onecall"
+    weather_service.AIR_POLLUTION_ENDPOINT = f"{base_url}/air_pollution"
+    weather_service.forecast_cache.ttls = {}          # 매번 실제로 요청하도록 캐시 사용 안 함
+
+    try:
+        sequential = measure(fetch_sequential)
+        concurrent = measure(weather_service.fetch_weather_bundle)
+    finally:
+        weather_service.close_http_client()
+        server.shutdown()
+
+    print(f"날씨 API 지연: {WEATHER_LATENCY * 1000:.0f}ms, 대기질 API 지연: {AIR_LATENCY * 1000:.0f}ms")
+    print(f"순차 요청 (중앙값): {sequential * 1000:.1f}ms  (기대값 ≈ 합 {(WEATHER_LATENCY + AIR_LATENCY) * 1000:.0f}ms)")
+    print(f"동시 요청 (중앙값): {concurrent * 1000:.1f}ms  (기대값 ≈ 최대 {max(WEATHER_LATENCY, AIR_LATENCY) * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+## 전체 발송 경로 부하 테스트
+# 로컬 OpenWeatherMap 서버와 SMTP 수신 서버를 별도 프로세스로 띄우고 실제 작업 코드(main)를 실행하여
+# 처리량, 단계별 지연 시간 백분위(p50/p95/p99), 최대 RSS 를 측정합니다.
+# 실행 방법 (app 디렉토리에서):
+#   python -m benchmarks.load_test --locations 10000 --recipients 100000
+#   python -m benchmarks.load_test --mode broadcast --locations 200 --recipients 20 --individual
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import psutil
+
+
+# 대역 서버 프로세스 본체 (OpenWeatherMap + SMTP)
+def _serve_stand_ins(conn, owm_latency: float, owm_error_rate: float, smtp_latency: float, smtp_reject_rate: float):
+    from benchmarks.owm_server import OWMServer
+    from benchmarks.smtp_sink import SMTPSink
+
+    owm = OWMServer(latency=owm_latency, error_rate=owm_error_rate).start()
+    sink = SMTPSink(latency=smtp_latency, reject_rate=smtp_reject_rate).start()
+    conn.send((owm.base_url, sink.host, sink.port))
+
+    conn.recv()                                     # 종료 신호 대기
+    stats = {
+        "owm_requests": owm.requests,
+        "owm_errors": owm.errors,
+        "owm_bytes": owm.bytes_sent,
+        "smtp_connections": sink.connections,
+        "smtp_messages": sink.messages,
+        "smtp_recipients": sink.recipients,
+        "smtp_rejected": sink.rejected,
+        "smtp_bytes": sink.bytes_received,
+    }
+    owm.stop()
+    sink.stop()
+    conn.send(stats)
+
+
+# 대역 서버 프로세스 관리 클래스
+class StandIns:
+    """
+    측정 대상 프로세스와 CPU(GIL)를 나눠 쓰지 않도록 대역 서버를 별도 프로세스에서 실행합니다.
+    """
+
+    def __init__(self, owm_latency: float, owm_error_rate: float, smtp_latency: float, smtp_reject_rate: float):
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve_stand_ins,
+            args=(child_conn, owm_latency, owm_error_rate, smtp_latency, smtp_reject_rate),
+            daemon=True
+        )
+
+    # 서버 시작 - (OpenWeatherMap 주소, SMTP 호스트, SMTP 포트) 반환
+    def start(self) -> Tuple[str, str, int]:
+        self._process.start()
+        return self._conn.recv()
+
+    # 서버 종료 - 서버 측 통계 반환
+    def stop(self) -> Dict[str, int]:
+        self._conn.send("stop")
+        stats = self._conn.recv()
+        self._process.join(timeout=5)
+        return stats
+
+
+# 단계별 소요 시간 기록 클래스
+class StageRecorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, stage: str, seconds: float):
+        self.samples[stage].append(seconds)
+
+    # 일반 함수 측정 래퍼
+    def wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+        return wrapper
+
+    # 코루틴 함수 측정 래퍼
+    def wrap_async(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+        return wrapper
+
+    # 백분위 계산
+    @staticmethod
+    def percentile(values: List[float], p: float) -> float:
+        return values[min(len(values) - 1, int(p * len(values)))] if values else 0.0
+
+    # 단계별 요약 출력
+    def print_report(self):
+        print(f"{'단계':<22} {'횟수':>8} {'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}")
+        for stage, values in self.samples.items():
+            values = sorted(values)
+            print(
+                f"{stage:<22} {len(values):8d} "
+                f"{self.percentile(values, 0.50) * 1000:8.1f}ms {self.percentile(values, 0.95) * 1000:8.1f}ms "
+                f"{self.percentile(values, 0.99) * 1000:8.1f}ms {values[-1] * 1000:8.1f}ms"
+            )
+
+
+# 최대 RSS 측정 클래스
+class RSSSampler:
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def start(self) -> "RSSSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+        return self.peak
+
+
+# 실제 작업 코드를 대역 서버로 향하게 하는 환경 변수 설정 (앱 모듈을 가져오기 전에 호출)
+def configure_environment(args, owm_url: str, smtp_host: str, smtp_port: int, recipients: List[str]):
+    os.environ.update({
+        "OWM_API_KEY": "load-test",
+        "OWM_ENDPOINT": f"{owm_url}/onecall",
+        "AIR_POLLUTION_ENDPOINT": f"{owm_url}/air_pollution",
+        "SMTP_HOST": smtp_host,
+        "SMTP_PORT": str(smtp_port),
+        "SMTP_USER": "",
+        "SMTP_FROM": "weather@example.com",
+        "RECIPIENT": "",
+        "BCC_RECIPIENTS": ",".join(recipients) if args.mode == "broadcast" else "",
+        "INDIVIDUAL_DELIVERY": "true" if args.individual else "false",
+        "DELIVERY_WORKERS": str(args.workers),
+        "DELIVERY_RATE_PER_SEC": "0",
+        "WEATHER_LOCATIONS": "",
+        "SUBSCRIBERS": "",
+        "FORECAST_CACHE_FILE": "",
+        "FORECAST_HISTORY_DB": "",
+        "CHANGE_STATE_FILE": "",
+        "OWM_QUOTA_FILE": "",
+    })
+    # main 모듈의 파일 로그 설정보다 먼저 설정하여 로그 파일을 만들지 않음
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+
+
+# 측정 래퍼 설치
+def instrument(main, stages: StageRecorder):
+    from services import delivery_service, email_service, weather_service
+
+    main.fetch_weather_bundle = stages.wrap_async("fetch", main.fetch_weather_bundle)
+    weather_service.fetch_weather_bundle = stages.wrap_async("fetch", weather_service.fetch_weather_bundle)
+    email_service.create_forecast_email = stages.wrap("render", email_service.create_forecast_email)
+    email_service.EncodedMessage = stages.wrap("encode", email_service.EncodedMessage)
+    main.deliver_to_recipients = stages.wrap("deliver_batch", main.deliver_to_recipients)
+    main.send_email = stages.wrap("deliver_batch", main.send_email)
+
+    # 메시지별 SMTP 전송 시간은 개별 전송 결과에서 기록
+    original_deliver = delivery_service.DeliveryPipeline.deliver
+
+    def deliver(self, subject, body, recipients, message=None):
+        results = original_deliver(self, subject, body, recipients, message)
+        for result in results:
+            stages.record("smtp_send", result.latency)
+        return results
+
+    delivery_service.DeliveryPipeline.deliver = deliver
+
+
+# 구독자 모드 - 지역별 구독자 배치를 같은 시각에 한꺼번에 처리 (SendTimeQueue 와 같은 방식)
+async def run_subscribers(main, locations, recipients: List[str], stages: StageRecorder):
+    batches: Dict[str, List[str]] = defaultdict(list)
+    for index, recipient in enumerate(recipients):
+        batches[locations[index % len(locations)].name].append(recipient)
+
+    scheduled = datetime.now(timezone.utc)
+
+    async def run_batch(location_name: str, members: List[str]):
+        start = time.perf_counter()
+        await main.send_subscriber_batch(scheduled, location_name, members)
+        stages.record("location_total", time.perf_counter() - start)
+
+    await asyncio.gather(*(run_batch(name, members) for name, members in batches.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 발송 경로 부하 테스트")
+    parser.add_argument("--mode", choices=("subscribers", "broadcast"), default="subscribers",
+                        help="subscribers: 구독자를 지역별로 나눠 배치 전송 / broadcast: 기존 작업(job)으로 지역마다 전체 수신자에게 전송")
+    parser.add_argument("--locations", type=int, default=10000, help="지역 수")
+    parser.add_argument("--recipients", type=int, default=100000, help="수신자 수 (broadcast 모드에서는 지역마다 전체 수신자에게 전송)")
+    parser.add_argument("--individual", action="store_true", help="broadcast 모드에서 수신자별 개별 전송 사용")
+    parser.add_argument("--workers", type=int, default=8, help="SMTP 전송 작업자 수")
+    parser.add_argument("--owm-latency", type=float, default=0.05, help="날씨 API 응답 지연 (초)")
+    parser.add_argument("--owm-error-rate", type=float, default=0.0, help="날씨 API 오류 비율 (0~1)")
+    parser.add_argument("--smtp-latency", type=float, default=0.002, help="메시지당 SMTP 응답 지연 (초)")
+    parser.add_argument("--smtp-reject-rate", type=float, default=0.0, help="수신자 거부 비율 (0~1)")
+    args = parser.parse_args()
+
+    stand_ins = StandIns(args.owm_latency, args.owm_error_rate, args.smtp_latency, args.smtp_reject_rate)
+    owm_url, smtp_host, smtp_port = stand_ins.start()
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+    configure_environment(args, owm_url, smtp_host, smtp_port, recipients)
+
+    # 환경 변수 설정 후에 앱 모듈 로드
+    import main as app_main
+    from config import locations as location_registry
+
+    location_registry._registry.clear()
+    locations = [
+        location_registry.register_location(f"지역{i}", 33.0 + (i % 100) * 0.05, 124.0 + (i // 100) * 0.05)
+        for i in range(args.locations)
+    ]
+
+    stages = StageRecorder()
+    instrument(app_main, stages)
+    sampler = RSSSampler().start()
+
+    start = time.perf_counter()
+    try:
+        if args.mode == "subscribers":
+            asyncio.run(run_subscribers(app_main, locations, recipients, stages))
+        else:
+            asyncio.run(stages.wrap_async("job_total", app_main.job)())
+        elapsed = time.perf_counter() - start
+    finally:
+        peak_rss = sampler.stop()
+        app_main.close_http_client()
+        app_main.smtp_sessions.close()
+        app_main.close_delivery_pipeline()
+        server_stats = stand_ins.stop()
+
+    print(
+        f"모드 {args.mode} | 지역 {args.locations}개, 수신자 {args.recipients}명 | "
+        f"API 지연 {args.owm_latency * 1000:.0f}ms (오류 {args.owm_error_rate:.0%}), "
+        f"SMTP 지연 {args.smtp_latency * 1000:.0f}ms (거부 {args.smtp_reject_rate:.0%})"
+    )
+    print(f"전체 소요 시간: {elapsed:.2f}초")
+    print(f"처리량: 지역 {args.locations / elapsed:.1f}개/초, 메시지 {server_stats['smtp_messages'] / elapsed:.1f}건/초")
+    print(f"최대 RSS: {peak_rss / 1024 / 1024:.1f}MB")
+    print(
+        f"API 요청 {server_stats['owm_requests']}건 (오류 {server_stats['owm_errors']}건) | "
+        f"SMTP 연결 {server_stats['smtp_connections']}개, 메시지 {server_stats['smtp_messages']}건, "
+        f"수신자 {server_stats['smtp_recipients']}명 (거부 {server_stats['smtp_rejected']}명), "
+        f"{server_stats['smtp_bytes'] / 1024 / 1024:.1f}MB"
+    )
+    print()
+    stages.print_report()
+
+
+if __name__ == "__main__":
+    main()
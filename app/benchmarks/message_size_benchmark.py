@@ -0,0 +1,123 @@
+## 이메일 크기 벤치마크 (기본 HTML vs 압축 HTML)
+# 실행 방법 (app 디렉토리에서): python -m benchmarks.message_size_benchmark
+# 압축 결과의 보이는 내용(태그 구조, 적용 스타일, 텍스트)이 원본과 다르면 종료 코드 1 로 끝남
+import re
+import sys
+from html.parser import HTMLParser
+from typing import Dict, List, Tuple
+
+from benchmarks.payloads import FIXTURE_KINDS, load_fixture
+from services.email_service import build_message, create_email_content
+from utils.html_compact import compact_html, html_to_text
+
+# 클래스 규칙 (".s0{padding:8px}")
+_CLASS_RULE = re.compile(r"\.([\w-]+)\{([^}]*)\}")
+
+
+# 스타일 선언을 비교 가능한 형태로 변환 ("padding: 8px; border: 1px" -> (("padding", "8px"), ("border", "1px")))
+def _declarations(style: str) -> Tuple[Tuple[str, str], ...]:
+    pairs = []
+    for declaration in style.split(";"):
+        if declaration.strip():
+            name, _, value = declaration.partition(":")
+            pairs.append((name.strip(), " ".join(value.split())))
+    return tuple(pairs)
+
+
+# 보이는 내용 추출기 - 태그, 적용되는 스타일(클래스 규칙 포함), 공백을 정리한 텍스트
+class _RenderedContent(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.items: List[Tuple] = []
+        self.rules: Dict[str, str] = {}
+        self._in_style = False
+        self._text: List[str] = []
+
+    def _flush(self):
+        text = " ".join("".join(self._text).split())
+        if text:
+            self.items.append(("text", text))
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "style":
+            self._in_style = True
+            return
+        if tag == "head":
+            return
+        self._flush()
+        attrs = dict(attrs)
+        style = attrs.pop("style", "") or ""
+        for name in (attrs.pop("class", "") or "").split():
+            style = f"{self.rules[name]};{style}"
+        self.items.append(("start", tag, tuple(sorted(attrs.items())), _declarations(style)))
+
+    def handle_endtag(self, tag):
+        if tag == "style":
+            self._in_style = False
+            return
+        if tag == "head":
+            return
+        self._flush()
+        self.items.append(("end", tag))
+
+    def handle_data(self, data):
+        if self._in_style:
+            self.rules.update(_CLASS_RULE.findall(data))
+        else:
+            self._text.append(data)
+
+
+def rendered_content(html: str) -> List[Tuple]:
+    parser = _RenderedContent()
+    parser.feed(html)
+    parser.close()
+    parser._flush()
+    return parser.items
+
+
+# MIME 인코딩 후 메시지 크기
+def message_size(subject: str, body: str, text_alternative: bool = False) -> int:
+    text_body = html_to_text(body) if text_alternative else None
+    return len(build_message(subject, body, ["someone@example.com"], text_body).as_bytes())
+
+
+def main() -> int:
+    print(f"{'예보':<8}{'본문':>10}{'압축':>10}{'압축+스타일':>12}{'메시지':>10}{'압축 메시지':>12}{'+텍스트':>10}  내용")
+
+    failures = 0
+    totals = [0] * 6
+    for kind in FIXTURE_KINDS:
+        weather_data, air_quality_data = load_fixture(kind)
+        content = create_email_content(weather_data, air_quality_data, "서울")
+        subject, body = content["subject"], content["body"]
+        minified = compact_html(body, shared_styles=False)
+        compact = compact_html(body)
+
+        same = rendered_content(body) == rendered_content(minified) == rendered_content(compact)
+        failures += not same
+
+        sizes = [
+            len(body.encode("utf-8")),
+            len(minified.encode("utf-8")),
+            len(compact.encode("utf-8")),
+            message_size(subject, body),
+            message_size(subject, compact),
+            message_size(subject, compact, text_alternative=True),
+        ]
+        totals = [total + size for total, size in zip(totals, sizes)]
+        print(f"{kind:<8}" + "".join(f"{size:>10,d}  " if i in (2, 4) else f"{size:>10,d}" for i, size in enumerate(sizes))
+              + f"  {'같음' if same else '다름'}")
+
+    count = len(FIXTURE_KINDS)
+    print(f"{'평균':<8}" + "".join(f"{total // count:>10,d}  " if i in (2, 4) else f"{total // count:>10,d}" for i, total in enumerate(totals)))
+    print(f"메시지 크기 감소: {(1 - totals[4] / totals[3]) * 100:.1f}% (텍스트 대체 본문 포함 시 {(1 - totals[5] / totals[3]) * 100:.1f}%)")
+
+    if failures:
+        print(f"압축 후 보이는 내용이 달라진 예보: {failures}개")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
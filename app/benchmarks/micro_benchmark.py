@@ -0,0 +1,212 @@
+## 헬퍼 및 이메일 렌더링 마이크로 벤치마크
+# 기록된 응답(fixtures/*.json)으로 함수별 초당 처리 횟수와 메모리 할당량을 측정하고 기준값과 비교합니다.
+# 실행 방법 (app 디렉토리에서):
+#   python -m benchmarks.micro_benchmark                  # 측정 후 기준값과 비교 (성능 저하 시 종료 코드 1)
+#   python -m benchmarks.micro_benchmark --save-baseline  # 측정 결과를 기준값으로 저장
+import argparse
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from statistics import median
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.payloads import FIXTURE_KINDS, load_fixture
+from services.email_service import (
+    check_precipitation_forecast, create_email_content, generate_hourly_forecast_html, get_overall_weather
+)
+from utils.helpers import analyze_humidity, get_weather_condition
+
+# 벤치마크 설정
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.20        # 허용 성능 저하 비율 (20%)
+REPEAT = 9                      # 반복 측정 횟수 (가장 빠른 값 사용)
+MIN_TIME = 0.05                 # 한 번 측정할 때의 최소 실행 시간 (초)
+LEAK_CALLS = 200                # 남은 메모리 블록 수를 측정할 호출 횟수
+CONFIRM_ROUNDS = 2              # 성능 저하로 보이는 항목을 다시 측정할 횟수 (일시적인 부하 제외)
+CALIBRATION_KEY = "_calibration"
+
+
+# 기준 작업 - 실행 환경의 속도 차이를 보정하기 위해 함께 측정
+def _calibration_workload() -> str:
+    total = 0
+    for i in range(200):
+        total += i * i % 7
+    return str(total)
+
+
+# 측정 대상 함수 목록 생성 (이름 -> 인자 없이 호출할 함수)
+def build_cases() -> Dict[str, Callable[[], Any]]:
+    cases: Dict[str, Callable[[], Any]] = {}
+
+    for kind in FIXTURE_KINDS:
+        weather_data, air_quality_data = load_fixture(kind)
+        hourly = weather_data.get("hourly", [])[:15]
+        timezone_offset = weather_data.get("timezone_offset")
+        codes = [hour["weather"][0]["id"] for hour in hourly] or [800]
+
+        def weather_conditions(codes=codes):
+            for code in codes:
+                get_weather_condition(code)
+
+        cases[f"get_weather_condition[{kind}]"] = weather_conditions
+        cases[f"analyze_humidity[{kind}]"] = lambda hourly=hourly: analyze_humidity(hourly)
+        cases[f"get_overall_weather[{kind}]"] = lambda hourly=hourly: get_overall_weather(hourly)
+        cases[f"check_precipitation_forecast[{kind}]"] = lambda hourly=hourly: check_precipitation_forecast(hourly)
+        cases[f"generate_hourly_forecast_html[{kind}]"] = (
+            lambda hourly=hourly, offset=timezone_offset: generate_hourly_forecast_html(hourly, offset)
+        )
+        cases[f"create_email_content[{kind}]"] = (
+            lambda weather_data=weather_data, air_quality_data=air_quality_data:
+                create_email_content(weather_data, air_quality_data)
+        )
+
+    return cases
+
+
+# 초당 처리 횟수 측정
+def measure_speed(func: Callable[[], Any]) -> float:
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(number, int(number * MIN_TIME / elapsed)) if elapsed else number
+    best = min(timer.repeat(repeat=REPEAT, number=number))
+    return number / best
+
+
+# 한 번 호출할 때의 메모리 할당량 측정
+def measure_allocations(func: Callable[[], Any]) -> Tuple[int, float]:
+    """
+    한 번 호출하는 동안 최대로 할당된 바이트 수와, 호출 후에도 해제되지 않고 남는 호출당 메모리 블록 수를 반환합니다.
+    """
+    func()                                      # 캐시 등 최초 호출 비용 제외
+    gc.collect()
+    tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    del result
+
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    for _ in range(LEAK_CALLS):
+        func()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # 스냅샷 자체의 할당을 제외하기 위해 tracemalloc 모듈의 할당은 무시
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    retained = sum(
+        stat.count_diff
+        for stat in after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    )
+    return peak - base, retained / LEAK_CALLS
+
+
+# 전체 측정
+def run_benchmarks() -> Dict[str, Dict[str, float]]:
+    results = {}
+    calibration = []
+    for name, func in build_cases().items():
+        calibration.append(measure_speed(_calibration_workload))
+        peak_bytes, retained_blocks = measure_allocations(func)
+        results[name] = {
+            "ops_per_sec": measure_speed(func),
+            "peak_bytes": peak_bytes,
+            "retained_blocks": retained_blocks,
+        }
+    results[CALIBRATION_KEY] = {"ops_per_sec": median(calibration)}
+    return results
+
+
+# 기준값과 비교하여 성능 저하 항목 반환
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float
+) -> List[str]:
+    # 기준값을 저장한 환경과 현재 환경의 속도 차이 보정
+    speed_ratio = 1.0
+    if CALIBRATION_KEY in results and CALIBRATION_KEY in baseline:
+        speed_ratio = results[CALIBRATION_KEY]["ops_per_sec"] / baseline[CALIBRATION_KEY]["ops_per_sec"]
+
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or name == CALIBRATION_KEY:
+            continue
+
+        if current["ops_per_sec"] < previous["ops_per_sec"] * speed_ratio * (1 - threshold):
+            regressions.append(
+                f"{name}: ops/sec {previous['ops_per_sec']:.0f} -> {current['ops_per_sec']:.0f}"
+            )
+        if current["peak_bytes"] > previous["peak_bytes"] * (1 + threshold) + 1024:
+            regressions.append(
+                f"{name}: peak bytes {previous['peak_bytes']:.0f} -> {current['peak_bytes']:.0f}"
+            )
+        if current["retained_blocks"] >= previous["retained_blocks"] + 1:
+            regressions.append(
+                f"{name}: retained blocks/call {previous['retained_blocks']:.2f} -> {current['retained_blocks']:.2f}"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="헬퍼 및 이메일 렌더링 마이크로 벤치마크")
+    parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="기준값 파일 경로")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="허용 성능 저하 비율 (기본값 0.2)")
+    args = parser.parse_args()
+
+    results = run_benchmarks()
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    # 처리 속도가 떨어진 것으로 보이는 항목은 다시 측정하여 가장 좋은 값 사용
+    if baseline and not args.save_baseline:
+        cases = build_cases()
+        for _ in range(CONFIRM_ROUNDS):
+            suspects = {line.split(":")[0] for line in find_regressions(results, baseline, args.threshold)}
+            for name in suspects & cases.keys():
+                results[name]["ops_per_sec"] = max(results[name]["ops_per_sec"], measure_speed(cases[name]))
+
+    print(f"{'benchmark':<42} {'ops/sec':>12} {'기준 대비':>9} {'peak bytes':>11} {'retained':>9}")
+    for name, current in results.items():
+        if name == CALIBRATION_KEY:
+            continue
+        previous = baseline.get(name)
+        change = f"{current['ops_per_sec'] / previous['ops_per_sec'] - 1:+.1%}" if previous else "-"
+        print(
+            f"{name:<42} {current['ops_per_sec']:12.0f} {change:>9} "
+            f"{current['peak_bytes']:11.0f} {current['retained_blocks']:9.2f}"
+        )
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print("\n기준값이 없습니다. --save-baseline 으로 먼저 저장하세요.")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n성능 저하 ({args.threshold:.0%} 초과):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"\n성능 저하 없음 (허용 범위 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
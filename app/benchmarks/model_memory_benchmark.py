@@ -0,0 +1,50 @@
+## 지역당 예보 메모리 사용량 벤치마크
+# 원본 JSON(dict)과 파싱된 Forecast 모델을 많은 지역만큼 보관할 때의 메모리를 비교합니다.
+# 실행 방법 (app 디렉토리에서): python -m benchmarks.model_memory_benchmark
+import gc
+import json
+import tracemalloc
+
+from benchmarks.payloads import WEATHER_KINDS, make_air_pollution, make_onecall
+from services.forecast_model import parse_air_quality, parse_onecall
+
+# 벤치마크 설정
+LOCATION_COUNT = 1000
+
+
+# 보관된 객체들이 차지하는 메모리 측정
+def measure(build) -> float:
+    """
+    build() 가 반환한 객체를 보관한 상태에서 늘어난 메모리를 지역당 바이트로 반환합니다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    kept = build()
+    gc.collect()
+    current = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    grown = sum(stat.size_diff for stat in current.compare_to(baseline, "filename"))
+    del kept
+    return grown / LOCATION_COUNT
+
+
+def main():
+    kinds = list(WEATHER_KINDS)
+    # 실제 응답처럼 JSON 문자열에서 파싱한 객체를 사용 (문자열 공유 등 생성 방식의 영향 제거)
+    raw_weather = [json.dumps(make_onecall(kinds[i % len(kinds)], seed=i)) for i in range(LOCATION_COUNT)]
+    raw_air = [json.dumps(make_air_pollution(i % 5 + 1)) for i in range(LOCATION_COUNT)]
+
+    raw_bytes = measure(lambda: [(json.loads(w), json.loads(a)) for w, a in zip(raw_weather, raw_air)])
+    model_bytes = measure(lambda: [
+        (parse_onecall(json.loads(w)), parse_air_quality(json.loads(a))) for w, a in zip(raw_weather, raw_air)
+    ])
+
+    print(f"지역 {LOCATION_COUNT}개 보관 시 지역당 메모리")
+    print(f"원본 JSON (dict):   {raw_bytes:10.0f} bytes")
+    print(f"Forecast 모델:      {model_bytes:10.0f} bytes  ({raw_bytes / model_bytes:.0f}배 감소)")
+
+
+if __name__ == "__main__":
+    main()
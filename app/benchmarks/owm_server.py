@@ -0,0 +1,120 @@
+## 벤치마크용 로컬 OpenWeatherMap 서버
+# One Call / Air Pollution 요청에 payloads 모듈로 만든 응답을 돌려줍니다.
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.payloads import WEATHER_KINDS, make_air_pollution, make_onecall
+
+# 미리 만들어 둘 응답 종류 수 (좌표별로 골라서 사용)
+PAYLOAD_VARIANTS = 64
+
+
+# OpenWeatherMap 서버 클래스
+class OWMServer:
+    """
+    /onecall 과 /air_pollution 만 처리하는 로컬 HTTP 서버입니다 (keep-alive 지원).
+    응답은 시작할 때 미리 직렬화해 두고 좌표에 따라 고르므로 서버 자체의 CPU 사용량이 작습니다.
+    요청마다 지연 시간과 오류 비율을 설정할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Args:
+            latency: 응답 지연 시간 (초)
+            error_rate: 500 오류로 응답할 확률 (0~1)
+            host: 바인드 주소
+            port: 바인드 포트 (0 이면 임의 포트)
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._lock = threading.Lock()
+
+        start = int(time.time()) // 3600 * 3600
+        kinds = list(WEATHER_KINDS)
+        self._onecall: List[bytes] = [
+            json.dumps(make_onecall(kinds[i % len(kinds)], seed=i, start=start)).encode("utf-8")
+            for i in range(PAYLOAD_VARIANTS)
+        ]
+        self._air_pollution: List[bytes] = [
+            json.dumps(make_air_pollution(aqi, dt=start)).encode("utf-8") for aqi in range(1, 6)
+        ]
+
+    # 요청 처리 핸들러 생성
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"           # keep-alive 지원
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                key = hash((query.get("lat", [""])[0], query.get("lon", [""])[0]))
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if server.error_rate and random.random() < server.error_rate:
+                    status, body = 500, b'{"cod": 500, "message": "Internal error"}'
+                elif url.path.endswith("/onecall"):
+                    status, body = 200, server._onecall[key % len(server._onecall)]
+                elif url.path.endswith("/air_pollution"):
+                    status, body = 200, server._air_pollution[key % len(server._air_pollution)]
+                else:
+                    status, body = 404, b'{"cod": 404, "message": "Not found"}'
+
+                with server._lock:
+                    server.requests += 1
+                    server.bytes_sent += len(body)
+                    if status != 200:
+                        server.errors += 1
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass                                # 요청 로그 출력 생략
+
+        return Handler
+
+    # 서버 시작
+    def start(self) -> "OWMServer":
+        """
+        백그라운드 스레드에서 서버를 시작하고, 바인드된 포트를 self.port 에 기록합니다.
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        threading.Thread(target=self._server.serve_forever, name="owm-server", daemon=True).start()
+        return self
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    # 서버 종료
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,166 @@
+## 벤치마크용 OpenWeatherMap 응답 생성
+# 실제 One Call 3.0 / Air Pollution 응답과 같은 구조의 데이터를 만듭니다.
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 기록된 응답 파일 경로 및 종류
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE_KINDS = ("clear", "rain", "snow", "mixed", "empty")
+
+# 날씨 유형별로 사용할 날씨 코드
+WEATHER_KINDS = {
+    "clear": [800, 800, 800, 801],
+    "rain": [500, 501, 511, 521, 803],
+    "snow": [600, 601, 602, 804],
+    "mixed": [200, 501, 522, 600, 701, 800, 801, 804],
+}
+
+# 날씨 코드별 main 값
+_MAIN_BY_GROUP = {2: "Thunderstorm", 3: "Drizzle", 5: "Rain", 6: "Snow", 7: "Mist", 8: "Clouds"}
+
+
+# 날씨 코드로 weather 항목 생성
+def _weather_entry(weather_id: int) -> List[Dict[str, Any]]:
+    main = "Clear" if weather_id == 800 else _MAIN_BY_GROUP[weather_id // 100]
+    return [{"id": weather_id, "main": main, "description": main.lower(), "icon": "01d"}]
+
+
+# One Call 응답 생성 함수
+def make_onecall(
+    kind: str = "mixed",
+    seed: int = 0,
+    lat: float = 37.541,
+    lon: float = 126.986,
+    start: Optional[int] = None,
+    timezone_offset: int = 32400
+) -> Dict[str, Any]:
+    """
+    One Call 3.0 응답과 같은 구조(current, hourly 48개, daily 8개, alerts)의 데이터를 생성합니다.
+
+    Args:
+        kind: 날씨 유형 ("clear", "rain", "snow", "mixed", "empty")
+        seed: 난수 시드 (같은 시드는 같은 데이터를 생성)
+        lat: 위도
+        lon: 경도
+        start: 첫 시간의 Unix 시간 (기본값: 현재 시각을 정시로 내림)
+        timezone_offset: UTC 기준 시차 (초)
+
+    Returns:
+        Dict[str, Any]: One Call 응답
+    """
+    if kind == "empty":
+        return {}
+
+    rng = random.Random(seed)
+    codes = WEATHER_KINDS[kind]
+    start = start if start is not None else int(time.time()) // 3600 * 3600
+    base_temp = {"clear": 24.0, "rain": 17.0, "snow": -4.0, "mixed": 9.0}[kind]
+
+    def hour_entry(index: int) -> Dict[str, Any]:
+        temp = base_temp + 5 * rng.random() - 2.5
+        return {
+            "dt": start + index * 3600,
+            "temp": round(temp, 2),
+            "feels_like": round(temp - 1.2, 2),
+            "pressure": 1013 + rng.randint(-8, 8),
+            "humidity": rng.randint(25, 95),
+            "dew_point": round(temp - 6.0, 2),
+            "uvi": round(rng.random() * 7, 2),
+            "clouds": rng.randint(0, 100),
+            "visibility": 10000,
+            "wind_speed": round(rng.random() * 8, 2),
+            "wind_deg": rng.randint(0, 359),
+            "wind_gust": round(rng.random() * 12, 2),
+            "weather": _weather_entry(rng.choice(codes)),
+            "pop": round(rng.random(), 2),
+        }
+
+    hourly = [hour_entry(index) for index in range(48)]
+    daily = []
+    for day in range(8):
+        temp_min = base_temp - 4 - rng.random() * 3
+        temp_max = base_temp + 4 + rng.random() * 3
+        daily.append({
+            "dt": start + day * 86400,
+            "sunrise": start + day * 86400 - 3 * 3600,
+            "sunset": start + day * 86400 + 9 * 3600,
+            "summary": "There will be weather today",
+            "temp": {
+                "day": round(base_temp, 2), "min": round(temp_min, 2), "max": round(temp_max, 2),
+                "night": round(temp_min + 1, 2), "eve": round(base_temp, 2), "morn": round(temp_min + 2, 2)
+            },
+            "feels_like": {"day": round(base_temp - 1, 2), "night": round(temp_min, 2), "eve": base_temp, "morn": temp_min},
+            "pressure": 1012,
+            "humidity": rng.randint(30, 90),
+            "dew_point": round(base_temp - 6, 2),
+            "wind_speed": round(rng.random() * 8, 2),
+            "wind_deg": rng.randint(0, 359),
+            "weather": _weather_entry(rng.choice(codes)),
+            "clouds": rng.randint(0, 100),
+            "pop": round(rng.random(), 2),
+            "uvi": round(rng.random() * 8, 2),
+        })
+
+    return {
+        "lat": lat,
+        "lon": lon,
+        "timezone": "Asia/Seoul",
+        "timezone_offset": timezone_offset,
+        "current": dict(hourly[0], sunrise=start - 3 * 3600, sunset=start + 9 * 3600),
+        "hourly": hourly,
+        "daily": daily,
+        "alerts": [{
+            "sender_name": "KMA",
+            "event": "Advisory",
+            "start": start,
+            "end": start + 6 * 3600,
+            "description": "Synthetic alert for benchmarking",
+            "tags": ["Other"]
+        }] if kind == "mixed" else [],
+    }
+
+
+# Air Pollution 응답 생성 함수
+def make_air_pollution(aqi: int = 2, lat: float = 37.541, lon: float = 126.986, dt: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Air Pollution 응답과 같은 구조의 데이터를 생성합니다.
+
+    Args:
+        aqi: 대기 질 지수 (1-5)
+        lat: 위도
+        lon: 경도
+        dt: 측정 시각 (Unix 시간)
+
+    Returns:
+        Dict[str, Any]: Air Pollution 응답
+    """
+    return {
+        "coord": {"lon": lon, "lat": lat},
+        "list": [{
+            "main": {"aqi": aqi},
+            "components": {
+                "co": 230.31, "no": 0.0, "no2": 12.85, "o3": 68.66,
+                "so2": 3.4, "pm2_5": 8.5 * aqi, "pm10": 12.1 * aqi, "nh3": 1.2
+            },
+            "dt": dt if dt is not None else int(time.time())
+        }]
+    }
+
+
+# 기록된 응답 로드 함수
+def load_fixture(kind: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    fixtures/<kind>.json 에 기록된 One Call / Air Pollution 응답을 읽어옵니다.
+
+    Args:
+        kind: 응답 종류 ("clear", "rain", "snow", "mixed", "empty")
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: (One Call 응답, Air Pollution 응답)
+    """
+    with open(os.path.join(FIXTURE_DIR, f"{kind}.json"), encoding="utf-8") as f:
+        fixture = json.load(f)
+    return fixture["onecall"], fixture["air_pollution"]
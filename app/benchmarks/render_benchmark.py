@@ -0,0 +1,103 @@
+## 이메일 렌더링 처리량 벤치마크
+# 실행 방법 (app 디렉토리에서): python -m benchmarks.render_benchmark
+import asyncio
+import os
+import time
+
+from benchmarks.payloads import WEATHER_KINDS, make_air_pollution, make_onecall
+from services.email_service import create_email_content, create_forecast_email, generate_hourly_forecast_html
+from services.forecast_model import parse_air_quality, parse_onecall
+from services.email_service import cohort_messages
+from services.render_pool import RenderPool, render_chunk
+from config.locations import Location
+
+# 벤치마크 설정
+LOCATION_COUNT = 200            # 서로 다른 지역(입력 데이터) 수
+ROUNDS = 20
+
+# 프로세스 풀 렌더링 설정
+POOL_LOCATION_COUNT = 2000      # 프로세스 풀로 렌더링할 지역 수
+PROCESS_COUNTS = sorted({1, 2, 4, os.cpu_count() or 1})
+CHUNK_SIZES = [8, 32, 128]
+
+
+# 초당 처리 횟수 측정
+def measure(func, inputs) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for args in inputs:
+            func(*args)
+        best = min(best, time.perf_counter() - start)
+    return len(inputs) / best
+
+
+# 프로세스 풀 렌더링 처리량 측정 (렌더링 + MIME 인코딩, 초당 지역 수)
+def measure_pool(processes: int, chunk_size: int, parsed_inputs) -> float:
+    locations = [Location(name, 0.0, 0.0) for _, _, name in parsed_inputs]
+
+    async def forecasts():
+        for location, (forecast, aqi, _) in zip(locations, parsed_inputs):
+            yield location, forecast, aqi
+
+    async def run(pool: RenderPool) -> int:
+        count = 0
+        async for _ in pool.render(forecasts()):
+            count += 1
+        return count
+
+    pool = RenderPool(processes, chunk_size)
+    try:
+        asyncio.run(run(pool))                              # 작업자 시작 및 import 비용 제외
+        cohort_messages.clear()
+        start = time.perf_counter()
+        count = asyncio.run(run(pool))
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.close()
+        cohort_messages.clear()
+    return count / elapsed
+
+
+def main():
+    kinds = list(WEATHER_KINDS)
+    inputs = [
+        (make_onecall(kinds[i % len(kinds)], seed=i), make_air_pollution(i % 5 + 1), f"지역{i}")
+        for i in range(LOCATION_COUNT)
+    ]
+    parsed_inputs = [
+        (parse_onecall(weather_data), parse_air_quality(air_quality_data), name)
+        for weather_data, air_quality_data, name in inputs
+    ]
+    hourly_inputs = [(weather_data["hourly"][:15],) for weather_data, _, _ in inputs]
+
+    emails_per_sec = measure(create_email_content, inputs)
+    parsed_emails_per_sec = measure(create_forecast_email, parsed_inputs)
+    tables_per_sec = measure(generate_hourly_forecast_html, hourly_inputs)
+    body_size = sum(len(create_email_content(*args)["body"].encode("utf-8")) for args in inputs) / len(inputs)
+
+    print(f"create_email_content: {emails_per_sec:10.1f} emails/sec")
+    print(f"create_forecast_email (파싱된 예보): {parsed_emails_per_sec:10.1f} emails/sec")
+    print(f"generate_hourly_forecast_html: {tables_per_sec:10.1f} tables/sec")
+    print(f"평균 본문 크기: {body_size:.0f} bytes")
+
+    # 프로세스 풀 렌더링 - 작업자 수와 청크 크기별 처리량 (현재 프로세스에서 렌더링한 값과 비교)
+    pool_inputs = [parsed_inputs[i % len(parsed_inputs)] for i in range(POOL_LOCATION_COUNT)]
+    pool_inputs = [(forecast, aqi, f"지역{i}") for i, (forecast, aqi, _) in enumerate(pool_inputs)]
+    start = time.perf_counter()
+    render_chunk([(name, forecast, aqi) for forecast, aqi, name in pool_inputs])
+    inline_per_sec = len(pool_inputs) / (time.perf_counter() - start)
+
+    print(f"\n렌더링 + 인코딩 ({POOL_LOCATION_COUNT}개 지역, CPU {os.cpu_count()}개)")
+    print(f"현재 프로세스: {inline_per_sec:10.1f} emails/sec")
+    for processes in PROCESS_COUNTS:
+        for chunk_size in CHUNK_SIZES:
+            per_sec = measure_pool(processes, chunk_size, pool_inputs)
+            print(
+                f"프로세스 {processes:2d}개, 청크 {chunk_size:4d}: {per_sec:10.1f} emails/sec "
+                f"(x{per_sec / inline_per_sec:.2f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
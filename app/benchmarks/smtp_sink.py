@@ -0,0 +1,122 @@
+## 벤치마크용 로컬 SMTP 수신 서버
+# 메시지를 저장하지 않고 개수와 크기만 기록합니다.
+import asyncio
+import random
+import threading
+from typing import Optional
+
+
+# SMTP 수신 서버 클래스
+class SMTPSink:
+    """
+    EHLO/AUTH/MAIL/RCPT/DATA/RSET/QUIT 만 처리하는 최소한의 SMTP 서버입니다.
+    별도 스레드의 이벤트 루프에서 실행되며, 메시지마다 지연 시간과 거부 비율을 설정할 수 있습니다.
+    """
+
+    def __init__(self, latency: float = 0.0, reject_rate: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            latency: 메시지(DATA) 수신 후 응답까지의 지연 시간 (초)
+            reject_rate: RCPT 를 550 으로 거부할 확률 (0~1)
+            host: 바인드 주소
+            port: 바인드 포트 (0 이면 임의 포트)
+        """
+        self.latency = latency
+        self.reject_rate = reject_rate
+        self.host = host
+        self.port = port
+        self.connections = 0
+        self.messages = 0
+        self.recipients = 0
+        self.rejected = 0
+        self.bytes_received = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._lock = threading.Lock()
+
+    # 연결 처리
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        with self._lock:
+            self.connections += 1
+
+        async def reply(line: bytes):
+            writer.write(line)
+            await writer.drain()
+
+        await reply(b"220 sink ESMTP\r\n")
+        in_data = False
+        size = 0
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                if in_data:
+                    if line == b".\r\n":
+                        in_data = False
+                        if self.latency:
+                            await asyncio.sleep(self.latency)
+                        with self._lock:
+                            self.messages += 1
+                            self.bytes_received += size
+                        await reply(b"250 OK queued\r\n")
+                    else:
+                        size += len(line)
+                    continue
+
+                command = line.strip().upper()
+                if command.startswith(b"EHLO"):
+                    await reply(b"250-sink\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME\r\n")
+                elif command.startswith(b"AUTH"):
+                    await reply(b"235 Authentication successful\r\n")
+                elif command.startswith(b"RCPT"):
+                    if self.reject_rate and random.random() < self.reject_rate:
+                        with self._lock:
+                            self.rejected += 1
+                        await reply(b"550 No such user\r\n")
+                    else:
+                        with self._lock:
+                            self.recipients += 1
+                        await reply(b"250 OK\r\n")
+                elif command == b"DATA":
+                    in_data = True
+                    size = 0
+                    await reply(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                elif command == b"QUIT":
+                    await reply(b"221 Bye\r\n")
+                    break
+                else:
+                    await reply(b"250 OK\r\n")                  # HELO, MAIL, RSET, NOOP
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    # 서버 시작
+    def start(self) -> "SMTPSink":
+        """
+        백그라운드 스레드에서 서버를 시작하고, 바인드된 포트를 self.port 에 기록합니다.
+        """
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, limit=2 ** 20)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+
+        threading.Thread(target=run, name="smtp-sink", daemon=True).start()
+        ready.wait()
+        return self
+
+    # 서버 종료
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,144 @@
+## 즉시 1회 발송(--now) 시작 시간 벤치마크
+# 1) python -X importtime 으로 oneshot(빠른 경로)과 main(전체 경로)의 모듈 로드 시간을 측정하고,
+#    빠른 경로가 무거운 모듈(스케줄러, 메모리 관리, 프로세스 풀 등)을 가져오지 않는지 확인합니다.
+# 2) 로컬 OpenWeatherMap/SMTP 대역 서버를 띄우고 두 경로로 1회 발송 전체 시간(프로세스 시작~종료)을 비교합니다.
+# 실행 방법 (app 디렉토리에서): python -m benchmarks.startup_benchmark --budget-ms 300
+# 로드 시간이 예산을 넘거나 가져오지 않아야 할 모듈을 가져오면 종료 코드 1 로 끝남
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.load_test import StandIns
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# oneshot 모듈 로드 시간 예산 (ms)
+DEFAULT_BUDGET_MS = 300.0
+
+# 빠른 경로에서 가져오지 않아야 하는 모듈
+FORBIDDEN_MODULES = (
+    "psutil",
+    "multiprocessing",
+    "tracemalloc",
+    "utils.scheduler",
+    "utils.memory_governor",
+    "utils.logging_setup",
+    "services.render_pool",
+    "services.delivery_service",
+    "gzip",
+    "zoneinfo",
+    "sqlite3",
+    "services.forecast_history",
+)
+
+# 전체 경로 1회 발송 (스케줄러 실행 시와 같은 로그 설정 사용)
+FULL_PATH_SCRIPT = (
+    "import sys, main; from utils.logging_setup import setup_logging; "
+    "setup_logging(sys.argv[1]); main.run_now()"
+)
+
+
+# 모듈 로드 시간 측정 - (누적 로드 시간(ms), 가져온 모듈 목록)
+def import_profile(module: str) -> Tuple[float, List[str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    )
+    # 형식: "import time: self [us] | cumulative | imported package"
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative[module] / 1000, list(cumulative)
+
+
+# 1회 발송 프로세스 실행 시간 (초)
+def run_once(command: List[str], env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=APP_DIR, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} 실패 (종료 코드 {result.returncode}):\n{result.stderr[-2000:]}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="즉시 1회 발송 시작 시간 벤치마크")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="oneshot 모듈 로드 시간 예산 (ms)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--recipients", type=int, default=20, help="1회 발송 측정 시 수신자 수")
+    parser.add_argument("--skip-run", action="store_true", help="모듈 로드 시간만 측정")
+    args = parser.parse_args()
+
+    failures = 0
+
+    # 1) 모듈 로드 시간 (여러 번 측정한 최솟값)
+    print(f"{'모듈':<10}{'로드 시간':>12}{'모듈 수':>10}")
+    profiles = {}
+    for module in ("oneshot", "main"):
+        samples = [import_profile(module) for _ in range(args.repeat)]
+        profiles[module] = (min(ms for ms, _ in samples), samples[0][1])
+        print(f"{module:<10}{profiles[module][0]:>10.1f}ms{len(profiles[module][1]):>10,d}")
+
+    oneshot_ms, oneshot_modules = profiles["oneshot"]
+    if oneshot_ms > args.budget_ms:
+        print(f"oneshot 로드 시간이 예산을 넘었습니다: {oneshot_ms:.1f}ms > {args.budget_ms:.0f}ms")
+        failures += 1
+
+    imported = [name for name in FORBIDDEN_MODULES if name in oneshot_modules]
+    if imported:
+        print(f"oneshot 이 가져오지 않아야 할 모듈: {', '.join(imported)}")
+        failures += 1
+
+    # 2) 1회 발송 전체 시간 (중앙값)
+    if not args.skip_run:
+        stand_ins = StandIns(0.0, 0.0, 0.0, 0.0)
+        owm_url, smtp_host, smtp_port = stand_ins.start()
+        env = dict(
+            os.environ,
+            OWM_API_KEY="startup-benchmark",
+            OWM_ENDPOINT=f"{owm_url}/onecall",
+            AIR_POLLUTION_ENDPOINT=f"{owm_url}/air_pollution",
+            SMTP_HOST=smtp_host,
+            SMTP_PORT=str(smtp_port),
+            SMTP_USER="",
+            SMTP_FROM="weather@example.com",
+            RECIPIENT="",
+            BCC_RECIPIENTS=",".join(f"user{i}@example.com" for i in range(args.recipients)),
+            INDIVIDUAL_DELIVERY="false",
+            WEATHER_LOCATIONS="",
+            SUBSCRIBERS="",
+            FORECAST_CACHE_FILE="",
+            FORECAST_HISTORY_DB="",
+            CHANGE_STATE_FILE="",
+            OWM_QUOTA_FILE="",
+            METRICS_FILE="",
+        )
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                commands = {
+                    "oneshot": [sys.executable, "main.py", "--now"],
+                    "main": [sys.executable, "-c", FULL_PATH_SCRIPT, os.path.join(tmp_dir, "weather_service.log")],
+                }
+                timings = {name: [run_once(command, env) for _ in range(args.repeat)] for name, command in commands.items()}
+        finally:
+            stand_ins.stop()
+
+        print(f"\n{'1회 발송':<10}{'중앙값':>12}{'최솟값':>12}")
+        for name, samples in timings.items():
+            print(f"{name:<10}{statistics.median(samples) * 1000:>10.1f}ms{min(samples) * 1000:>10.1f}ms")
+        speedup = statistics.median(timings["main"]) / statistics.median(timings["oneshot"])
+        print(f"빠른 경로가 {speedup:.2f}배 빠름")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
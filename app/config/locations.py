@@ -0,0 +1,90 @@
+## 날씨 알림 대상 지역 목록
+from typing import Dict, List, NamedTuple, Optional
+
+from config.settings import SEOUL_LAT, SEOUL_LON, WEATHER_LOCATIONS_STR
+
+# 기본 지역 이름
+DEFAULT_LOCATION_NAME = "서울"
+
+
+# 지역 정보 - 이름과 좌표
+class Location(NamedTuple):
+    name: str       # 지역 이름 (이메일 본문에 표시)
+    lat: float      # 위도
+    lon: float      # 경도
+
+
+# 등록된 지역 (이름 -> 지역 정보)
+_registry: Dict[str, Location] = {}
+
+
+# 지역 등록 함수
+def register_location(name: str, lat: float, lon: float) -> Location:
+    """
+    지역을 등록합니다. 같은 이름이 이미 있으면 좌표를 갱신합니다.
+
+    Args:
+        name: 지역 이름
+        lat: 위도
+        lon: 경도
+
+    Returns:
+        Location: 등록된 지역 정보
+    """
+    location = Location(name, float(lat), float(lon))
+    _registry[name] = location
+    return location
+
+
+# 지역 조회 함수
+def get_location(name: str) -> Optional[Location]:
+    """
+    이름으로 등록된 지역을 조회합니다.
+
+    Args:
+        name: 지역 이름
+
+    Returns:
+        Optional[Location]: 지역 정보 (없으면 None)
+    """
+    return _registry.get(name)
+
+
+# 전체 지역 목록 반환 함수
+def get_locations() -> List[Location]:
+    """
+    등록된 모든 지역을 등록 순서대로 반환합니다.
+
+    Returns:
+        List[Location]: 지역 목록
+    """
+    return list(_registry.values())
+
+
+# 환경 변수 문자열 파싱 함수
+def parse_locations(locations_str: str) -> List[Location]:
+    """
+    "이름:위도:경도" 항목을 쉼표로 구분한 문자열을 지역 목록으로 변환합니다.
+    형식이 잘못된 항목은 무시합니다.
+
+    Args:
+        locations_str: 지역 설정 문자열
+
+    Returns:
+        List[Location]: 지역 목록
+    """
+    locations = []
+    for item in locations_str.split(","):
+        parts = [part.strip() for part in item.split(":")]
+        if len(parts) != 3 or not parts[0]:
+            continue
+        try:
+            locations.append(Location(parts[0], float(parts[1]), float(parts[2])))
+        except ValueError:
+            continue
+    return locations
+
+
+# 환경 변수에 지역이 설정되어 있으면 해당 지역을, 없으면 기본 지역(서울)을 등록
+for _location in parse_locations(WEATHER_LOCATIONS_STR) or [Location(DEFAULT_LOCATION_NAME, SEOUL_LAT, SEOUL_LON)]:
+    register_location(*_location)
@@ -13,18 +13,109 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")           # SMTP 비밀번호
 SMTP_FROM = os.getenv("SMTP_FROM")                   # 보내는 이메일 주소
 RECIPIENT = os.getenv("RECIPIENT")                   # 수신자 이메일 주소
 
+# SMTP 세션 재사용 설정
+SMTP_IDLE_TIMEOUT = float(os.getenv("SMTP_IDLE_TIMEOUT", "60"))                  # 유휴 연결 종료 시간 (초)
+SMTP_MAX_MESSAGES_PER_SESSION = int(os.getenv("SMTP_MAX_MESSAGES_PER_SESSION", "100"))  # 연결당 최대 메시지 수
+
+# 수신자별 개별 전송 설정 - 사용 시 수신자마다 별도의 메시지를 동시에 전송
+INDIVIDUAL_DELIVERY = os.getenv("INDIVIDUAL_DELIVERY", "false").lower() == "true"  # 개별 전송 사용 여부
+DELIVERY_WORKERS = int(os.getenv("DELIVERY_WORKERS", "4"))                       # 동시 전송 작업자 수 (= 최대 SMTP 연결 수)
+DELIVERY_RATE_PER_SEC = float(os.getenv("DELIVERY_RATE_PER_SEC", "10"))         # 초당 최대 전송 수 (0: 제한 없음)
+
+# 렌더링 설정 - 지역이 많을 때 여러 프로세스에서 이메일 렌더링
+RENDER_PROCESSES = int(os.getenv("RENDER_PROCESSES", "0"))                       # 렌더링 작업자 프로세스 수 (0: 현재 프로세스에서 렌더링)
+RENDER_CHUNK_SIZE = int(os.getenv("RENDER_CHUNK_SIZE", "32"))                    # 작업자에게 한 번에 보낼 지역 수
+
+# 이메일 크기 설정 - 압축 모드는 보이는 내용을 바꾸지 않고 들여쓰기 공백과 반복되는 인라인 스타일을 줄임
+EMAIL_COMPACT_HTML = os.getenv("EMAIL_COMPACT_HTML", "false").lower() == "true"          # HTML 압축 사용 여부
+EMAIL_SHARED_STYLES = os.getenv("EMAIL_SHARED_STYLES", "true").lower() == "true"        # 압축 시 반복 스타일을 <style> 블록으로 모을지 여부 (<style> 미지원 클라이언트가 많으면 false)
+EMAIL_TEXT_ALTERNATIVE = os.getenv("EMAIL_TEXT_ALTERNATIVE", "false").lower() == "true"  # text/plain 대체 본문 첨부 여부
+
 # BCC 수신자(추가 수신자) 처리 - 쉼표로 구분된 문자열을 리스트로 변환
 BCC_RECIPIENTS_STR = os.getenv("BCC_RECIPIENTS", "")
 BCC_RECIPIENTS = [email.strip() for email in BCC_RECIPIENTS_STR.split(",")] if BCC_RECIPIENTS_STR else []
 
 # OpenWeatherMap API 설정
 OWM_API_KEY = os.getenv("OWM_API_KEY")                                              # OpenWeatherMap API 키    
-OWM_ENDPOINT = "https://api.openweathermap.org/data/3.0/onecall"                    # OpenWeatherMap API 엔드포인트
-AIR_POLLUTION_ENDPOINT = "http://api.openweathermap.org/data/2.5/air_pollution"     # 대기질 API 엔드포인트
+OWM_ENDPOINT = os.getenv("OWM_ENDPOINT", "https://api.openweathermap.org/data/3.0/onecall")                           # OpenWeatherMap API 엔드포인트
+AIR_POLLUTION_ENDPOINT = os.getenv("AIR_POLLUTION_ENDPOINT", "http://api.openweathermap.org/data/2.5/air_pollution")  # 대기질 API 엔드포인트
+
+# HTTP 클라이언트 설정 (연결 재사용 및 타임아웃)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))   # 연결 타임아웃 (초)
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))           # 응답 읽기 타임아웃 (초)
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))                   # 호스트별 유지할 연결 수 및 요청 스레드 수
+
+# HTTP 요청 실패 대응 설정 (재시도, 보조 요청, 회로 차단기)
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))                        # 연결 오류/429/5xx 응답 시 재시도 횟수
+HTTP_RETRY_BASE_DELAY = float(os.getenv("HTTP_RETRY_BASE_DELAY", "0.5"))  # 첫 재시도 최대 대기 시간 (초, 이후 2배씩 증가)
+HTTP_RETRY_MAX_DELAY = float(os.getenv("HTTP_RETRY_MAX_DELAY", "8"))      # 재시도 최대 대기 시간 (초)
+HTTP_HEDGE_PERCENTILE = float(os.getenv("HTTP_HEDGE_PERCENTILE", "0.95")) # 응답이 이 백분위 시간보다 늦으면 보조 요청 (0 이면 사용 안 함)
+HTTP_HEDGE_MIN_SAMPLES = int(os.getenv("HTTP_HEDGE_MIN_SAMPLES", "20"))   # 보조 요청 기준을 계산할 최소 응답 수
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))    # 요청을 차단할 연속 실패 횟수
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "60"))        # 차단 후 시험 요청까지 대기 시간 (초)
+
+# API 호출 한도 설정 - 재시도/보조 요청을 포함한 모든 OpenWeatherMap 호출이 함께 사용
+OWM_CALLS_PER_MINUTE = int(os.getenv("OWM_CALLS_PER_MINUTE", "0"))       # 분당 최대 호출 수 (0: 제한 없음)
+OWM_CALLS_PER_DAY = int(os.getenv("OWM_CALLS_PER_DAY", "0"))             # 일일(UTC) 최대 호출 수 (0: 제한 없음)
+OWM_DAILY_RESERVE = float(os.getenv("OWM_DAILY_RESERVE", "0.2"))         # 일일 한도 중 정기 발송용으로 남겨 둘 비율
+OWM_QUOTA_FILE = os.getenv("OWM_QUOTA_FILE", "owm_quota.json") or None   # 오늘 호출 수 저장 파일 (빈 값이면 메모리만 사용)
+
+# 날씨 API 응답 캐시 설정
+WEATHER_CACHE_TTL = int(os.getenv("WEATHER_CACHE_TTL", "600"))            # 날씨 데이터 유효 시간 (초)
+AIR_QUALITY_CACHE_TTL = int(os.getenv("AIR_QUALITY_CACHE_TTL", "1800"))   # 대기질 데이터 유효 시간 (초)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))          # 메모리에 보관할 최대 응답 수
+CACHE_FILE = os.getenv("FORECAST_CACHE_FILE") or None                     # 디스크 캐시 파일 경로 (미설정 시 메모리만 사용)
+STALE_FORECAST_MAX_AGE = int(os.getenv("STALE_FORECAST_MAX_AGE", "86400"))  # 요청 실패 시 대신 사용할 만료된 예보의 최대 보관 시간 (초)
+
+# 예보 기록 저장소 설정 (SQLite) - 가져온 예보와 대기 질 지수를 쌓아 두고 네트워크 없이 과거 기록 조회
+FORECAST_HISTORY_DB = os.getenv("FORECAST_HISTORY_DB") or None             # 기록 파일 경로 (미설정 시 기록하지 않음)
+FORECAST_HISTORY_RETENTION_DAYS = float(os.getenv("FORECAST_HISTORY_RETENTION_DAYS", "30"))   # 기록 보관 기간 (일, 0: 삭제하지 않음)
 
 # 특징 지역 위도 경도 값 설정 - 지역: 서울
 SEOUL_LAT = 37.541
 SEOUL_LON = 126.986
 
+# 추가 지역 설정 - "이름:위도:경도" 형식을 쉼표로 구분 (예: "서울:37.541:126.986,부산:35.1796:129.0756")
+WEATHER_LOCATIONS_STR = os.getenv("WEATHER_LOCATIONS", "")
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "20"))            # 동시에 처리할 지역 수
+
 # 스케줄 설정
-SCHEDULE_TIME = "07:00"  # 매일 아침 7시
\ No newline at end of file
+SCHEDULE_TIME = "07:00"  # 매일 아침 7시
+
+# 예보 변경 감지 설정 - 정기 발송 이후 주기적으로 예보를 확인하여 날씨/강수/대기질 판단이 바뀐 지역만 다시 발송
+CHANGE_POLL_INTERVAL = int(os.getenv("CHANGE_POLL_INTERVAL", "0"))         # 확인 간격 (분, 0: 사용 안 함)
+CHANGE_POLL_START = os.getenv("CHANGE_POLL_START", "08:00")                # 확인 시작 시각
+CHANGE_POLL_END = os.getenv("CHANGE_POLL_END", "21:00")                    # 확인 종료 시각
+CHANGE_STATE_FILE = os.getenv("CHANGE_STATE_FILE") or None                # 마지막 발송 지문 저장 파일 (미설정 시 메모리만 사용)
+
+# 구독자별 발송 설정 - "이메일|지역|시간대|HH:MM" 형식을 쉼표로 구분 (시간대와 시각은 생략 가능)
+# 예: "a@example.com|서울|Asia/Seoul|07:00,b@example.com|부산|America/New_York|06:30"
+SUBSCRIBERS_STR = os.getenv("SUBSCRIBERS", "")
+DEFAULT_TIMEZONE = os.getenv("DEFAULT_TIMEZONE", "Asia/Seoul")           # 시간대를 생략한 구독자의 기본 시간대
+
+# 구독자 저장소 설정 - 설정하면 구독자를 SQLite 파일에서 읽고, 실행 중에도 추가/삭제한 구독자를 반영 (SUBSCRIBERS 는 시작 시 저장소로 추가)
+SUBSCRIBER_DB = os.getenv("SUBSCRIBER_DB", "")                             # 구독자 저장소 파일 (빈 값이면 사용 안 함)
+SUBSCRIBER_BATCH_SIZE = int(os.getenv("SUBSCRIBER_BATCH_SIZE", "500"))    # 발송 시 한 번에 읽을 최대 수신자 수
+SUBSCRIBER_SYNC_INTERVAL = float(os.getenv("SUBSCRIBER_SYNC_INTERVAL", "30"))  # 저장소 변경 확인 간격 (초)
+
+# 실행 지표 내보내기 설정 (Prometheus 텍스트 형식)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))                        # /metrics 엔드포인트 포트 (0: 사용 안 함)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")                     # /metrics 엔드포인트 바인드 주소
+METRICS_FILE = os.getenv("METRICS_FILE") or None                          # 지표를 주기적으로 기록할 파일 (미설정 시 기록 안 함)
+METRICS_EXPORT_INTERVAL = float(os.getenv("METRICS_EXPORT_INTERVAL", "60"))  # 지표 파일 기록 간격 (초)
+
+# 로그 파일 설정
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))   # 로테이션할 로그 파일 크기 (바이트)
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))               # 보관할 압축 백업 파일 수
+
+# 메모리 프로파일링 설정 (tracemalloc) - 사용 시 단계별로 나눠 실행하므로 느려짐
+MEMORY_PROFILE = os.getenv("MEMORY_PROFILE", "false").lower() == "true"  # 단계별 메모리 프로파일링 사용 여부
+MEMORY_PROFILE_DIR = os.getenv("MEMORY_PROFILE_DIR", "memory_profiles")  # 보고서 저장 디렉토리
+MEMORY_PROFILE_TOP = int(os.getenv("MEMORY_PROFILE_TOP", "10"))          # 단계별로 기록할 할당 위치 수
+MEMORY_PROFILE_FRAMES = int(os.getenv("MEMORY_PROFILE_FRAMES", "1"))     # 할당 위치별 호출 스택 깊이
+
+# 메모리 관리 설정 - 작업 후 RSS 가 기준값보다 수위 이상 늘었을 때만 GC 실행
+MEMORY_LOW_WATERMARK_MB = float(os.getenv("MEMORY_LOW_WATERMARK_MB", "64"))     # 젊은 세대 GC 수위 (MB)
+MEMORY_HIGH_WATERMARK_MB = float(os.getenv("MEMORY_HIGH_WATERMARK_MB", "256"))  # 전체 GC 수위 (MB)
+MEMORY_MALLOC_TRIM = os.getenv("MEMORY_MALLOC_TRIM", "true").lower() == "true"   # 전체 GC 후 해제된 힙을 OS 에 반환 (glibc)
+GC_FREEZE = os.getenv("GC_FREEZE", "true").lower() == "true"                      # 시작 객체를 GC 검사 대상에서 제외
\ No newline at end of file
@@ -0,0 +1,140 @@
+## 구독자별 발송 지역 및 현지 발송 시각
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from config.locations import get_location
+from config.settings import DEFAULT_TIMEZONE, SCHEDULE_TIME, SUBSCRIBERS_STR
+
+
+# 구독자 정보 - 받는 주소, 지역, 현지 시간대와 발송 시각
+class Subscriber(NamedTuple):
+    email: str          # 수신자 이메일 주소
+    location: str       # 날씨를 받을 지역 이름 (config.locations 에 등록된 이름)
+    timezone: str       # IANA 시간대 이름 (예: "Asia/Seoul")
+    send_time: str      # 현지 발송 시각 ("HH:MM")
+
+
+# 등록된 구독자 ((이메일, 지역) -> 구독자 정보)
+_registry: Dict[Tuple[str, str], Subscriber] = {}
+
+
+# 구독자 확인 함수
+def validate_subscriber(subscriber: Subscriber) -> Optional[str]:
+    """
+    구독자 정보가 올바른지 확인합니다.
+
+    Args:
+        subscriber: 구독자 정보
+
+    Returns:
+        Optional[str]: 오류 메시지 (올바르면 None)
+    """
+    if not subscriber.email or not subscriber.location:
+        return "이메일과 지역은 필수입니다."
+
+    if get_location(subscriber.location) is None:
+        return f"등록되지 않은 지역입니다: {subscriber.location}"
+
+    try:
+        ZoneInfo(subscriber.timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        return f"알 수 없는 시간대입니다: {subscriber.timezone}"
+
+    try:
+        hour, minute = (int(part) for part in subscriber.send_time.split(":"))
+    except ValueError:
+        return f"잘못된 발송 시각입니다: {subscriber.send_time}"
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return f"잘못된 발송 시각입니다: {subscriber.send_time}"
+
+    return None
+
+
+# 구독자 등록 함수
+def register_subscriber(
+    email: str,
+    location: str,
+    timezone: str = DEFAULT_TIMEZONE,
+    send_time: str = SCHEDULE_TIME
+) -> Subscriber:
+    """
+    구독자를 등록합니다. 같은 이메일과 지역이 이미 있으면 시간대와 발송 시각을 갱신합니다.
+
+    Args:
+        email: 수신자 이메일 주소
+        location: 지역 이름
+        timezone: IANA 시간대 이름
+        send_time: 현지 발송 시각 ("HH:MM")
+
+    Returns:
+        Subscriber: 등록된 구독자 정보
+
+    Raises:
+        ValueError: 구독자 정보가 올바르지 않은 경우
+    """
+    subscriber = Subscriber(email.strip(), location.strip(), timezone.strip(), send_time.strip())
+    error = validate_subscriber(subscriber)
+    if error:
+        raise ValueError(error)
+
+    _registry[(subscriber.email, subscriber.location)] = subscriber
+    return subscriber
+
+
+# 구독자 삭제 함수
+def unregister_subscriber(email: str, location: str) -> Optional[Subscriber]:
+    """
+    구독자를 삭제합니다.
+
+    Args:
+        email: 수신자 이메일 주소
+        location: 지역 이름
+
+    Returns:
+        Optional[Subscriber]: 삭제된 구독자 정보 (없으면 None)
+    """
+    return _registry.pop((email, location), None)
+
+
+# 전체 구독자 목록 반환 함수
+def get_subscribers() -> List[Subscriber]:
+    """
+    등록된 모든 구독자를 등록 순서대로 반환합니다.
+
+    Returns:
+        List[Subscriber]: 구독자 목록
+    """
+    return list(_registry.values())
+
+
+# 환경 변수 문자열 파싱 함수
+def parse_subscribers(subscribers_str: str) -> List[Subscriber]:
+    """
+    "이메일|지역|시간대|HH:MM" 항목을 쉼표로 구분한 문자열을 구독자 목록으로 변환합니다.
+    시간대와 발송 시각을 생략하면 DEFAULT_TIMEZONE 과 SCHEDULE_TIME 을 사용하며,
+    형식이 잘못된 항목은 무시합니다.
+
+    Args:
+        subscribers_str: 구독자 설정 문자열
+
+    Returns:
+        List[Subscriber]: 구독자 목록
+    """
+    subscribers = []
+    for item in subscribers_str.split(","):
+        parts = [part.strip() for part in item.split("|")]
+        if len(parts) < 2 or len(parts) > 4:
+            continue
+        email, location = parts[0], parts[1]
+        timezone = parts[2] if len(parts) > 2 and parts[2] else DEFAULT_TIMEZONE
+        send_time = parts[3] if len(parts) > 3 and parts[3] else SCHEDULE_TIME
+
+        subscriber = Subscriber(email, location, timezone, send_time)
+        if validate_subscriber(subscriber) is None:
+            subscribers.append(subscriber)
+    return subscribers
+
+
+# 환경 변수에 설정된 구독자 등록
+for _subscriber in parse_subscribers(SUBSCRIBERS_STR):
+    register_subscriber(*_subscriber)
@@ -1,100 +1,436 @@
 # 날씨 메일 서비스 메인 모듈
 import sys
+
+# 즉시 전송(--now)은 스케줄러, 메모리 관리, 프로세스 풀 모듈을 가져오지 않는 빠른 시작 경로로 실행 (cron/컨테이너용)
+if __name__ == "__main__" and sys.argv[1:2] == ["--now"]:
+    from oneshot import main as run_oneshot
+    sys.exit(run_oneshot(sys.argv[2:]))
+
 import asyncio
-import schedule
-import time
+import functools
 import logging
 import os
-import gc
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
-from config.settings import SCHEDULE_TIME
-from services.weather_service import get_weather_data, get_air_quality
-from services.email_service import create_email_content, send_email
-from utils.helpers import memory_cleanup, log_rotation
+from config.settings import (
+    SCHEDULE_TIME, INDIVIDUAL_DELIVERY, METRICS_PORT, METRICS_HOST, METRICS_FILE, METRICS_EXPORT_INTERVAL,
+    LOG_MAX_BYTES, LOG_BACKUP_COUNT, MEMORY_PROFILE, MEMORY_PROFILE_DIR, MEMORY_PROFILE_TOP, MEMORY_PROFILE_FRAMES,
+    SMTP_FROM, RECIPIENT, MEMORY_LOW_WATERMARK_MB, MEMORY_HIGH_WATERMARK_MB, MEMORY_MALLOC_TRIM, GC_FREEZE,
+    CHANGE_POLL_INTERVAL, CHANGE_POLL_START, CHANGE_POLL_END, CHANGE_STATE_FILE,
+    SUBSCRIBER_DB, SUBSCRIBER_BATCH_SIZE, SUBSCRIBER_SYNC_INTERVAL
+)
+from config.locations import Location, get_location, get_locations
+from config.subscribers import get_subscribers
+from services.weather_service import (
+    iter_location_forecasts, fetch_weather_bundle, close_http_client, forecast_cache, api_quota,
+    flush_forecast_history, close_forecast_history,
+    get_weather_data, get_air_quality
+)
+from services.forecast_model import Forecast, parse_onecall, parse_air_quality
+from services.change_detection import ChangeDetector
+from services.subscriber_store import SubscriberStore
+from services.email_service import (
+    create_forecast_email, send_email, smtp_sessions, cohort_messages, EncodedMessage
+)
+from services.delivery_service import deliver_to_recipients, close_delivery_pipeline, get_configured_recipients
+from services.render_pool import render_messages, close_render_pool
+from utils.logging_setup import setup_logging
+from utils.memory_governor import MemoryGovernor
+from utils.memory_profiler import MemoryProfiler
+from utils.quota import AD_HOC, POLL, current_priority, request_priority
+from utils.scheduler import AsyncScheduler, SendTimeQueue
+from utils.metrics import metrics, export_metrics_file
 
 # 상수 설정
 LOG_FILE = "weather_mail.log"                   # 로그 파일 이름 
-MEMORY_CLEANUP_INTERVAL = 12                    # 메모리 정리 간격 (시간 단위)
-MEMORY_LAST_CLEANUP = datetime.now()            # 마지막 메모리 정리 시간 기록
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),                  # 로그 파일 핸들러 
-        logging.StreamHandler()                         # 콘솔 핸들러 
-    ]
-)
-logger = logging.getLogger(__name__)                # 로거 인스턴스 생성 
 
-# 메모리 최적화 설정
-gc.enable()                         # 가비지 컬렉션 활성화
-gc.set_threshold(700, 10, 5)        # GC 임계값 조정 (기본값보다 약간 공격적)
+# 로거 인스턴스 생성 (핸들러는 실행 시 setup_logging 으로 설정)
+logger = logging.getLogger(__name__)
+
+# 실행 지표
+RUN_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+run_seconds = metrics.histogram("weather_mail_run_seconds", "전체 발송 작업 소요 시간 (초)", buckets=RUN_BUCKETS)
+last_run_timestamp = metrics.gauge("weather_mail_last_run_timestamp_seconds", "마지막 발송 작업 종료 시각 (Unix 시간)")
+last_run_duration = metrics.gauge("weather_mail_last_run_duration_seconds", "마지막 발송 작업 소요 시간 (초)")
+locations_total = metrics.counter("weather_mail_locations_total", "지역별 발송 결과 (result: sent/failed)")
+
+# 메모리 프로파일러 (MEMORY_PROFILE=true 일 때만 사용)
+memory_profiler = MemoryProfiler(MEMORY_PROFILE_DIR, MEMORY_PROFILE_TOP, MEMORY_PROFILE_FRAMES) if MEMORY_PROFILE else None
+
+# 메모리 관리자 (RSS 가 수위를 넘었을 때만 GC 실행)
+memory_governor = MemoryGovernor(MEMORY_LOW_WATERMARK_MB, MEMORY_HIGH_WATERMARK_MB, MEMORY_MALLOC_TRIM)
+
+# 지역별 마지막 발송 예보 지문 (변경 감지 모드에서 달라진 지역만 다시 발송)
+change_detector = ChangeDetector(CHANGE_STATE_FILE)
+
+# 구독자 저장소 (SUBSCRIBER_DB 가 설정된 경우에만 사용)
+subscriber_store = SubscriberStore(SUBSCRIBER_DB, SUBSCRIBER_BATCH_SIZE) if SUBSCRIBER_DB else None
+
+# 정기 발송과 변경 확인 발송이 겹치지 않도록 하는 잠금
+_send_lock = asyncio.Lock()
+
+
+# 예보 변경 확인 (only_changed 이면 마지막으로 보낸 메일과 달라진 지역만 렌더링/전송 단계로 전달)
+async def _track_changes(
+    forecasts: AsyncIterator[Tuple[Location, Optional[Forecast], Optional[int]]],
+    only_changed: bool
+) -> AsyncIterator[Tuple[Location, Optional[Forecast], Optional[int]]]:
+    async for location, forecast, aqi in forecasts:
+        if change_detector.check(location.name, forecast, aqi) or not only_changed:
+            yield location, forecast, aqi
 
 
 # 날씨 이메일 전송 함수 
-async def send_weather_email():
+async def send_weather_email(only_changed: bool = False):
     """
     날씨 정보를 이메일로 전송합니다.
-    """
-    # 전역 함수 사용 
-    global MEMORY_LAST_CLEANUP
     
+    Args:
+        only_changed: True 이면 마지막으로 보낸 메일과 예보 판단(종합 날씨, 강수, 대기질)이 달라진 지역만 전송
+    """
     # 로그 기록 
-    logger.info(f"날씨 이메일 전송 시작: {datetime.now()}")
+    logger.info(f"날씨 이메일 전송 시작{' (변경된 지역만)' if only_changed else ''}: {datetime.now()}")
+    run_start = time.perf_counter()
     
     try:
-        # 로그 파일 확인 및 로테이션
-        log_rotation(LOG_FILE)
+        # 등록된 지역별로 날씨 데이터와 대기 질 데이터를 동시에 가져와 이메일 내용 생성 및 인코딩
+        # (같은 예보는 한 번만 렌더링하며, RENDER_PROCESSES 설정 시 여러 프로세스에서 렌더링)
+        forecasts = _track_changes(iter_location_forecasts(get_locations()), only_changed)
+        async for location, message in render_messages(forecasts):
+            # 이메일 전송 (아직 가져오는 중인 지역을 막지 않도록 작업자 스레드에서 전송, 개별 전송 모드에서는 수신자별로 전송)
+            if INDIVIDUAL_DELIVERY:
+                result = await asyncio.to_thread(
+                    deliver_to_recipients, message.subject, message.body, None, message
+                )
+            else:
+                result = await asyncio.to_thread(send_email, message.subject, message.body, message)
+            
+            # 이메일 전송 결과 로그 기록 
+            if result:
+                locations_total.inc(result="sent")
+                change_detector.mark_sent(location.name)
+                logger.info(f"날씨 이메일 전송 성공 ({location.name})")
+            else:
+                locations_total.inc(result="failed")
+                logger.error(f"날씨 이메일 전송 실패 ({location.name})")
+    
+    except Exception as e:
+        # 오류 로그 기록 
+        logger.error(f"날씨 이메일 전송 중 오류 발생: {e}")
+    
+    finally:
+        # 실행 지표 기록 및 파일 내보내기
+        run_duration = time.perf_counter() - run_start
+        run_seconds.observe(run_duration)
+        last_run_duration.set(run_duration)
+        last_run_timestamp.set(time.time())
+        export_metrics_file(METRICS_FILE)
         
-        # 날씨 데이터 가져오기
-        weather_data = await get_weather_data()
-        air_quality_data = await get_air_quality()
+        # 캐시 통계 기록 및 디스크 저장 (재시작 후에도 캐시 유지)
+        cache_stats = forecast_cache.stats()
+        logger.info(
+            f"API 캐시: 적중 {cache_stats['hits']}회, 실패 {cache_stats['misses']}회 "
+            f"(적중률 {cache_stats['hit_ratio']:.0%}, 보관 {cache_stats['entries']}개)"
+        )
+        forecast_cache.save()
+        change_detector.save()
+        api_quota.save()
+        logger.info(f"오늘 API 호출 수: {api_quota.used_today}회")
         
-        # 이메일 내용 생성
-        email_content = create_email_content(weather_data, air_quality_data)
+        # 가져온 예보 기록 저장 (작업자 스레드에서 실행하여 이벤트 루프를 막지 않음)
+        await asyncio.to_thread(flush_forecast_history)
+
+
+# 구독자 배치 전송 함수 
+async def send_subscriber_batch(scheduled: datetime, location_name: str, recipients: List[str]):
+    """
+    같은 시각에 같은 지역의 날씨를 받을 구독자들에게 수신자별로 이메일을 전송합니다.
+    
+    Args:
+        scheduled: 발송 예정 시각 (UTC)
+        location_name: 지역 이름
+        recipients: 수신자 목록
+    """
+    location = get_location(location_name)
+    if location is None:
+        logger.error(f"등록되지 않은 지역입니다: {location_name} (수신자 {len(recipients)}명)")
+        return
+    
+    # 날씨 데이터와 대기 질 데이터를 동시에 가져오기 (같은 지역의 다른 배치와 캐시 공유)
+    forecast, aqi = await fetch_weather_bundle(location.lat, location.lon)
+    
+    # 이메일 내용 생성/인코딩 (같은 지역, 같은 예보의 다른 배치와 공유) 후 작업자 스레드에서 수신자별로 전송
+    message = cohort_messages.get(location.name, forecast, aqi)
+    result = await asyncio.to_thread(
+        deliver_to_recipients, message.subject, message.body, recipients, message
+    )
+    
+    # 이메일 전송 결과 로그 기록 
+    if result:
+        locations_total.inc(result="sent")
+        logger.info(f"구독자 날씨 이메일 전송 성공 ({location.name}, {len(recipients)}명)")
+    else:
+        locations_total.inc(result="failed")
+        logger.error(f"구독자 날씨 이메일 전송 실패 ({location.name}, {len(recipients)}명)")
+    
+    # 메모리 수위 확인
+    memory_governor.check(f"구독자 배치 {location.name}")
+
+
+# 구독자 저장소 배치 전송 함수
+async def send_stored_subscriber_batch(scheduled: datetime, location_name: str, groups: List[Tuple[str, str, str]]):
+    """
+    같은 시각에 같은 지역의 날씨를 받을 저장소 그룹의 구독자들에게 수신자별로 이메일을 전송합니다.
+    수신자는 SUBSCRIBER_BATCH_SIZE 명씩 저장소에서 읽어 전송하므로 전체 수신자를 메모리에 올리지 않습니다.
+
+    Args:
+        scheduled: 발송 예정 시각 (UTC)
+        location_name: 지역 이름
+        groups: 발송할 (지역, 시간대, 발송 시각) 목록
+    """
+    location = get_location(location_name)
+    if location is None:
+        logger.error(f"등록되지 않은 지역입니다: {location_name} (저장소 그룹 {len(groups)}개)")
+        return
+
+    # 날씨 데이터와 대기 질 데이터를 동시에 가져오기 (같은 지역의 다른 배치와 캐시 공유)
+    forecast, aqi = await fetch_weather_bundle(location.lat, location.lon)
+    message = cohort_messages.get(location.name, forecast, aqi)
+
+    # 작업자 스레드에서 저장소의 수신자를 배치 단위로 읽어 전송
+    def deliver_stored() -> Tuple[int, int]:
+        sent = failed = 0
+        for group in groups:
+            for recipients in subscriber_store.iter_recipients(*group):
+                if deliver_to_recipients(message.subject, message.body, recipients, message):
+                    sent += len(recipients)
+                else:
+                    failed += len(recipients)
+        return sent, failed
+
+    sent, failed = await asyncio.to_thread(deliver_stored)
+
+    # 이메일 전송 결과 로그 기록 (수신자별 실패는 개별 전송 로그에 기록됨)
+    if sent:
+        locations_total.inc(result="sent")
+        logger.info(f"구독자 날씨 이메일 전송 성공 ({location.name}, {sent + failed}명, 실패한 배치의 수신자 {failed}명)")
+    elif failed:
+        locations_total.inc(result="failed")
+        logger.error(f"구독자 날씨 이메일 전송 실패 ({location.name}, {failed}명)")
+
+    # 메모리 수위 확인
+    memory_governor.check(f"구독자 배치 {location.name}")
+
+
+# 구독자 저장소 변경 반영 (추가/삭제된 발송 그룹을 스케줄러를 다시 시작하지 않고 적용)
+async def _sync_subscriber_groups(send_queue: SendTimeQueue):
+    while True:
+        try:
+            if await asyncio.to_thread(subscriber_store.changed):
+                groups = await asyncio.to_thread(subscriber_store.groups)
+                added, removed = send_queue.sync_groups(key for key, _ in groups)
+                if added or removed:
+                    logger.info(
+                        f"구독자 저장소 변경 반영: 발송 그룹 {added}개 추가, {removed}개 삭제 "
+                        f"(구독 {sum(count for _, count in groups)}건, 그룹 {send_queue.stored_groups}개)"
+                    )
+        except Exception as e:
+            logger.error(f"구독자 저장소 확인 중 오류 발생: {e}")
+        await asyncio.sleep(SUBSCRIBER_SYNC_INTERVAL)
+
+
+# 메모리 프로파일링 모드 전송 함수 
+async def profile_weather_email(profiler: MemoryProfiler):
+    """
+    send_weather_email 과 같은 작업을 단계(fetch, parse, render, mime, send)별로 나눠 실행하면서
+    단계마다 tracemalloc 스냅샷을 비교하여 보고서를 작성합니다.
+    
+    단계별 메모리를 분리해서 보기 위해 캐시를 거치지 않고 모든 지역을 한 단계씩 처리하므로,
+    평소보다 많은 데이터를 동시에 보관합니다 (지역 수에 따라 늘어나는 구조를 확인하는 용도).
+    개별 전송 모드에서는 수신자별 MIME 생성이 send 단계에 포함됩니다.
+    
+    Args:
+        profiler: 메모리 프로파일러
+    """
+    locations = get_locations()
+    logger.info(f"메모리 프로파일링 모드로 날씨 이메일 전송 시작: 지역 {len(locations)}개")
+    profiler.begin_run()
+    
+    try:
+        # 1. 원본 응답 가져오기
+        with profiler.stage("fetch"):
+            responses = await asyncio.gather(*(
+                asyncio.gather(get_weather_data(location.lat, location.lon), get_air_quality(location.lat, location.lon))
+                for location in locations
+            ))
+        
+        # 2. 필요한 필드만 추출 (원본 응답 해제 포함)
+        with profiler.stage("parse"):
+            parsed = [(parse_onecall(weather_data), parse_air_quality(air_data)) for weather_data, air_data in responses]
+            del responses
+            await asyncio.sleep(0)                      # 이벤트 루프가 직전 콜백(gather 결과)의 참조를 놓도록 한 번 양보
+        
+        # 3. 이메일 본문 생성
+        with profiler.stage("render"):
+            contents = [
+                create_forecast_email(forecast, aqi, location.name)
+                for (forecast, aqi), location in zip(parsed, locations)
+            ]
+            del parsed
         
-        # 이메일 전송
-        result = send_email(email_content["subject"], email_content["body"])
+        # 4. MIME 메시지 생성 및 인코딩
+        with profiler.stage("mime"):
+            messages = [EncodedMessage(content["subject"], content["body"]) for content in contents]
         
-        # 이메일 전송 결과 로그 기록 
-        if result:
-            logger.info("날씨 이메일 전송 성공")
-        else:
-            logger.error("날씨 이메일 전송 실패")
+        # 5. 전송 (표시되는 수신자에는 BCC 제외)
+        with profiler.stage("send"):
+            to_recipients = [RECIPIENT] if RECIPIENT else []
+            all_recipients = get_configured_recipients()
+            for location, message in zip(locations, messages):
+                if INDIVIDUAL_DELIVERY:
+                    result = await asyncio.to_thread(
+                        deliver_to_recipients, message.subject, message.body, None, message
+                    )
+                else:
+                    try:
+                        smtp_sessions.send(SMTP_FROM, all_recipients, message.for_recipients(to_recipients))
+                        result = True
+                    except Exception as e:
+                        logger.error(f"이메일 전송 중 오류 발생 ({location.name}): {e}")
+                        result = False
+                locations_total.inc(result="sent" if result else "failed")
+            del contents, messages
     
     except Exception as e:
         # 오류 로그 기록 
-        logger.error(f"날씨 이메일 전송 중 오류 발생: {e}")
+        logger.error(f"메모리 프로파일링 실행 중 오류 발생: {e}")
     
     finally:
-        # 주기적인 메모리 정리 (설정된 간격마다)
-        now = datetime.now()
-        
-        # 메모리 정리 간격 체크 
-        if now - MEMORY_LAST_CLEANUP > timedelta(hours=MEMORY_CLEANUP_INTERVAL):
-            logger.info("정기 메모리 정리 수행 중...")
-            memory_cleanup()
-            MEMORY_LAST_CLEANUP = now
+        profiler.end_run()
 
 
 # 스케줄러에서 실행할 작업 
-def job():
+async def job(only_changed: bool = False):
     """
     스케줄러에서 실행할 작업
-    """
-    # 이벤트 루프 생성 및 설정 
-    loop = asyncio.new_event_loop()                     # 새로운 이벤트 루프 생성 
-    asyncio.set_event_loop(loop)                        # 생성된 루프 설정 
     
+    Args:
+        only_changed: True 이면 예보가 달라진 지역만 전송 (변경 확인 작업)
+    """
     try:
-        loop.run_until_complete(send_weather_email())    # 이메일 전송 작업 실행 
+        # 이메일 전송 작업 실행 (프로파일링 모드에서는 단계별 메모리 측정)
+        # 변경 확인은 정기 발송보다 낮은 우선순위로 API 호출 한도 사용
+        async with _send_lock:
+            with request_priority(max(POLL, current_priority()) if only_changed else current_priority()):
+                if memory_profiler is not None:
+                    await profile_weather_email(memory_profiler)
+                else:
+                    await send_weather_email(only_changed)
     finally:
-        # 작업 완료 후 메모리 정리
-        loop.close()                                    # 루프 닫기 
-        gc.collect()                                    # 명시적 가비지 컬렉션 
+        # 작업 완료 후 메모리 수위 확인 (늘어난 만큼만 정리) 및 GC 비용 기록
+        memory_governor.check("발송 작업 종료")
+        logger.info(memory_governor.report())
+
+
+# 지표 파일 주기적 기록 
+async def _export_metrics_periodically():
+    """
+    METRICS_EXPORT_INTERVAL 초마다 지표를 METRICS_FILE 에 기록합니다.
+    """
+    while True:
+        await asyncio.sleep(METRICS_EXPORT_INTERVAL)
+        try:
+            export_metrics_file(METRICS_FILE)
+        except OSError as e:
+            logger.error(f"지표 파일 기록 중 오류 발생: {e}")
+
+
+# 스케줄러 이벤트 루프 
+async def _run_scheduler_loop():
+    """
+    다음 실행 시각까지 잠들었다가 작업을 실행하는 스케줄러를 실행합니다.
+    """
+    scheduler = AsyncScheduler()
+    
+    # 지표 파일이 설정되어 있으면 주기적으로 기록
+    if METRICS_FILE:
+        asyncio.create_task(_export_metrics_periodically())
+    
+    # 구독자 저장소를 사용하면 저장소 그룹별 현지 발송 시각에 전송 (SUBSCRIBERS 는 저장소에 추가)
+    # RECIPIENT/BCC_RECIPIENTS 일괄 전송과 예보 변경 확인은 함께 예약
+    if subscriber_store is not None:
+        _schedule_broadcast_jobs(scheduler, has_subscribers=True)
+        send_queue = SendTimeQueue()
+        subscriber_store.add_many(get_subscribers())
+        sync_task = asyncio.create_task(_sync_subscriber_groups(send_queue))
+        logger.info(f"구독자 저장소 {SUBSCRIBER_DB} 의 구독 {subscriber_store.count()}건을 현지 발송 시각으로 전송합니다.")
+
+        try:
+            await asyncio.gather(scheduler.run(), send_queue.run(send_stored_subscriber_batch, stored=True))
+        finally:
+            sync_task.cancel()
+        return
+
+    # RECIPIENT/BCC_RECIPIENTS 일괄 전송과 예보 변경 확인 예약
+    subscribers = get_subscribers()
+    _schedule_broadcast_jobs(scheduler, has_subscribers=bool(subscribers))
+    
+    # 구독자가 등록되어 있으면 구독자별 현지 발송 시각에도 전송
+    if subscribers:
+        send_queue = SendTimeQueue()
+        for subscriber in subscribers:
+            send_queue.add(subscriber.email, subscriber.location, subscriber.timezone, subscriber.send_time)
+        logger.info(f"구독자 {len(send_queue)}명의 현지 발송 시각으로 전송합니다.")
+        
+        await asyncio.gather(scheduler.run(), send_queue.run(send_subscriber_batch))
+        return
+    
+    await scheduler.run()
+
+
+# 일괄 전송(SCHEDULE_TIME)과 예보 변경 확인 작업 예약
+def _schedule_broadcast_jobs(scheduler: AsyncScheduler, has_subscribers: bool):
+    """
+    RECIPIENT/BCC_RECIPIENTS 일괄 전송과 예보 변경 확인을 예약합니다. 구독자별 발송과 함께 실행할 수 있으며,
+    구독자만 있고 일괄 전송 수신자가 없으면 예약하지 않고 그 사실을 로그로 남깁니다.
+    
+    Args:
+        scheduler: 작업을 등록할 스케줄러
+        has_subscribers: 구독자별 발송도 사용하는지 여부
+    """
+    if has_subscribers and not get_configured_recipients():
+        logger.info("RECIPIENT/BCC_RECIPIENTS 가 없어 일괄 전송은 예약하지 않습니다 (구독자별 발송만 사용).")
+        if CHANGE_POLL_INTERVAL > 0:
+            logger.warning("예보 변경 확인(CHANGE_POLL_INTERVAL)은 일괄 전송 수신자에게만 적용되므로 예약하지 않습니다.")
+        return
+    
+    # 매일 지정된 시간에 실행
+    scheduler.every_day_at(SCHEDULE_TIME, job, name="날씨 이메일 전송")
+    if has_subscribers:
+        logger.info(f"구독자별 발송과 함께 RECIPIENT/BCC_RECIPIENTS 일괄 전송도 매일 {SCHEDULE_TIME}에 실행합니다.")
+    
+    # 변경 확인 시각마다 예보가 달라진 지역만 다시 전송
+    poll_times = change_poll_times()
+    for at in poll_times:
+        scheduler.every_day_at(at, functools.partial(job, only_changed=True), name=f"예보 변경 확인 {at}")
+    if poll_times:
+        logger.info(f"예보 변경 확인: {poll_times[0]}부터 {poll_times[-1]}까지 {CHANGE_POLL_INTERVAL}분마다 ({len(poll_times)}회)")
+
+
+# 변경 확인 시각 목록 ("HH:MM", 정기 발송 시각 제외)
+def change_poll_times() -> List[str]:
+    if CHANGE_POLL_INTERVAL <= 0:
+        return []
+    start_hour, start_minute = map(int, CHANGE_POLL_START.split(":"))
+    end_hour, end_minute = map(int, CHANGE_POLL_END.split(":"))
+    times = []
+    for minute in range(start_hour * 60 + start_minute, end_hour * 60 + end_minute + 1, CHANGE_POLL_INTERVAL):
+        at = f"{minute // 60:02d}:{minute % 60:02d}"
+        if at != SCHEDULE_TIME:
+            times.append(at)
+    return times
 
 
 # 스캐줄러 실행 함수 
@@ -104,22 +440,22 @@ def run_scheduler():
     """
     # 로그 기록 
     logger.info(f"날씨 메일 서비스 스케줄러 시작 - 매일 {SCHEDULE_TIME}에 실행")
-    logger.info(f"메모리 정리 간격: {MEMORY_CLEANUP_INTERVAL}시간")
-    
-    # 시작 시 메모리 상태 기록
-    memory_cleanup()
+    logger.info(f"메모리 정리 수위: 낮음 {MEMORY_LOW_WATERMARK_MB}MB, 높음 {MEMORY_HIGH_WATERMARK_MB}MB")
     
-    # 매일 지정된 시간에 실행
-    schedule.every().day.at(SCHEDULE_TIME).do(job)
+    # GC 측정 시작 및 시작 객체를 GC 검사 대상에서 제외
+    memory_governor.install()
+    if GC_FREEZE:
+        memory_governor.freeze()
     
-    # 매일 자정에 메모리 정리 작업 추가
-    schedule.every().day.at("00:00").do(memory_cleanup)
+    # 지표 엔드포인트 시작 (Prometheus 수집용)
+    metrics_server = None
+    if METRICS_PORT:
+        metrics_server = metrics.start_server(METRICS_HOST, METRICS_PORT)
+        logger.info(f"지표 엔드포인트 시작: http://{METRICS_HOST}:{METRICS_PORT}/metrics")
     
-    # 스케줄러 실행
+    # 스케줄러 실행 (하나의 이벤트 루프를 유지하여 HTTP/SMTP 연결과 캐시를 실행 간에 재사용)
     try:
-        while True:
-            schedule.run_pending()                          # 스케줄러 실행 
-            time.sleep(1)                                   # 1초 대기 
+        asyncio.run(_run_scheduler_loop())
     
     except KeyboardInterrupt:
         logger.info("사용자에 의해 서비스가 중지되었습니다.")        # 예외 처리 
@@ -128,28 +464,53 @@ def run_scheduler():
         logger.error(f"스케줄러 실행 중 오류 발생: {e}")          # 예외 처리 
     
     finally:
-        # 종료 시 메모리 정리
-        logger.info("서비스 종료 중... 메모리 정리 수행")
-        # 메모리 정리 
-        memory_cleanup()
+        # 종료 시 자원 정리
+        logger.info("서비스 종료 중... 자원 정리 수행")
+        # API 캐시 및 예보 기록 저장, 지표 기록
+        forecast_cache.save()
+        api_quota.save()
+        close_forecast_history()
+        if subscriber_store is not None:
+            subscriber_store.close()
+        export_metrics_file(METRICS_FILE)
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        # HTTP 및 SMTP 연결 정리
+        close_http_client()
+        smtp_sessions.close()
+        close_delivery_pipeline()
+        close_render_pool()
+        # 메모리 추적 종료
+        if memory_profiler is not None:
+            memory_profiler.stop()
+        # GC 비용 기록
+        logger.info(memory_governor.report())
+        memory_governor.uninstall()
 
 # 즉시 날씨 이메일 전송 함수 
-def run_now():
-    """즉시 날씨 이메일 전송 (테스트용)"""
+def run_now(only_changed: bool = False):
+    """즉시 날씨 이메일 전송 (전체 경로 - 메모리 프로파일링용, 일반적인 --now 는 oneshot.main 사용)"""
     logger.info("날씨 이메일 즉시 전송 테스트")
+    memory_governor.install()
     
-    # 작업 실행 
-    job()
+    # 작업 실행 (수동 실행은 정기 발송용으로 남겨 둔 일일 호출 한도를 사용하지 않음)
+    with request_priority(AD_HOC):
+        asyncio.run(job(only_changed))
     
-    # 테스트 후 메모리 정리
-    memory_cleanup()
+    # 예보 기록 저장 및 HTTP/SMTP 연결 정리
+    close_forecast_history()
+    close_http_client()
+    smtp_sessions.close()
+    close_delivery_pipeline()
+    close_render_pool()
+    if memory_profiler is not None:
+        memory_profiler.stop()
+    memory_governor.uninstall()
 
 # 메인 실행 함수 
 if __name__ == "__main__":
-    # 명령행 인수 처리
-    if len(sys.argv) > 1 and sys.argv[1] == "--now":
-        # 즉시 날씨 이메일 전송 
-        run_now()
-    else:
-        # 스케줄러 실행 
-        run_scheduler()
\ No newline at end of file
+    # 로깅 설정 - 큐를 통해 백그라운드 스레드가 기록 (크기 기준 로테이션 및 백업 압축 포함)
+    setup_logging(LOG_FILE, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT)
+    
+    # 스케줄러 실행 (--now 는 파일 맨 위에서 oneshot 으로 처리)
+    run_scheduler()
\ No newline at end of file
@@ -0,0 +1,145 @@
+## 즉시 1회 발송 (cron, 단기 실행 컨테이너용 빠른 시작 경로)
+# 실행 방법 (app 디렉토리에서): python main.py --now [--changes]
+# 스케줄러, 메모리 관리(psutil, GC 측정), 프로세스 풀, 로그 파일 로테이션 모듈을 가져오지 않고,
+# 발송에 필요한 모듈만 가져와 한 번 전송한 뒤 종료합니다. 설정에 따라 필요한 모듈은 사용할 때 가져옵니다.
+import asyncio
+import gc
+import logging
+import sys
+import time
+from typing import List
+
+from config.settings import INDIVIDUAL_DELIVERY, RENDER_PROCESSES, MEMORY_PROFILE, METRICS_FILE, CHANGE_STATE_FILE
+from config.locations import get_locations
+from services.change_detection import ChangeDetector
+from services.email_service import cohort_messages, send_email, smtp_sessions
+from services.weather_service import (
+    iter_location_forecasts, close_http_client, close_forecast_history, forecast_cache, api_quota
+)
+from utils.metrics import export_metrics_file
+from utils.quota import AD_HOC, request_priority
+
+# 콘솔 로그 형식 (utils.logging_setup 과 같은 형식, 파일 기록은 cron/컨테이너 로그 수집에 맡김)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+logger = logging.getLogger(__name__)
+
+
+# 1회 발송
+async def send_once(only_changed: bool = False) -> int:
+    """
+    등록된 모든 지역의 날씨 이메일을 한 번 전송합니다. (main.send_weather_email 과 같은 순서)
+
+    Args:
+        only_changed: True 이면 마지막으로 보낸 메일과 예보 판단이 달라진 지역만 전송
+
+    Returns:
+        int: 전송에 실패한 지역 수
+    """
+    change_detector = ChangeDetector(CHANGE_STATE_FILE)
+    sent = failed = 0
+
+    # 렌더링 작업자를 쓰도록 설정한 경우에만 프로세스 풀 모듈 사용
+    if RENDER_PROCESSES > 0:
+        from services.render_pool import render_messages, close_render_pool
+    else:
+        render_messages = close_render_pool = None
+
+    # 개별 전송 모드에서만 전송 파이프라인 모듈 사용
+    if INDIVIDUAL_DELIVERY:
+        from services.delivery_service import deliver_to_recipients, close_delivery_pipeline
+    else:
+        deliver_to_recipients = close_delivery_pipeline = None
+
+    async def changed_forecasts():
+        async for location, forecast, aqi in iter_location_forecasts(get_locations()):
+            if change_detector.check(location.name, forecast, aqi) or not only_changed:
+                yield location, forecast, aqi
+
+    async def messages():
+        if render_messages is not None:
+            async for item in render_messages(changed_forecasts()):
+                yield item
+        else:
+            async for location, forecast, aqi in changed_forecasts():
+                yield location, cohort_messages.get(location.name, forecast, aqi)
+
+    # 날씨 데이터를 가져오는 동안 SMTP 연결과 로그인을 미리 진행 (일괄 전송 모드)
+    warm_up = None if INDIVIDUAL_DELIVERY else asyncio.ensure_future(asyncio.to_thread(smtp_sessions.warm_up))
+
+    try:
+        async for location, message in messages():
+            if deliver_to_recipients is not None:
+                result = await asyncio.to_thread(deliver_to_recipients, message.subject, message.body, None, message)
+            else:
+                result = await asyncio.to_thread(send_email, message.subject, message.body, message)
+
+            if result:
+                sent += 1
+                change_detector.mark_sent(location.name)
+                logger.info(f"날씨 이메일 전송 성공 ({location.name})")
+            else:
+                failed += 1
+                logger.error(f"날씨 이메일 전송 실패 ({location.name})")
+
+    except Exception as e:
+        failed += 1
+        logger.error(f"날씨 이메일 전송 중 오류 발생: {e}")
+
+    finally:
+        if warm_up is not None:
+            await warm_up
+
+        # 다음 실행(cron)에서 이어서 쓸 상태 저장 및 연결 정리
+        forecast_cache.save()
+        change_detector.save()
+        api_quota.save()
+        close_forecast_history()
+        export_metrics_file(METRICS_FILE)
+        close_http_client()
+        smtp_sessions.close()
+        if close_delivery_pipeline is not None:
+            close_delivery_pipeline()
+        if close_render_pool is not None:
+            close_render_pool()
+
+    logger.info(f"날씨 이메일 전송 완료: 성공 {sent}개, 실패 {failed}개 (오늘 API 호출 {api_quota.used_today}회)")
+    return failed
+
+
+# 명령행 진입점
+def main(argv: List[str]) -> int:
+    """
+    Args:
+        argv: --now 뒤의 명령행 인수 (--changes: 예보가 달라진 지역만 전송)
+
+    Returns:
+        int: 종료 코드 (모두 전송하면 0, 실패한 지역이 있으면 1)
+    """
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    only_changed = "--changes" in argv
+
+    # 메모리 프로파일링은 전체 경로(main.run_now)에서만 지원
+    if MEMORY_PROFILE:
+        import main as full
+        full.run_now(only_changed)
+        return 0
+
+    if only_changed and not CHANGE_STATE_FILE:
+        logger.warning("CHANGE_STATE_FILE 이 설정되지 않아 이전 발송 지문이 없으므로 모든 지역을 전송합니다.")
+
+    # 곧 종료되는 프로세스이므로 순환 참조 GC 를 끄고, 남은 메모리는 종료 시 한 번에 반환
+    gc.disable()
+    start = time.perf_counter()
+    logger.info("날씨 이메일 즉시 전송" + (" (변경된 지역만)" if only_changed else ""))
+
+    # 수동 실행은 정기 발송용으로 남겨 둔 일일 호출 한도를 사용하지 않음
+    with request_priority(AD_HOC):
+        failed = asyncio.run(send_once(only_changed))
+
+    logger.info(f"소요 시간: {time.perf_counter() - start:.2f}초")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
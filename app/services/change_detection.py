@@ -0,0 +1,135 @@
+## 예보 변경 감지 (변경된 지역만 다시 발송)
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from services.forecast_model import Forecast
+from utils.forecast_analysis import analyze_forecast
+from utils.helpers import get_air_quality_level
+from utils.metrics import metrics
+
+# 변경 확인 지표
+_change_checks = metrics.counter("weather_mail_change_checks_total", "예보 변경 확인 횟수 (result: changed/unchanged/skipped)")
+
+
+# 예보 지문 생성
+def forecast_fingerprint(forecast: Optional[Forecast], aqi: Optional[int]) -> Optional[str]:
+    """
+    메일 내용을 결정하는 값만 모아 짧은 문자열로 만듭니다. 렌더링 없이 시간별 예보를 한 번만 순회합니다.
+    (현지 날짜, 종합 날씨, 소나기/강한 비/비/눈 예보 여부, 대기질 수준)
+    온도나 습도처럼 조금씩 계속 바뀌는 값은 포함하지 않으므로, 지문이 같으면 다시 보낼 필요가 없습니다.
+
+    Args:
+        forecast: 파싱된 예보
+        aqi: 대기 질 지수 (없을 수 있음)
+
+    Returns:
+        Optional[str]: 지문 (예보가 없거나 대신 사용한 오래된 예보이면 None)
+    """
+    if forecast is None or forecast.stale:
+        return None
+
+    summary = analyze_forecast(forecast)
+    local_day = time.strftime(
+        "%Y-%m-%d",
+        time.gmtime(forecast.current_dt + forecast.timezone_offset) if forecast.timezone_offset is not None
+        else time.localtime(forecast.current_dt)
+    )
+    precipitation = "".join(
+        flag for flag, active in (
+            ("S", summary.will_shower), ("H", summary.will_heavy_rain), ("R", summary.will_rain), ("N", summary.will_snow)
+        ) if active
+    )
+    air_quality_level = get_air_quality_level(aqi)[0] if aqi else ""
+    return "|".join((local_day, summary.overall_condition, precipitation or "-", air_quality_level or "-"))
+
+
+# 지역별 마지막 발송 지문 관리 클래스
+class ChangeDetector:
+    """
+    지역별로 마지막으로 보낸 메일의 지문을 보관하고, 새 예보의 지문과 비교하여 다시 보낼지 판단합니다.
+
+    - check() 는 새 지문을 계산해 두기만 하고, mark_sent() 를 호출해야 발송한 것으로 기록합니다 (전송 실패 시 다음 확인에서 다시 시도).
+    - path 가 지정되면 save() 시 디스크에 저장하고, 생성 시 다시 불러옵니다 (재시작이나 --now 실행 간에도 유지).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 지문 저장 파일 경로 (None 이면 메모리에만 보관)
+        """
+        self.path = path
+        self._sent: Dict[str, str] = {}
+        self._pending: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if self.path:
+            self.load()
+
+    # 변경 여부 확인
+    def check(self, location_name: str, forecast: Optional[Forecast], aqi: Optional[int]) -> bool:
+        """
+        새 예보가 마지막으로 보낸 메일과 달라졌는지 확인합니다.
+
+        Args:
+            location_name: 지역 이름
+            forecast: 파싱된 예보
+            aqi: 대기 질 지수
+
+        Returns:
+            bool: 다시 보내야 하면 True (예보를 가져오지 못했으면 False)
+        """
+        fingerprint = forecast_fingerprint(forecast, aqi)
+        if fingerprint is None:
+            _change_checks.inc(result="skipped")
+            return False
+
+        with self._lock:
+            previous = self._sent.get(location_name)
+            self._pending[location_name] = fingerprint
+
+        if fingerprint == previous:
+            _change_checks.inc(result="unchanged")
+            return False
+
+        _change_checks.inc(result="changed")
+        if previous is not None:
+            logging.info(f"예보 변경 감지 ({location_name}): {previous} -> {fingerprint}")
+        return True
+
+    # 발송 완료 기록
+    def mark_sent(self, location_name: str):
+        with self._lock:
+            fingerprint = self._pending.pop(location_name, None)
+            if fingerprint is not None:
+                self._sent[location_name] = fingerprint
+
+    # 디스크에서 불러오기
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"예보 지문 파일을 읽을 수 없습니다: {e}")
+            return
+        with self._lock:
+            self._sent.update({name: value for name, value in stored.items() if isinstance(value, str)})
+
+    # 디스크에 저장 (임시 파일에 쓴 뒤 교체)
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            stored = dict(self._sent)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"예보 지문 파일을 저장할 수 없습니다: {e}")
@@ -0,0 +1,247 @@
+## 수신자별 개별 전송 파이프라인
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+from config.settings import (
+    SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_FROM,
+    RECIPIENT, BCC_RECIPIENTS, SMTP_IDLE_TIMEOUT, SMTP_MAX_MESSAGES_PER_SESSION,
+    DELIVERY_WORKERS, DELIVERY_RATE_PER_SEC
+)
+from services.email_service import EncodedMessage, emails_total
+from services.smtp_session import SMTPSessionManager
+from utils.rate_limit import TokenBucket
+
+
+# 수신자별 전송 결과
+class DeliveryResult(NamedTuple):
+    recipient: str              # 수신자 주소
+    success: bool               # 전송 성공 여부
+    latency: float              # 전송 소요 시간 (초, 속도 제한 대기 시간 제외)
+    error: Optional[str] = None # 실패 시 오류 메시지
+
+
+# 설정된 수신자 목록 반환 함수
+def get_configured_recipients() -> List[str]:
+    """
+    RECIPIENT 와 BCC_RECIPIENTS 를 합친 수신자 목록을 중복 없이 반환합니다.
+
+    Returns:
+        List[str]: 수신자 목록
+    """
+    recipients = [RECIPIENT] if RECIPIENT else []
+    recipients.extend(BCC_RECIPIENTS)
+    return list(dict.fromkeys(recipient for recipient in recipients if recipient))
+
+
+# 개별 전송 파이프라인 클래스
+class DeliveryPipeline:
+    """
+    수신자마다 개별 메시지를 만들어 제한된 수의 작업자 스레드로 동시에 전송합니다.
+
+    - MIME 메시지는 전송 요청마다 한 번만 인코딩하고, 수신자별로는 To 헤더만 바꿔 보냅니다.
+    - 작업자마다 자신의 SMTP 세션을 재사용하므로 열린 연결 수는 작업자 수를 넘지 않습니다.
+    - 모든 작업자가 하나의 토큰 버킷을 공유하여 초당 전송 수를 제한합니다.
+    - 한 수신자의 실패는 다른 수신자의 전송에 영향을 주지 않으며, 결과는 수신자별로 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        workers: int = DELIVERY_WORKERS,
+        rate_per_sec: float = DELIVERY_RATE_PER_SEC,
+        max_messages_per_connection: int = SMTP_MAX_MESSAGES_PER_SESSION
+    ):
+        """
+        Args:
+            workers: 동시 전송 작업자 수
+            rate_per_sec: 전체 초당 최대 전송 수 (0 이하이면 제한 없음)
+            max_messages_per_connection: 연결 하나로 보낼 최대 메시지 수
+        """
+        self.workers = max(1, workers)
+        self.max_messages_per_connection = max_messages_per_connection
+        self.rate_limiter = TokenBucket(rate_per_sec)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="smtp-delivery")
+        self._local = threading.local()
+        self._sessions: List[SMTPSessionManager] = []
+        self._sessions_lock = threading.Lock()
+
+    # 현재 작업자 스레드의 SMTP 세션 반환
+    def _get_session(self) -> SMTPSessionManager:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = SMTPSessionManager(
+                SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD,
+                timeout=30,
+                idle_timeout=SMTP_IDLE_TIMEOUT,
+                max_messages=self.max_messages_per_connection
+            )
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    # 한 수신자에게 전송
+    def _deliver_one(self, message: EncodedMessage, recipient: str) -> DeliveryResult:
+        self.rate_limiter.acquire()                         # 초당 전송 수 제한
+        start = time.perf_counter()
+
+        try:
+            self._get_session().send(SMTP_FROM, [recipient], message.for_recipients([recipient]))
+            emails_total.inc(result="sent")
+            return DeliveryResult(recipient, True, time.perf_counter() - start)
+        except Exception as e:
+            emails_total.inc(result="failed")
+            return DeliveryResult(recipient, False, time.perf_counter() - start, str(e))
+
+    # 여러 수신자에게 개별 전송
+    def deliver(
+        self,
+        subject: str,
+        body: str,
+        recipients: List[str],
+        message: Optional[EncodedMessage] = None
+    ) -> List[DeliveryResult]:
+        """
+        수신자마다 개별 메시지를 전송하고 수신자 순서대로 결과를 반환합니다.
+
+        Args:
+            subject: 이메일 제목
+            body: HTML 형식의 이메일 내용
+            recipients: 수신자 목록
+            message: 미리 인코딩한 메시지 (없으면 subject/body 로 한 번 생성)
+
+        Returns:
+            List[DeliveryResult]: 수신자별 전송 결과
+        """
+        message = message if message is not None else EncodedMessage(subject, body)
+
+        # 진행 중인 전송은 작업자 수의 2배까지만 제출 (수신자 수와 관계없이 대기 작업 수 제한)
+        max_in_flight = self.workers * 2
+        in_flight: Deque[Future] = deque()
+        results: List[DeliveryResult] = []
+        for recipient in recipients:
+            if len(in_flight) >= max_in_flight:
+                results.append(in_flight.popleft().result())   # 가장 먼저 제출한 전송 완료 대기 (순서 유지)
+            in_flight.append(self._executor.submit(self._deliver_one, message, recipient))
+        while in_flight:
+            results.append(in_flight.popleft().result())
+        return results
+
+    # 파이프라인 종료
+    def close(self):
+        """
+        작업자 스레드를 종료하고 모든 SMTP 세션을 닫습니다.
+        """
+        self._executor.shutdown(wait=True)
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+# 전송 결과 요약 함수
+def summarize_results(results: List[DeliveryResult]) -> Dict[str, Any]:
+    """
+    전송 결과에서 성공/실패 수와 지연 시간 백분위를 계산합니다.
+
+    Args:
+        results: 수신자별 전송 결과
+
+    Returns:
+        Dict[str, Any]: 요약 정보 (sent, failed, p50, p95, max - 지연 시간은 초 단위)
+    """
+    latencies = sorted(result.latency for result in results)
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+    return {
+        "sent": sum(1 for result in results if result.success),
+        "failed": sum(1 for result in results if not result.success),
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "max": latencies[-1] if latencies else 0.0
+    }
+
+
+# 공유 파이프라인
+_pipeline: Optional[DeliveryPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+# 공유 파이프라인 반환 함수
+def get_delivery_pipeline() -> DeliveryPipeline:
+    """
+    설정값으로 생성한 공유 전송 파이프라인을 반환합니다.
+
+    Returns:
+        DeliveryPipeline: 공유 전송 파이프라인
+    """
+    global _pipeline
+
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = DeliveryPipeline()
+        return _pipeline
+
+
+# 공유 파이프라인 종료 함수
+def close_delivery_pipeline():
+    """
+    공유 전송 파이프라인이 있으면 종료합니다.
+    """
+    global _pipeline
+
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.close()
+            _pipeline = None
+
+
+# 개별 전송 실행 및 로그 기록 함수
+def deliver_to_recipients(
+    subject: str,
+    body: str,
+    recipients: Optional[List[str]] = None,
+    message: Optional[EncodedMessage] = None
+) -> bool:
+    """
+    공유 파이프라인으로 수신자별 개별 전송을 실행하고 결과를 로그에 기록합니다.
+
+    Args:
+        subject: 이메일 제목
+        body: HTML 형식의 이메일 내용
+        recipients: 수신자 목록 (기본값: 설정된 RECIPIENT + BCC_RECIPIENTS)
+        message: 미리 인코딩한 메시지 (없으면 subject/body 로 한 번 생성)
+
+    Returns:
+        bool: 한 명 이상에게 전송에 성공했는지 여부
+    """
+    recipients = recipients if recipients is not None else get_configured_recipients()
+
+    # 수신자가 없으면 종료
+    if not recipients:
+        logging.error("수신자가 설정되지 않았습니다.")
+        return False
+
+    start = time.perf_counter()
+    results = get_delivery_pipeline().deliver(subject, body, recipients, message)
+    elapsed = time.perf_counter() - start
+    summary = summarize_results(results)
+
+    # 실패한 수신자 기록
+    for result in results:
+        if not result.success:
+            logging.warning(f"전송 실패 ({result.recipient}): {result.error}")
+
+    logging.info(
+        f"개별 전송 완료: {subject} - 성공 {summary['sent']}건, 실패 {summary['failed']}건, "
+        f"{elapsed:.2f}초 ({len(results) / elapsed if elapsed else 0:.1f}건/초), "
+        f"지연 p50 {summary['p50'] * 1000:.0f}ms / p95 {summary['p95'] * 1000:.0f}ms"
+    )
+    return summary["sent"] > 0
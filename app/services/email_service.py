@@ -1,30 +1,70 @@
 ## 이메일 전송 관련 서비스
 import logging
-import smtplib
+import re
+import threading
+from collections import OrderedDict
+from email.header import Header
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, Optional, List, Tuple, Counter as CounterType
-from collections import Counter
-from datetime import datetime
+from email.utils import formataddr, parseaddr
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
 
 from config.settings import (
     SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_FROM, 
-    RECIPIENT, BCC_RECIPIENTS
+    RECIPIENT, BCC_RECIPIENTS, SMTP_IDLE_TIMEOUT, SMTP_MAX_MESSAGES_PER_SESSION,
+    EMAIL_COMPACT_HTML, EMAIL_SHARED_STYLES, EMAIL_TEXT_ALTERNATIVE
+)
+from services.smtp_session import SMTPSessionManager
+from services.forecast_model import Forecast, parse_onecall, parse_air_quality
+from services.email_templates import (
+    FAILURE_SUBJECT, FAILURE_BODY,
+    SHOWER_ALERT, HEAVY_RAIN_ALERT, RAIN_ALERT, SNOW_ALERT,
+    render_email_head, render_email_body, render_season_alert, render_stale_notice,
+    render_humidity_box, render_hourly_row, render_hourly_table, condition_text
 )
 from utils.helpers import (
     get_weather_condition, 
     get_air_quality_level, 
     get_season_advice, 
     get_weather_message,
-    analyze_humidity,
     get_optimal_humidity_range,
     get_humidity_condition
 )
+from utils.forecast_analysis import HourlySummary, analyze_hourly, analyze_forecast
+from utils.html_compact import compact_html, html_to_text
+from utils.metrics import metrics
+
+# 렌더링 및 전송 지표
+_render_seconds = metrics.histogram("weather_mail_render_seconds", "이메일 본문 생성 소요 시간 (초)")
+_mime_build_seconds = metrics.histogram("weather_mail_mime_build_seconds", "MIME 메시지 생성 소요 시간 (초)")
+emails_total = metrics.counter("weather_mail_emails_total", "이메일 전송 횟수 (result: sent/failed)")
+_cohort_requests = metrics.counter("weather_mail_cohort_cache_requests_total", "수신자 그룹별 메시지 캐시 조회 횟수 (result: hit/miss)")
+_message_bytes = metrics.histogram(
+    "weather_mail_message_bytes", "인코딩된 메시지 크기 (바이트, To 헤더 제외)",
+    buckets=(4096, 8192, 12288, 16384, 24576, 32768, 65536, 102400)
+)
+_html_bytes_saved = metrics.counter("weather_mail_html_bytes_saved_total", "HTML 압축으로 줄어든 본문 크기 (바이트)")
+
+# SMTP 전송용 줄바꿈 변환 (smtplib 가 문자열 메시지에 적용하는 것과 같은 규칙)
+_EOL_PATTERN = re.compile(r"(?:\r\n|\n|\r(?!\n))")
+
+# 수신자별로 채울 To 헤더 자리 (build_message 에 빈 수신자 목록을 넘기면 생성됨)
+_TO_PLACEHOLDER = b"\r\nTo: \r\n"
+
+# 로그인된 SMTP 연결을 메시지 간에 재사용하는 세션 관리자
+smtp_sessions = SMTPSessionManager(
+    SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD,
+    timeout=30,
+    idle_timeout=SMTP_IDLE_TIMEOUT,
+    max_messages=SMTP_MAX_MESSAGES_PER_SESSION
+)
 
 # 이메일 내용 생성 
 def create_email_content(
     weather_data: Dict[str, Any], 
-    air_quality_data: Optional[Dict[str, Any]]
+    air_quality_data: Optional[Dict[str, Any]],
+    location_name: str = "서울"
 ) -> Dict[str, str]:
     """
     날씨 데이터를 기반으로 이메일 내용을 생성합니다.
@@ -32,62 +72,86 @@ def create_email_content(
     Args:
         weather_data (Dict[str, Any]): 날씨 정보가 포함된 JSON 객체
         air_quality_data (Optional[Dict[str, Any]]): 대기 질 정보가 포함된 JSON 객체 (없을 수 있음)
+        location_name (str): 본문에 표시할 지역 이름
+    
+    Returns:
+        Dict[str, str]: 이메일 제목과 본문 내용
+    """
+    # 필요한 필드만 추출한 뒤 예보 모델로 생성
+    return create_forecast_email(parse_onecall(weather_data), parse_air_quality(air_quality_data), location_name)
+
+
+# 예보 측정 시각 표시 (해당 지역 현지 시각 기준)
+def format_observed_time(forecast: Forecast) -> str:
+    if forecast.timezone_offset is None:
+        observed = datetime.fromtimestamp(forecast.current_dt)
+    else:
+        observed = datetime.fromtimestamp(forecast.current_dt, timezone(timedelta(seconds=forecast.timezone_offset)))
+    return f"{observed.month}월 {observed.day}일 {observed:%H:%M}"
+
+
+# 파싱된 예보로 이메일 내용 생성
+@_render_seconds.time()
+def create_forecast_email(
+    forecast: Optional[Forecast],
+    aqi: Optional[int],
+    location_name: str = "서울"
+) -> Dict[str, str]:
+    """
+    파싱된 예보 모델을 기반으로 이메일 내용을 생성합니다.
+    
+    Args:
+        forecast (Optional[Forecast]): parse_onecall 로 만든 예보 (없을 수 있음)
+        aqi (Optional[int]): 대기 질 지수 (없을 수 있음)
+        location_name (str): 본문에 표시할 지역 이름
     
     Returns:
         Dict[str, str]: 이메일 제목과 본문 내용
     """
     # 날씨 정보가 없으면 오류 메시지 반환 
-    if not weather_data:
+    if forecast is None:
         return {
-            "subject": "[날씨 알리미] 날씨 정보 불러오기 실패",
-            "body": "<p>날씨 정보를 불러오는 데 실패했습니다. 다시 시도해주세요.</p>"
+            "subject": FAILURE_SUBJECT,
+            "body": FAILURE_BODY
         }
     
-    # 현재 날씨 정보 추출
-    current = weather_data.get("current", {})       # 현재 날씨 정보 
-    hourly = weather_data.get("hourly", [])[:15]    # 15시간 데이터로 변경
-    daily = weather_data.get("daily", [])[0] if weather_data.get("daily") else {}    # 일일 데이터 
-    
     # 필요한 데이터 추출
-    current_temp = current.get("temp", 0)            # 현재 온도 
-    temp_max = daily.get("temp", {}).get("max", 0) if daily else 0    # 최고 온도 
-    temp_min = daily.get("temp", {}).get("min", 0) if daily else 0    # 최저 온도 
-    
-    # 현재 날씨 상태 추출
-    current_weather = current.get("weather", [{}])[0]       # 현재 날씨 상태 
-    current_weather_id = current_weather.get("id", 800)     # 날씨 아이디 
+    current_temp = forecast.current_temp            # 현재 온도 
+    temp_max = forecast.temp_max                    # 최고 온도 
+    temp_min = forecast.temp_min                    # 최저 온도 
+    current_weather_id = forecast.current_weather_id  # 현재 날씨 아이디 
     
-    # 15시간 동안의 주요 날씨 상태 파악
-    overall_weather_condition, overall_weather_icon = get_overall_weather(hourly)
+    # 15시간 예보를 한 번만 순회하여 종합 날씨, 강수 예보, 습도, 표 행을 함께 분석 (해당 지역 현지 시각 기준)
+    summary = analyze_forecast(forecast)
+    overall_weather_condition, overall_weather_icon = summary.overall_condition, summary.overall_icon
     
     # 대기질 정보
     air_quality_msg = "대기질 정보를 불러올 수 없습니다."
     air_quality_level = ""
     
-    if air_quality_data and "list" in air_quality_data and air_quality_data["list"]:  # 대기질 데이터가 있고, 목록이 있으면 
-        aqi = air_quality_data["list"][0].get("main", {}).get("aqi", 0)               # 대기질 지수 추출 
-        # 대기질 지수가 있으면 대기질 수준 추출 
-        if aqi:
-            air_quality_level, air_quality_msg = get_air_quality_level(aqi)           # 대기질 수준과 메시지 추출 
+    # 대기질 지수가 있으면 대기질 수준 추출 
+    if aqi:
+        air_quality_level, air_quality_msg = get_air_quality_level(aqi)               # 대기질 수준과 메시지 추출 
     
     # 날씨 상태 확인
     current_condition, current_icon = get_weather_condition(current_weather_id)       # 현재 날씨 상태와 아이콘 추출 
     weather_msg = get_weather_message(overall_weather_condition)                      # 날씨 메시지 추출 (종합 날씨 기준)
     
     # 비 또는 눈 예보 확인 - 분리하여 확인
-    will_rain, will_snow, will_shower, will_heavy_rain = check_precipitation_forecast(hourly)
+    will_rain, will_snow, will_shower, will_heavy_rain = (
+        summary.will_rain, summary.will_snow, summary.will_shower, summary.will_heavy_rain
+    )
     
     # 계절별 조언
     season_advice = get_season_advice(temp_max, temp_min)
     
     # 15시간 예보 HTML 생성
-    hourly_forecast_html = generate_hourly_forecast_html(hourly)
+    hourly_forecast_html = render_hourly_forecast(summary)
     
-    # 습도 분석
-    humidity_data = analyze_humidity(hourly)
-    morning_humidity = humidity_data["morning_avg"]
-    afternoon_humidity = humidity_data["afternoon_avg"]
-    overall_humidity = humidity_data["overall_avg"]
+    # 습도 분석 결과
+    morning_humidity = summary.morning_humidity
+    afternoon_humidity = summary.afternoon_humidity
+    overall_humidity = summary.overall_humidity
     
     # 현재 월 추출
     current_month = datetime.now().month
@@ -112,70 +176,44 @@ def create_email_content(
         afternoon_humidity_condition, afternoon_humidity_icon, afternoon_humidity_msg
     )
     
-    # 이메일 본문 작성
-    msg_text = f"""
-    <html>
-    <body>
-    <h2>오늘의 날씨 알림 {overall_weather_icon}</h2>
-    
-    <p>안녕하세요!</p>
-    
-    <p>오늘 서울의 날씨를 알려드립니다.</p>
-    <hr>
-    
-    <h3>오늘의 종합 날씨: {overall_weather_condition} {overall_weather_icon}</h3>
-    
-    <p>{weather_msg}</p>
-    
-    <p>• 현재 온도: {current_temp:.1f}°C</p>
-    
-    <p>• 최고 온도: {temp_max:.1f}°C</p>
-    
-    <p>• 최저 온도: {temp_min:.1f}°C</p>
-    <hr>
-    
-    <h3>습도 정보 💧</h3>
-    {humidity_html}
-    <hr>
-    
-    <h3>15시간 예보</h3>
-    {hourly_forecast_html}
-    <hr>
-    
-    <h3>대기질 정보: {air_quality_level}</h3>
-    
-    <p>{air_quality_msg}</p>
-    <hr>
-    """
+    # 이메일 본문 작성 (공통 부분)
+    body_head = render_email_head(
+        location_name, overall_weather_condition, overall_weather_icon, weather_msg,
+        current_temp, temp_max, temp_min, humidity_html, hourly_forecast_html,
+        air_quality_level, air_quality_msg
+    )
     
-    # 특별 알림 추가
+    # 특별 알림 추가 (마지막으로 받은 예보를 대신 보내는 경우 안내를 가장 먼저 표시)
+    alerts = []
+    if forecast.stale:
+        alerts.append(render_stale_notice(format_observed_time(forecast)))
     if season_advice:
-        msg_text += f"<h3>특별 알림</h3>\n\n<p>{season_advice}</p>\n<hr>\n"
+        alerts.append(render_season_alert(season_advice))
     
     # 소나기 예보 확인
     if will_shower:
-        msg_text += "<p><strong>🌦️ 오늘 소나기가 예상됩니다! 갑작스러운 날씨 변화에 대비하세요.</strong></p>\n<hr>\n"
+        alerts.append(SHOWER_ALERT)
     
     # 강한 비 예보 확인
     elif will_heavy_rain:
-        msg_text += "<p><strong>🌧️ 오늘 강한 비가 예상됩니다! 외출을 자제하고 우산을 꼭 챙기세요.</strong></p>\n<hr>\n"
+        alerts.append(HEAVY_RAIN_ALERT)
     
     # 일반 비 예보 확인
     elif will_rain:
-        msg_text += "<p><strong>☔ 오늘 비가 예상되니 외출 시 우산을 꼭 챙기세요!</strong></p>\n<hr>\n"
+        alerts.append(RAIN_ALERT)
     
     # 눈 예보 확인
     if will_snow:
-        msg_text += "<p><strong>❄️ 오늘 눈이 예상되니 외출 시 따뜻하게 입고 미끄럼에 주의하세요!</strong></p>\n<hr>\n"
+        alerts.append(SNOW_ALERT)
     
-    # 이메일 본문 추가 
-    msg_text += """
-    <p>좋은 하루 되세요!</p>
+    # 본문과 알림, 맺음말을 한 번에 합치기
+    msg_text = render_email_body(body_head, alerts)
     
-    <p>날씨 알리미 드림</p>
-    </body>
-    </html>
-    """
+    # 압축 모드 - 들여쓰기 공백과 반복 스타일 제거 (보이는 내용은 같음)
+    if EMAIL_COMPACT_HTML:
+        original_size = len(msg_text.encode("utf-8"))
+        msg_text = compact_html(msg_text, shared_styles=EMAIL_SHARED_STYLES)
+        _html_bytes_saved.inc(original_size - len(msg_text.encode("utf-8")))
     
     # 제목 설정 - 날씨 유형별 세분화
     subject = f"[날씨 알리미] 오늘의 날씨: {overall_weather_condition} {overall_weather_icon}"
@@ -229,31 +267,11 @@ def generate_humidity_html(
     Returns:
         str: HTML 형식의 습도 정보
     """
-    html = f"""
-    <div style="margin-bottom: 15px;">
-        <table style="width:100%; border-collapse: collapse; margin-bottom: 15px;">
-            <tr style="background-color: #e6f7ff;">
-                <th style="padding: 8px; border: 1px solid #ddd; width: 33%;">오전 평균 습도</th>
-                <th style="padding: 8px; border: 1px solid #ddd; width: 33%;">오후 평균 습도</th>
-                <th style="padding: 8px; border: 1px solid #ddd; width: 33%;">전체 평균 습도</th>
-            </tr>
-            <tr>
-                <td style="padding: 8px; border: 1px solid #ddd; text-align: center;">{morning_humidity:.1f}% ({morning_condition} {morning_icon})</td>
-                <td style="padding: 8px; border: 1px solid #ddd; text-align: center;">{afternoon_humidity:.1f}% ({afternoon_condition} {afternoon_icon})</td>
-                <td style="padding: 8px; border: 1px solid #ddd; text-align: center;">{overall_humidity:.1f}%</td>
-            </tr>
-        </table>
-        
-        <div style="background-color: #f9f9f9; padding: 10px; border-left: 4px solid #4a90e2; margin-bottom: 10px;">
-            <p><strong>오전 습도 안내:</strong> {morning_msg}</p>
-        </div>
-        
-        <div style="background-color: #f9f9f9; padding: 10px; border-left: 4px solid #4a90e2;">
-            <p><strong>오후 습도 안내:</strong> {afternoon_msg}</p>
-        </div>
-    </div>
-    """
-    return html
+    return render_humidity_box(
+        morning_humidity, afternoon_humidity, overall_humidity,
+        morning_condition, morning_icon, morning_msg,
+        afternoon_condition, afternoon_icon, afternoon_msg
+    )
 
 
 def get_overall_weather(hourly_data: List[Dict[str, Any]]) -> Tuple[str, str]:
@@ -266,96 +284,40 @@ def get_overall_weather(hourly_data: List[Dict[str, Any]]) -> Tuple[str, str]:
     Returns:
         Tuple[str, str]: (종합 날씨 상태, 날씨 아이콘)
     """
-    # 날씨 ID 카운터 초기화
-    weather_ids: CounterType[int] = Counter()
-    
-    # 12시간 동안의 날씨 ID 수집
-    for hour in hourly_data:
-        weather_id = hour.get("weather", [{}])[0].get("id", 800)
-        weather_ids[weather_id] += 1
-    
-    # 우선순위 그룹 (비, 눈, 뇌우 등의 특별한 날씨 상태는 우선순위가 높음)
-    priority_groups = [
-        # 뇌우 (200-299)
-        [id for id in weather_ids.keys() if 200 <= id <= 299],
-        # 비 (300-399, 500-599)
-        [id for id in weather_ids.keys() if (300 <= id <= 399) or (500 <= id <= 599)],
-        # 눈 (600-699)
-        [id for id in weather_ids.keys() if 600 <= id <= 699],
-        # 안개 등 (700-799)
-        [id for id in weather_ids.keys() if 700 <= id <= 799],
-        # 구름/맑음 (800-899)
-        [id for id in weather_ids.keys() if 800 <= id <= 899]
-    ]
-    
-    # 우선순위 그룹에서 가장 빈도가 높은 날씨 ID 찾기
-    most_significant_id = 800  # 기본값은 맑음
-    
-    for group in priority_groups:
-        if group:
-            # 해당 그룹에서 가장 빈도가 높은 날씨 ID 찾기
-            group_counts = {id: weather_ids[id] for id in group}
-            most_common_id = max(group_counts.items(), key=lambda x: x[1])[0]
-            
-            # 해당 날씨가 전체 시간의 25% 이상을 차지하면 유의미하다고 판단
-            if weather_ids[most_common_id] >= len(hourly_data) / 4:
-                most_significant_id = most_common_id
-                break
-    
-    # 날씨 상태와 아이콘 가져오기
-    return get_weather_condition(most_significant_id)
+    summary = analyze_hourly(hourly_data)
+    return summary.overall_condition, summary.overall_icon
 
 
-def generate_hourly_forecast_html(hourly_data: List[Dict[str, Any]]) -> str:
+def generate_hourly_forecast_html(hourly_data: List[Dict[str, Any]], timezone_offset: Optional[int] = None) -> str:
     """
     12시간 예보 데이터를 HTML 테이블로 생성합니다.
     
     Args:
         hourly_data (List[Dict[str, Any]]): 시간별 날씨 정보
+        timezone_offset (Optional[int]): UTC 기준 시차 (초, 없으면 서버 현지 시각 사용)
         
     Returns:
         str: HTML 형식의 시간별 예보 테이블
     """
-    if not hourly_data:
-        return "<p>시간별 예보 정보를 불러올 수 없습니다.</p>"
-    
-    html = """
-    <table style="width:100%; border-collapse: collapse; text-align: center;">
-    <tr style="background-color: #f2f2f2;">
-        <th style="padding: 8px; border: 1px solid #ddd;">시간</th>
-        <th style="padding: 8px; border: 1px solid #ddd;">날씨</th>
-        <th style="padding: 8px; border: 1px solid #ddd;">온도</th>
-        <th style="padding: 8px; border: 1px solid #ddd;">습도</th>
-    </tr>
+    return render_hourly_forecast(analyze_hourly(hourly_data, timezone_offset))
+
+
+# 분석 결과로 시간별 예보 표 렌더링
+def render_hourly_forecast(summary: HourlySummary) -> str:
     """
+    analyze_hourly 로 만든 행들을 HTML 테이블로 렌더링합니다.
     
-    for hour in hourly_data:
-        # 데이터 추출
-        dt = hour.get("dt", 0)
-        temp = hour.get("temp", 0)
-        humidity = hour.get("humidity", 0)
-        weather = hour.get("weather", [{}])[0]
-        weather_id = weather.get("id", 800)
-        
-        # 시간 변환 (Unix 시간을 시:분 형식으로)
-        from datetime import datetime
-        time_str = datetime.fromtimestamp(dt).strftime("%H:%M")
-        
-        # 날씨 상태 및 아이콘
-        condition, icon = get_weather_condition(weather_id)
+    Args:
+        summary (HourlySummary): 시간별 예보 분석 결과
         
-        # 행 추가
-        html += f"""
-        <tr>
-            <td style="padding: 8px; border: 1px solid #ddd;">{time_str}</td>
-            <td style="padding: 8px; border: 1px solid #ddd;">{condition} {icon}</td>
-            <td style="padding: 8px; border: 1px solid #ddd;">{temp:.1f}°C</td>
-            <td style="padding: 8px; border: 1px solid #ddd;">{humidity}%</td>
-        </tr>
-        """
-    
-    html += "</table>"
-    return html
+    Returns:
+        str: HTML 형식의 시간별 예보 테이블
+    """
+    # 날씨 상태 문구는 코드별로 재사용하고, 행은 마지막에 한 번에 합침
+    return render_hourly_table([
+        render_hourly_row(row.time_label, condition_text(row.weather_id), row.temp, row.humidity)
+        for row in summary.rows
+    ])
 
 
 def check_precipitation_forecast(hourly_data: List[Dict[str, Any]]) -> Tuple[bool, bool, bool, bool]:
@@ -368,47 +330,211 @@ def check_precipitation_forecast(hourly_data: List[Dict[str, Any]]) -> Tuple[boo
     Returns:
         Tuple[bool, bool, bool, bool]: (비 예보 여부, 눈 예보 여부, 소나기 여부, 강한 비 여부)
     """
-    will_rain = False
-    will_snow = False
-    will_shower = False
-    will_heavy_rain = False
+    summary = analyze_hourly(hourly_data)
+    return summary.will_rain, summary.will_snow, summary.will_shower, summary.will_heavy_rain
+
+
+# 이메일 메시지 생성
+@_mime_build_seconds.time()
+def build_message(
+    subject: str,
+    body: str,
+    to_recipients: List[str],
+    text_body: Optional[str] = None
+) -> MIMEMultipart:
+    """
+    HTML 본문을 담은 MIME 메시지를 생성합니다.
     
-    for hour in hourly_data:
-        weather_id = hour.get("weather", [{}])[0].get("id", 800)
-        
-        # 소나기 확인 (500-504, 520-531)
-        if (500 <= weather_id <= 504) or (520 <= weather_id <= 531):
-            will_rain = True
-            will_shower = True
-            
-        # 일반 비 확인 (511: 보통의 비)
-        elif weather_id == 511:
-            will_rain = True
-            
-        # 강한 비 확인 (502-504, 522-531)
-        elif (502 <= weather_id <= 504) or (522 <= weather_id <= 531):
-            will_rain = True
-            will_heavy_rain = True
-            
-        # 눈 예보 확인 (600-622: 눈)
-        elif 600 <= weather_id <= 622:
-            will_snow = True
-            
-        # 모든 상태가 확인되면 루프 종료
-        if will_rain and will_snow and will_shower and will_heavy_rain:
-            break
-            
-    return will_rain, will_snow, will_shower, will_heavy_rain
+    Args:
+        subject: 이메일 제목
+        body: HTML 형식의 이메일 내용
+        to_recipients: To 헤더에 표시할 수신자 목록
+        text_body: text/plain 대체 본문 (없으면 HTML 본문만 첨부)
+    
+    Returns:
+        MIMEMultipart: 전송할 메시지
+    """
+    # 메일 생성
+    msg = MIMEMultipart('related')
+    msg['Subject'] = subject
+    msg['From'] = SMTP_FROM
+    msg['To'] = ", ".join(format_recipients(to_recipients)) if to_recipients else ""
+    msg.preamble = 'This is a multi-part message in MIME format.'
+    
+    # 대체 콘텐츠 컨테이너 생성
+    msgAlternative = MIMEMultipart('alternative')
+    msg.attach(msgAlternative)
+    
+    # 텍스트 대체 본문 (alternative 에서는 마지막 파트가 우선이므로 HTML 보다 먼저 첨부)
+    if text_body is not None:
+        msgAlternative.attach(MIMEText(text_body, 'plain', _charset="utf8"))
+    
+    # 메일 본문 내용 작성
+    msgText = MIMEText(body, 'html', _charset="utf8")
+    msgAlternative.attach(msgText)
+    
+    return msg
+
+
+# To 헤더 주소 형식 (표시 이름의 한글 등 ASCII 가 아닌 문자는 RFC 2047 로 인코딩)
+def format_recipients(to_recipients: List[str]) -> List[str]:
+    """
+    Args:
+        to_recipients: 수신자 목록 ("이름 <주소>" 또는 "주소")
+
+    Returns:
+        List[str]: 헤더에 그대로 넣을 수 있는 주소 목록
+    """
+    formatted = []
+    for recipient in to_recipients:
+        name, address = parseaddr(recipient)
+        if not address:
+            formatted.append(recipient)             # 해석할 수 없는 값은 그대로 사용
+            continue
+        try:
+            formatted.append(formataddr((name, address), charset="utf-8"))
+        except UnicodeEncodeError:
+            # 국제화 주소(SMTPUTF8)는 그대로 두고 표시 이름만 인코딩
+            formatted.append(f"{Header(name, 'utf-8').encode()} <{address}>" if name else address)
+    return formatted
+
+
+# 한 번만 인코딩한 메시지 클래스
+class EncodedMessage:
+    """
+    MIME 메시지를 한 번만 생성/직렬화하여 SMTP 로 바로 보낼 수 있는 바이트(CRLF 줄바꿈)로 보관하고,
+    수신자별로는 To 헤더 값만 채워 넣습니다. 수신자가 늘어도 MIME 생성과 직렬화는 한 번뿐입니다.
+    수신자 한 명의 결과는 MIME 경계 문자열을 제외하면 build_message(subject, body, [recipient]).as_string() 과 같습니다.
+    (EMAIL_TEXT_ALTERNATIVE 가 설정되어 있으면 HTML 본문에서 만든 text/plain 대체 본문도 함께 인코딩합니다)
+    """
+
+    __slots__ = ("subject", "body", "_head", "_tail")
+
+    def __init__(self, subject: str, body: str):
+        """
+        Args:
+            subject: 이메일 제목
+            body: HTML 형식의 이메일 내용
+        """
+        self.subject = subject
+        self.body = body
+
+        text_body = html_to_text(body) if EMAIL_TEXT_ALTERNATIVE else None
+        payload = _EOL_PATTERN.sub("\r\n", build_message(subject, body, [], text_body).as_string()).encode("ascii")
+        head, found, tail = payload.partition(_TO_PLACEHOLDER)
+        if not found:
+            raise ValueError("메시지에서 To 헤더 위치를 찾을 수 없습니다.")
+        self._head = head + b"\r\nTo: "
+        self._tail = b"\r\n" + tail
+        _message_bytes.observe(len(self))
+
+    def __len__(self) -> int:
+        return len(self._head) + len(self._tail)
+
+    # 수신자별 메시지 바이트
+    def for_recipients(self, to_recipients: List[str]) -> bytes:
+        """
+        To 헤더에 수신자를 채운 전송용 메시지를 반환합니다.
+
+        Args:
+            to_recipients: To 헤더에 표시할 수신자 목록 (비어 있으면 빈 To 헤더)
+
+        Returns:
+            bytes: SMTP 로 전송할 메시지
+        """
+        return b"".join((self._head, ",\r\n ".join(format_recipients(to_recipients)).encode("utf-8"), self._tail))
+
+
+# 수신자 그룹별 메시지 캐시 클래스
+class CohortMessageCache:
+    """
+    같은 지역, 같은 예보를 받는 수신자 그룹(cohort)의 메시지를 한 번만 렌더링/인코딩하여 보관합니다.
+    같은 예보 객체로 여러 배치를 보내면(예: 발송 시각이 다른 같은 지역 구독자) 렌더링과 MIME 생성 비용이
+    수신자나 배치 수가 아니라 그룹 수에 비례합니다. 예보가 바뀌거나(측정 시각, 대체 예보 여부, 대기 질 지수)
+    계절 조언을 정하는 월이 바뀌면 새로 만듭니다.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: 보관할 최대 그룹 수 (넘치면 가장 오래 사용하지 않은 그룹 제거)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Any, ...], EncodedMessage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # 그룹 키 (지역 + 메일 내용을 결정하는 예보 값)
+    @staticmethod
+    def make_key(location_name: str, forecast: Optional[Forecast], aqi: Optional[int]) -> Tuple[Any, ...]:
+        month = datetime.now().month                # 계절 조언은 발송 시점의 월로 결정됨
+        if forecast is None:
+            return (location_name, month, None)
+        return (location_name, month, forecast.lat, forecast.lon, forecast.current_dt, forecast.stale, aqi)
+
+    # 그룹 메시지 조회 또는 생성
+    def get(self, location_name: str, forecast: Optional[Forecast], aqi: Optional[int]) -> EncodedMessage:
+        """
+        그룹의 메시지를 반환합니다. 없으면 렌더링/인코딩하여 저장합니다.
+
+        Args:
+            location_name: 지역 이름
+            forecast: 파싱된 예보 (없을 수 있음)
+            aqi: 대기 질 지수 (없을 수 있음)
+
+        Returns:
+            EncodedMessage: 그룹 메시지
+        """
+        message = self.peek(location_name, forecast, aqi)
+        if message is not None:
+            return message
+
+        content = create_forecast_email(forecast, aqi, location_name)
+        message = EncodedMessage(content["subject"], content["body"])
+        self.put(location_name, forecast, aqi, message)
+        return message
+
+    # 그룹 메시지 조회 (없으면 None)
+    def peek(self, location_name: str, forecast: Optional[Forecast], aqi: Optional[int]) -> Optional[EncodedMessage]:
+        key = self.make_key(location_name, forecast, aqi)
+
+        with self._lock:
+            message = self._entries.get(key)
+            if message is None:
+                _cohort_requests.inc(result="miss")
+                return None
+            self._entries.move_to_end(key)
+            _cohort_requests.inc(result="hit")
+            return message
+
+    # 그룹 메시지 저장 (다른 곳에서 렌더링한 메시지 포함)
+    def put(self, location_name: str, forecast: Optional[Forecast], aqi: Optional[int], message: EncodedMessage):
+        key = self.make_key(location_name, forecast, aqi)
+
+        with self._lock:
+            self._entries[key] = message
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # 캐시 비우기
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 공유 그룹 메시지 캐시
+cohort_messages = CohortMessageCache()
 
 
 # 이메일 전송 
-def send_email(subject: str, body: str) -> bool:
+def send_email(subject: str, body: str, message: Optional[EncodedMessage] = None) -> bool:
     """
-    이메일을 전송하는 함수 입니다. - 일반 SMTP를 사용합니다.
+    이메일을 전송하는 함수 입니다. - 일반 SMTP를 사용하며, 로그인된 연결을 재사용합니다.
     
     Args:
         subject: 이메일 제목
         body: HTML 형식의 이메일 내용
+        message: 미리 인코딩한 메시지 (없으면 subject/body 로 생성)
     
     Returns:
         bool: 이메일 전송 성공 여부
@@ -426,49 +552,34 @@ def send_email(subject: str, body: str) -> bool:
     all_recipients = to_recipients.copy()  # 새 리스트 생성
     all_recipients.extend(bcc_recipients)  # 리스트에 리스트 추가
     
-    # 메일 생성
-    msg = MIMEMultipart('related')
-    msg['Subject'] = subject
-    msg['From'] = SMTP_FROM
-    msg['To'] = ", ".join(to_recipients) if to_recipients else ""  # 표시되는 수신자에는 BCC 제외
-    msg.preamble = 'This is a multi-part message in MIME format.'
-    
-    # 대체 콘텐츠 컨테이너 생성
-    msgAlternative = MIMEMultipart('alternative')
-    msg.attach(msgAlternative)
-    
-    # 메일 본문 내용 작성
-    msgText = MIMEText(body, 'html', _charset="utf8")
-    msgAlternative.attach(msgText)
+    # 메일 생성 (표시되는 수신자에는 BCC 제외)
+    message = message if message is not None else EncodedMessage(subject, body)
     
     try:
         # 로그 기록
         logging.info(f"일반 SMTP로 이메일 전송 시도 ({SMTP_HOST}:{SMTP_PORT})...")
         
-        # 일반 SMTP 연결
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30) as server:
-            # 로그인
-            server.login(SMTP_USER, SMTP_PASSWORD)
-            
-            # 이메일 전송 - 모든 수신자에게 전송하지만 BCC는 숨김처리
-            server.sendmail(
-                SMTP_FROM,          # 보내는 사람 
-                all_recipients,     # 모든 수신자 (TO + BCC)
-                msg.as_string()     # 이메일 내용 
-            )
-            
-            # 로그 기록
-            to_log = ", ".join(to_recipients) if to_recipients else "없음"       # 수신자 로그 
-            bcc_log = ", ".join(bcc_recipients) if bcc_recipients else "없음"    # BCC 로그 
-            
-            logging.info(f"이메일 전송 완료: {subject}")                            # 로그 기록 
-            logging.info(f"수신자(TO): {to_log}")                                 # 수신자 로그 
-            logging.info(f"수신자(BCC): {bcc_log}")                               # BCC 로그 
-            
-            return True
+        # 이메일 전송 - 모든 수신자에게 전송하지만 BCC는 숨김처리 (세션 재사용)
+        smtp_sessions.send(
+            SMTP_FROM,          # 보내는 사람 
+            all_recipients,     # 모든 수신자 (TO + BCC)
+            message.for_recipients(to_recipients)   # 이메일 내용 
+        )
+        
+        # 로그 기록
+        to_log = ", ".join(to_recipients) if to_recipients else "없음"       # 수신자 로그 
+        bcc_log = ", ".join(bcc_recipients) if bcc_recipients else "없음"    # BCC 로그 
+        
+        logging.info(f"이메일 전송 완료: {subject}")                            # 로그 기록 
+        logging.info(f"수신자(TO): {to_log}")                                 # 수신자 로그 
+        logging.info(f"수신자(BCC): {bcc_log}")                               # BCC 로그 
+        
+        emails_total.inc(result="sent")
+        return True
             
     except Exception as e:
         # 이메일 전송 중 오류 발생 시 경고 메시지 출력
+        emails_total.inc(result="failed")
         logging.error(f"이메일 전송 중 오류 발생: {e}")
         
         # 오류 세부 정보 기록
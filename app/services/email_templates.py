@@ -0,0 +1,217 @@
+## 이메일 HTML 템플릿
+# 정적인 부분(머리말, 맺음말, 표 머리글, 알림 문구)은 모듈을 불러올 때 한 번만 만들어 두고,
+# 반복되는 행은 목록에 모은 뒤 한 번에 합칩니다. 값이 들어가는 부분은 f-string 함수로 렌더링합니다.
+from functools import lru_cache
+from typing import List
+
+from utils.helpers import get_weather_condition
+
+# 표 셀 공통 스타일
+CELL_STYLE = "padding: 8px; border: 1px solid #ddd;"
+
+# 날씨 정보를 불러오지 못했을 때의 메일
+FAILURE_SUBJECT = "[날씨 알리미] 날씨 정보 불러오기 실패"
+FAILURE_BODY = "<p>날씨 정보를 불러오는 데 실패했습니다. 다시 시도해주세요.</p>"
+
+# 시간별 예보 표 - 머리글, 맺음, 데이터 없음 안내
+HOURLY_TABLE_HEADER = f"""
+    <table style="width:100%; border-collapse: collapse; text-align: center;">
+    <tr style="background-color: #f2f2f2;">
+        <th style="{CELL_STYLE}">시간</th>
+        <th style="{CELL_STYLE}">날씨</th>
+        <th style="{CELL_STYLE}">온도</th>
+        <th style="{CELL_STYLE}">습도</th>
+    </tr>
+    """
+HOURLY_TABLE_FOOTER = "</table>"
+HOURLY_UNAVAILABLE = "<p>시간별 예보 정보를 불러올 수 없습니다.</p>"
+
+# 날씨 특보 문구
+SHOWER_ALERT = "<p><strong>🌦️ 오늘 소나기가 예상됩니다! 갑작스러운 날씨 변화에 대비하세요.</strong></p>\n<hr>\n"
+HEAVY_RAIN_ALERT = "<p><strong>🌧️ 오늘 강한 비가 예상됩니다! 외출을 자제하고 우산을 꼭 챙기세요.</strong></p>\n<hr>\n"
+RAIN_ALERT = "<p><strong>☔ 오늘 비가 예상되니 외출 시 우산을 꼭 챙기세요!</strong></p>\n<hr>\n"
+SNOW_ALERT = "<p><strong>❄️ 오늘 눈이 예상되니 외출 시 따뜻하게 입고 미끄럼에 주의하세요!</strong></p>\n<hr>\n"
+
+# 본문 맺음말
+EMAIL_FOOTER = """
+    <p>좋은 하루 되세요!</p>
+    
+    <p>날씨 알리미 드림</p>
+    </body>
+    </html>
+    """
+
+
+# 시간별 예보 행 렌더링
+def render_hourly_row(time_str: str, condition_text: str, temp: float, humidity: int) -> str:
+    """
+    시간별 예보 표의 한 행을 렌더링합니다.
+
+    Args:
+        time_str: 시간 (예: "07:00")
+        condition_text: 날씨 상태와 아이콘 (예: "맑음 ☀️")
+        temp: 온도 (°C)
+        humidity: 습도 (%)
+
+    Returns:
+        str: 표 행 HTML
+    """
+    # 행마다 실행되므로 스타일 문자열을 f-string 상수 부분에 그대로 둠 (CELL_STYLE 과 동일)
+    return f"""
+        <tr>
+            <td style="padding: 8px; border: 1px solid #ddd;">{time_str}</td>
+            <td style="padding: 8px; border: 1px solid #ddd;">{condition_text}</td>
+            <td style="padding: 8px; border: 1px solid #ddd;">{temp:.1f}°C</td>
+            <td style="padding: 8px; border: 1px solid #ddd;">{humidity}%</td>
+        </tr>
+        """
+
+
+# 날씨 코드별 "상태 아이콘" 문구 (코드 종류가 적으므로 한 번 만든 문구를 재사용)
+@lru_cache(maxsize=None)
+def condition_text(weather_id: int) -> str:
+    condition, icon = get_weather_condition(weather_id)
+    return f"{condition} {icon}"
+
+
+# 시간별 예보 표 렌더링
+def render_hourly_table(rows: List[str]) -> str:
+    """
+    미리 렌더링한 행들을 한 번에 합쳐 시간별 예보 표를 만듭니다.
+
+    Args:
+        rows: render_hourly_row 로 만든 행 목록
+
+    Returns:
+        str: 표 HTML (행이 없으면 안내 문구)
+    """
+    if not rows:
+        return HOURLY_UNAVAILABLE
+    return HOURLY_TABLE_HEADER + "".join(rows) + HOURLY_TABLE_FOOTER
+
+
+# 습도 정보 렌더링
+def render_humidity_box(
+    morning_humidity: float,
+    afternoon_humidity: float,
+    overall_humidity: float,
+    morning_condition: str,
+    morning_icon: str,
+    morning_msg: str,
+    afternoon_condition: str,
+    afternoon_icon: str,
+    afternoon_msg: str
+) -> str:
+    """
+    습도 표와 오전/오후 안내 상자를 렌더링합니다.
+
+    Returns:
+        str: 습도 정보 HTML
+    """
+    return f"""
+    <div style="margin-bottom: 15px;">
+        <table style="width:100%; border-collapse: collapse; margin-bottom: 15px;">
+            <tr style="background-color: #e6f7ff;">
+                <th style="{CELL_STYLE} width: 33%;">오전 평균 습도</th>
+                <th style="{CELL_STYLE} width: 33%;">오후 평균 습도</th>
+                <th style="{CELL_STYLE} width: 33%;">전체 평균 습도</th>
+            </tr>
+            <tr>
+                <td style="{CELL_STYLE} text-align: center;">{morning_humidity:.1f}% ({morning_condition} {morning_icon})</td>
+                <td style="{CELL_STYLE} text-align: center;">{afternoon_humidity:.1f}% ({afternoon_condition} {afternoon_icon})</td>
+                <td style="{CELL_STYLE} text-align: center;">{overall_humidity:.1f}%</td>
+            </tr>
+        </table>
+        
+        <div style="background-color: #f9f9f9; padding: 10px; border-left: 4px solid #4a90e2; margin-bottom: 10px;">
+            <p><strong>오전 습도 안내:</strong> {morning_msg}</p>
+        </div>
+        
+        <div style="background-color: #f9f9f9; padding: 10px; border-left: 4px solid #4a90e2;">
+            <p><strong>오후 습도 안내:</strong> {afternoon_msg}</p>
+        </div>
+    </div>
+    """
+
+
+# 이메일 본문 머리 부분 렌더링
+def render_email_head(
+    location_name: str,
+    overall_condition: str,
+    overall_icon: str,
+    weather_msg: str,
+    current_temp: float,
+    temp_max: float,
+    temp_min: float,
+    humidity_html: str,
+    hourly_forecast_html: str,
+    air_quality_level: str,
+    air_quality_msg: str
+) -> str:
+    """
+    인사말부터 대기질 정보까지, 모든 메일에 공통으로 들어가는 본문 부분을 렌더링합니다.
+
+    Returns:
+        str: 본문 HTML (맺음말 제외)
+    """
+    return f"""
+    <html>
+    <body>
+    <h2>오늘의 날씨 알림 {overall_icon}</h2>
+    
+    <p>안녕하세요!</p>
+    
+    <p>오늘 {location_name}의 날씨를 알려드립니다.</p>
+    <hr>
+    
+    <h3>오늘의 종합 날씨: {overall_condition} {overall_icon}</h3>
+    
+    <p>{weather_msg}</p>
+    
+    <p>• 현재 온도: {current_temp:.1f}°C</p>
+    
+    <p>• 최고 온도: {temp_max:.1f}°C</p>
+    
+    <p>• 최저 온도: {temp_min:.1f}°C</p>
+    <hr>
+    
+    <h3>습도 정보 💧</h3>
+    {humidity_html}
+    <hr>
+    
+    <h3>15시간 예보</h3>
+    {hourly_forecast_html}
+    <hr>
+    
+    <h3>대기질 정보: {air_quality_level}</h3>
+    
+    <p>{air_quality_msg}</p>
+    <hr>
+    """
+
+
+# 마지막으로 받은 예보를 대신 보낼 때의 안내
+def render_stale_notice(observed_label: str) -> str:
+    return (
+        f"<p><strong>⚠️ 날씨 서버에 연결하지 못해 {observed_label} 기준으로 마지막으로 받은 예보를 보내드립니다.</strong></p>\n<hr>\n"
+    )
+
+
+# 계절 특별 알림 렌더링
+def render_season_alert(season_advice: str) -> str:
+    return f"<h3>특별 알림</h3>\n\n<p>{season_advice}</p>\n<hr>\n"
+
+
+# 이메일 본문 조립
+def render_email_body(head: str, alerts: List[str]) -> str:
+    """
+    본문 머리 부분, 알림 문구, 맺음말을 한 번에 합칩니다.
+
+    Args:
+        head: render_email_head 로 만든 본문
+        alerts: 순서대로 붙일 알림 HTML 목록
+
+    Returns:
+        str: 완성된 본문 HTML
+    """
+    return "".join([head, *alerts, EMAIL_FOOTER])
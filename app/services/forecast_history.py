@@ -0,0 +1,303 @@
+## 예보 기록 저장소 (SQLite)
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from services.forecast_model import Forecast
+from utils.metrics import metrics
+
+# 테이블 정의 - (좌표, 측정 시각) 을 기본 키로 하는 WITHOUT ROWID 테이블이므로
+# 지역별 시간 범위 조회는 기본 키 인덱스의 범위 탐색 한 번으로 끝남
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    lat_key INTEGER NOT NULL,
+    lon_key INTEGER NOT NULL,
+    observed_at INTEGER NOT NULL,
+    timezone_offset INTEGER,
+    current_temp REAL NOT NULL,
+    current_weather_id INTEGER NOT NULL,
+    temp_max REAL NOT NULL,
+    temp_min REAL NOT NULL,
+    hourly BLOB NOT NULL,
+    PRIMARY KEY (lat_key, lon_key, observed_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS forecasts_observed_at ON forecasts (observed_at);
+CREATE TABLE IF NOT EXISTS air_quality (
+    lat_key INTEGER NOT NULL,
+    lon_key INTEGER NOT NULL,
+    observed_at INTEGER NOT NULL,
+    aqi INTEGER NOT NULL,
+    PRIMARY KEY (lat_key, lon_key, observed_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS air_quality_observed_at ON air_quality (observed_at);
+"""
+
+_FORECAST_COLUMNS = "observed_at, timezone_offset, current_temp, current_weather_id, temp_max, temp_min, hourly"
+
+# 기록 지표
+_history_rows = metrics.counter("weather_mail_history_rows_total", "예보 기록 저장소에 저장한 행 수 (table: forecasts/air_quality)")
+_history_pruned = metrics.counter("weather_mail_history_pruned_total", "보관 기간이 지나 삭제한 예보 기록 행 수")
+
+
+# 시간별 예보 압축 (측정 시각 대비 초 차이 int32, 온도 0.01°C 단위 int16, 습도 uint8, 날씨 코드 uint16)
+def pack_hourly(forecast: Forecast) -> bytes:
+    """
+    시간별 예보 배열을 하나의 BLOB 으로 묶습니다. 15시간 예보 기준 135바이트입니다.
+    OpenWeatherMap 온도는 소수점 둘째 자리까지이므로 0.01°C 단위 정수로 저장해도 값이 바뀌지 않습니다.
+    """
+    count = len(forecast)
+    offsets = array("i", [dt - forecast.current_dt for dt in forecast.hourly_dt])
+    temps = array("h", [max(-32768, min(32767, round(temp * 100))) for temp in forecast.hourly_temp])
+    return b"".join((
+        count.to_bytes(2, "little"),
+        offsets.tobytes(), temps.tobytes(),
+        forecast.hourly_humidity.tobytes(), forecast.hourly_weather_id.tobytes()
+    ))
+
+
+# 시간별 예보 복원 (hourly_dt, hourly_temp, hourly_humidity, hourly_weather_id)
+def unpack_hourly(blob: bytes, observed_at: int) -> Tuple[array, array, array, array]:
+    count = int.from_bytes(blob[:2], "little")
+    position = 2
+    columns = []
+    for typecode in ("i", "h", "B", "H"):
+        column = array(typecode)
+        size = count * column.itemsize
+        column.frombytes(blob[position:position + size])
+        columns.append(column)
+        position += size
+    offsets, temps, humidity, weather_ids = columns
+    return (
+        array("q", [observed_at + offset for offset in offsets]),
+        array("d", [temp / 100 for temp in temps]),
+        humidity,
+        weather_ids
+    )
+
+
+# 예보 기록 저장소 클래스
+class ForecastHistory:
+    """
+    가져온 예보와 대기 질 지수를 SQLite 파일에 쌓아 두고, 네트워크 없이 지역별 과거 기록을 조회합니다.
+
+    - 좌표는 ForecastCache 와 같은 자릿수로 반올림한 정수로 저장하며, (좌표, 측정 시각) 기본 키로 조회합니다.
+    - 저장은 메모리에 모았다가 batch_size 개 또는 flush_interval 초마다 한 트랜잭션으로 기록합니다.
+      기록은 별도 작업자 스레드에서 실행하므로 record_* 를 호출하는 이벤트 루프를 막지 않습니다.
+    - retention_days 가 지난 기록은 하루에 한 번 삭제하고, 빈 페이지를 파일에서 반환합니다.
+    - 연결은 처음 사용할 때 엽니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        retention_days: float = 30,
+        precision: int = 2,
+        batch_size: int = 256,
+        flush_interval: float = 30.0
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            retention_days: 기록 보관 기간 (일, 0 이면 삭제하지 않음)
+            precision: 좌표 반올림 자릿수 (2 -> 약 1km)
+            batch_size: 한 번에 기록할 최대 대기 행 수
+            flush_interval: 대기 중인 행을 기록할 최대 간격 (초)
+        """
+        self.path = path
+        self.retention = retention_days * 86400
+        self.scale = 10 ** precision
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()               # 대기 행 목록 보호 (짧게만 잡음)
+        self._db_lock = threading.Lock()            # 연결 사용 보호 (기록/조회 중에만 잡음)
+        self._pending_forecasts: List[tuple] = []
+        self._pending_aqi: List[tuple] = []
+        self._last_flush = time.monotonic()
+        self._last_prune: Optional[float] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._flush_scheduled = False
+
+    # 연결 열기 (처음 사용할 때 한 번)
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA auto_vacuum = INCREMENTAL")     # 새 파일에만 적용됨
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _key(self, lat: float, lon: float) -> Tuple[int, int]:
+        return round(lat * self.scale), round(lon * self.scale)
+
+    # 예보 기록
+    def record_forecast(self, lat: float, lon: float, forecast: Forecast):
+        """
+        가져온 예보를 기록 대기열에 추가합니다. 같은 지역, 같은 측정 시각의 예보는 하나만 남습니다.
+        대신 사용한 오래된 예보(stale)는 이미 기록되어 있으므로 저장하지 않습니다.
+        """
+        if forecast.stale:
+            return
+        with self._lock:
+            self._pending_forecasts.append((
+                *self._key(lat, lon), forecast.current_dt, forecast.timezone_offset,
+                forecast.current_temp, forecast.current_weather_id, forecast.temp_max, forecast.temp_min,
+                pack_hourly(forecast)
+            ))
+        self._maybe_flush()
+
+    # 대기 질 지수 기록 (Air Pollution 응답에서 지수만 보관하므로 가져온 시각으로 기록)
+    def record_aqi(self, lat: float, lon: float, aqi: int, observed_at: Optional[int] = None):
+        with self._lock:
+            self._pending_aqi.append((*self._key(lat, lon), observed_at or int(time.time()), aqi))
+        self._maybe_flush()
+
+    # 기록할 때가 되면 작업자 스레드에서 저장 (이미 예약되어 있으면 다음 저장에 포함)
+    def _maybe_flush(self):
+        with self._lock:
+            pending = len(self._pending_forecasts) + len(self._pending_aqi)
+            due = pending >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval
+            if not due or self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forecast-history")
+            writer = self._writer
+        writer.submit(self._background_flush)
+
+    def _background_flush(self):
+        with self._lock:
+            self._flush_scheduled = False
+        self.flush()
+
+    # 대기 중인 기록 저장
+    def flush(self):
+        """
+        대기 중인 행을 한 트랜잭션으로 기록하고, 하루에 한 번 보관 기간이 지난 행을 삭제합니다.
+        저장에 실패해도 메일 발송에는 영향이 없도록 로그만 남깁니다.
+        """
+        with self._lock:
+            forecasts, self._pending_forecasts = self._pending_forecasts, []
+            aqi_rows, self._pending_aqi = self._pending_aqi, []
+            self._last_flush = time.monotonic()
+        if not forecasts and not aqi_rows:
+            return
+
+        with self._db_lock:
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.execute("BEGIN")
+                    connection.executemany(
+                        f"INSERT OR REPLACE INTO forecasts (lat_key, lon_key, {_FORECAST_COLUMNS}) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        forecasts
+                    )
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO air_quality (lat_key, lon_key, observed_at, aqi) VALUES (?, ?, ?, ?)",
+                        aqi_rows
+                    )
+                _history_rows.inc(len(forecasts), table="forecasts")
+                _history_rows.inc(len(aqi_rows), table="air_quality")
+
+                if self.retention and (self._last_prune is None or time.monotonic() - self._last_prune >= 86400):
+                    self._prune(connection)
+            except (sqlite3.Error, OSError) as e:
+                logging.error(f"예보 기록 저장 중 오류 발생 ({len(forecasts) + len(aqi_rows)}행): {e}")
+
+    # 보관 기간이 지난 기록 삭제 (연결 잠금을 잡은 상태에서 호출)
+    def _prune(self, connection: sqlite3.Connection):
+        self._last_prune = time.monotonic()
+        cutoff = int(time.time() - self.retention)
+        with connection:
+            connection.execute("BEGIN")
+            deleted = connection.execute("DELETE FROM forecasts WHERE observed_at < ?", (cutoff,)).rowcount
+            deleted += connection.execute("DELETE FROM air_quality WHERE observed_at < ?", (cutoff,)).rowcount
+        if deleted:
+            connection.execute("PRAGMA incremental_vacuum")
+            _history_pruned.inc(deleted)
+            logging.info(f"보관 기간이 지난 예보 기록 {deleted}행 삭제")
+
+    # 조회 실행 (대기 중인 기록을 먼저 저장)
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        self.flush()
+        with self._db_lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def _to_forecast(self, lat_key: int, lon_key: int, row: tuple) -> Forecast:
+        observed_at, timezone_offset, current_temp, current_weather_id, temp_max, temp_min, hourly = row
+        return Forecast(
+            lat_key / self.scale, lon_key / self.scale, timezone_offset,
+            observed_at, current_temp, current_weather_id, temp_max, temp_min,
+            *unpack_hourly(hourly, observed_at)
+        )
+
+    # 특정 시각 기준 가장 최근 예보
+    def get_forecast_at(self, lat: float, lon: float, timestamp: float) -> Optional[Forecast]:
+        """
+        timestamp 이전에 측정된 가장 최근 예보를 반환합니다.
+        예: get_forecast_at(lat, lon, now - 86400).temp_max 는 어제 같은 시각에 받은 당일 최고 온도입니다.
+
+        Args:
+            lat: 위도
+            lon: 경도
+            timestamp: 기준 시각 (Unix 시간)
+
+        Returns:
+            Optional[Forecast]: 예보 (기록이 없으면 None)
+        """
+        lat_key, lon_key = self._key(lat, lon)
+        rows = self._query(
+            f"SELECT {_FORECAST_COLUMNS} FROM forecasts "
+            "WHERE lat_key = ? AND lon_key = ? AND observed_at <= ? ORDER BY observed_at DESC LIMIT 1",
+            (lat_key, lon_key, int(timestamp))
+        )
+        return self._to_forecast(lat_key, lon_key, rows[0]) if rows else None
+
+    # 기간 내 예보 목록
+    def get_forecasts(self, lat: float, lon: float, since: float, until: Optional[float] = None) -> List[Forecast]:
+        """
+        since 이후 (until 이전까지) 측정된 예보를 시간순으로 반환합니다.
+        """
+        lat_key, lon_key = self._key(lat, lon)
+        rows = self._query(
+            f"SELECT {_FORECAST_COLUMNS} FROM forecasts "
+            "WHERE lat_key = ? AND lon_key = ? AND observed_at >= ? AND observed_at <= ? ORDER BY observed_at",
+            (lat_key, lon_key, int(since), int(until if until is not None else time.time()))
+        )
+        return [self._to_forecast(lat_key, lon_key, row) for row in rows]
+
+    # 기간 내 대기 질 지수 목록
+    def get_aqi_history(self, lat: float, lon: float, since: float, until: Optional[float] = None) -> List[Tuple[int, int]]:
+        """
+        since 이후 (until 이전까지) 기록된 (시각, 대기 질 지수) 를 시간순으로 반환합니다.
+        예: get_aqi_history(lat, lon, now - 7 * 86400) 는 최근 7일의 대기 질 지수입니다.
+        """
+        lat_key, lon_key = self._key(lat, lon)
+        return self._query(
+            "SELECT observed_at, aqi FROM air_quality "
+            "WHERE lat_key = ? AND lon_key = ? AND observed_at >= ? AND observed_at <= ? ORDER BY observed_at",
+            (lat_key, lon_key, int(since), int(until if until is not None else time.time()))
+        )
+
+    # 저장 후 연결 종료 (예약된 기록이 끝나기를 기다림)
+    def close(self):
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+        self.flush()
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
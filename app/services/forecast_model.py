@@ -0,0 +1,160 @@
+## 메일에 필요한 필드만 보관하는 예보 모델
+from array import array
+from typing import Any, Dict, List, Optional
+
+# 보관할 시간별 예보 개수 (메일에는 15시간 예보만 사용)
+FORECAST_HOURS = 15
+
+
+# 파싱된 예보 클래스
+class Forecast:
+    """
+    One Call 응답에서 메일에 사용하는 필드만 남긴 예보입니다.
+    시간별 예보는 dict 목록 대신 열(column) 단위의 array 로 보관하여,
+    많은 지역의 예보를 동시에 들고 있어도 메모리 사용량이 작습니다.
+    stale 은 요청에 실패하여 마지막으로 받은 예보를 대신 사용하는 경우에만 True 입니다 (캐시에는 저장하지 않음).
+    """
+
+    __slots__ = (
+        "lat", "lon", "timezone_offset",
+        "current_dt", "current_temp", "current_weather_id",
+        "temp_max", "temp_min",
+        "hourly_dt", "hourly_temp", "hourly_humidity", "hourly_weather_id",
+        "stale"
+    )
+
+    def __init__(
+        self,
+        lat: float,
+        lon: float,
+        timezone_offset: Optional[int],
+        current_dt: int,
+        current_temp: float,
+        current_weather_id: int,
+        temp_max: float,
+        temp_min: float,
+        hourly_dt: array,
+        hourly_temp: array,
+        hourly_humidity: array,
+        hourly_weather_id: array,
+        stale: bool = False
+    ):
+        self.lat = lat
+        self.lon = lon
+        self.timezone_offset = timezone_offset      # UTC 기준 시차 (초)
+        self.current_dt = current_dt                # 현재 날씨 측정 시각 (Unix 시간)
+        self.current_temp = current_temp            # 현재 온도
+        self.current_weather_id = current_weather_id  # 현재 날씨 코드
+        self.temp_max = temp_max                    # 오늘 최고 온도
+        self.temp_min = temp_min                    # 오늘 최저 온도
+        self.hourly_dt = hourly_dt                  # 시간별 Unix 시간 (array 'q')
+        self.hourly_temp = hourly_temp              # 시간별 온도 (array 'd')
+        self.hourly_humidity = hourly_humidity      # 시간별 습도 (array 'B')
+        self.hourly_weather_id = hourly_weather_id  # 시간별 날씨 코드 (array 'H')
+        self.stale = stale                          # 마지막으로 받은 예보를 대신 사용하는지 여부
+
+    def __len__(self) -> int:
+        return len(self.hourly_dt)
+
+    def __repr__(self) -> str:
+        return (
+            f"Forecast(lat={self.lat}, lon={self.lon}, current_dt={self.current_dt}, hours={len(self)}"
+            f"{', stale' if self.stale else ''})"
+        )
+
+    # 오래된 예보로 표시한 사본 (시간별 배열은 공유)
+    def as_stale(self) -> "Forecast":
+        return Forecast(
+            self.lat, self.lon, self.timezone_offset,
+            self.current_dt, self.current_temp, self.current_weather_id,
+            self.temp_max, self.temp_min,
+            self.hourly_dt, self.hourly_temp, self.hourly_humidity, self.hourly_weather_id,
+            stale=True
+        )
+
+    # 직렬화 (캐시 저장용)
+    def to_state(self) -> List[Any]:
+        """
+        JSON 으로 저장할 수 있는 목록으로 변환합니다.
+        """
+        return [
+            self.lat, self.lon, self.timezone_offset,
+            self.current_dt, self.current_temp, self.current_weather_id,
+            self.temp_max, self.temp_min,
+            self.hourly_dt.tolist(), self.hourly_temp.tolist(),
+            self.hourly_humidity.tolist(), self.hourly_weather_id.tolist()
+        ]
+
+    # 역직렬화
+    @classmethod
+    def from_state(cls, state: List[Any]) -> "Forecast":
+        """
+        to_state() 로 만든 목록에서 예보를 복원합니다.
+        """
+        (lat, lon, timezone_offset, current_dt, current_temp, current_weather_id,
+         temp_max, temp_min, hourly_dt, hourly_temp, hourly_humidity, hourly_weather_id) = state
+        return cls(
+            lat, lon, timezone_offset, current_dt, current_temp, current_weather_id,
+            temp_max, temp_min,
+            array("q", hourly_dt), array("d", hourly_temp),
+            array("B", hourly_humidity), array("H", hourly_weather_id)
+        )
+
+
+# 날씨 코드 추출 함수
+def _weather_id(entry: Dict[str, Any]) -> int:
+    weather = entry.get("weather")
+    return weather[0].get("id", 800) if weather else 800
+
+
+# One Call 응답 파싱 함수
+def parse_onecall(weather_data: Optional[Dict[str, Any]], hours: int = FORECAST_HOURS) -> Optional[Forecast]:
+    """
+    One Call 응답에서 메일에 필요한 필드만 추출합니다.
+
+    Args:
+        weather_data: One Call 응답 (JSON)
+        hours: 보관할 시간별 예보 개수
+
+    Returns:
+        Optional[Forecast]: 파싱된 예보 (응답이 비어 있으면 None)
+    """
+    if not weather_data:
+        return None
+
+    current = weather_data.get("current", {})
+    hourly = weather_data.get("hourly", [])[:hours]
+    daily = weather_data.get("daily", [])[0] if weather_data.get("daily") else {}
+    daily_temp = daily.get("temp", {}) if daily else {}
+
+    return Forecast(
+        lat=weather_data.get("lat", 0.0),
+        lon=weather_data.get("lon", 0.0),
+        timezone_offset=weather_data.get("timezone_offset"),
+        current_dt=current.get("dt", 0),
+        current_temp=current.get("temp", 0),
+        current_weather_id=_weather_id(current),
+        temp_max=daily_temp.get("max", 0),
+        temp_min=daily_temp.get("min", 0),
+        hourly_dt=array("q", [hour.get("dt", 0) for hour in hourly]),
+        hourly_temp=array("d", [hour.get("temp", 0) for hour in hourly]),
+        hourly_humidity=array("B", [min(255, max(0, int(hour.get("humidity", 0)))) for hour in hourly]),
+        hourly_weather_id=array("H", [_weather_id(hour) for hour in hourly])
+    )
+
+
+# Air Pollution 응답 파싱 함수
+def parse_air_quality(air_quality_data: Optional[Dict[str, Any]]) -> Optional[int]:
+    """
+    Air Pollution 응답에서 대기 질 지수(AQI)만 추출합니다.
+
+    Args:
+        air_quality_data: Air Pollution 응답 (JSON)
+
+    Returns:
+        Optional[int]: 대기 질 지수 (1-5, 없으면 None)
+    """
+    if air_quality_data and air_quality_data.get("list"):
+        aqi = air_quality_data["list"][0].get("main", {}).get("aqi", 0)
+        return aqi or None
+    return None
@@ -0,0 +1,191 @@
+## 프로세스 풀 이메일 렌더링
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from config.locations import Location
+from config.settings import RENDER_PROCESSES, RENDER_CHUNK_SIZE
+from services.email_service import EncodedMessage, cohort_messages, create_forecast_email
+from services.forecast_model import Forecast
+from utils.metrics import metrics
+
+# 렌더링 입력 (지역 이름, 예보, 대기 질 지수) - 예보는 array 로 보관되므로 작업자에게 작게 전달됨
+RenderInput = Tuple[str, Optional[Forecast], Optional[int]]
+
+# 렌더링 지표
+_chunk_seconds = metrics.histogram("weather_mail_render_chunk_seconds", "프로세스 풀 청크 렌더링 소요 시간 (초, 전달 포함)")
+_chunk_fallbacks = metrics.counter("weather_mail_render_chunk_fallbacks_total", "작업자 오류로 메인 프로세스에서 다시 렌더링한 청크 수")
+
+
+# 청크 렌더링 (작업자 프로세스에서 실행)
+def render_chunk(chunk: List[RenderInput]) -> List[EncodedMessage]:
+    """
+    여러 지역의 이메일을 렌더링하고 MIME 인코딩까지 마친 메시지 목록을 반환합니다.
+
+    Args:
+        chunk: 렌더링 입력 목록
+
+    Returns:
+        List[EncodedMessage]: 입력 순서대로 인코딩된 메시지
+    """
+    messages = []
+    for location_name, forecast, aqi in chunk:
+        content = create_forecast_email(forecast, aqi, location_name)
+        messages.append(EncodedMessage(content["subject"], content["body"]))
+    return messages
+
+
+# 프로세스 풀 렌더러 클래스
+class RenderPool:
+    """
+    이메일 렌더링(순수 파이썬, CPU 사용)을 여러 프로세스에 나눠 GIL 의 영향을 받지 않고 병렬로 처리합니다.
+
+    - 예보를 chunk_size 개씩 묶어 보내므로 프로세스 간 전달 비용이 청크 단위로 나뉩니다.
+    - 완료된 청크부터 결과를 돌려주므로 전송 단계는 모든 렌더링이 끝나기를 기다리지 않습니다.
+    - 동시에 진행 중인 청크 수를 작업자 수의 2배로 제한하여, 가져오기 속도가 빨라도 메모리가 일정합니다.
+    - 작업자는 spawn 방식으로 시작합니다 (HTTP/로그 스레드가 도는 프로세스를 fork 하지 않도록).
+    """
+
+    def __init__(self, processes: int, chunk_size: int = 32):
+        """
+        Args:
+            processes: 작업자 프로세스 수
+            chunk_size: 작업자에게 한 번에 보낼 지역 수
+        """
+        self.processes = max(1, processes)
+        self.chunk_size = max(1, chunk_size)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    # 청크 하나를 작업자에게 보내고 완료를 기다림 (실패 시 현재 프로세스에서 렌더링)
+    async def _run_chunk(self, chunk: List[RenderInput]) -> List[EncodedMessage]:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._executor, render_chunk, chunk)
+        except Exception as e:
+            _chunk_fallbacks.inc()
+            logging.error(f"렌더링 작업자 오류로 현재 프로세스에서 렌더링합니다 ({len(chunk)}개): {e}")
+            return render_chunk(chunk)
+        finally:
+            _chunk_seconds.observe(time.perf_counter() - start)
+
+    # 가져온 예보를 렌더링하여 완료되는 순서대로 반환
+    async def render(
+        self,
+        forecasts: AsyncIterator[Tuple[Location, Optional[Forecast], Optional[int]]]
+    ) -> AsyncIterator[Tuple[Location, EncodedMessage]]:
+        """
+        예보 스트림을 청크로 나눠 작업자에게 보내고, 렌더링된 메시지를 완료된 청크부터 반환합니다.
+        같은 예보로 이미 만든 메시지(cohort_messages)는 작업자에게 보내지 않고 바로 반환합니다.
+
+        Args:
+            forecasts: (지역, 예보, 대기 질 지수) 스트림 (iter_location_forecasts)
+
+        Yields:
+            Tuple[Location, EncodedMessage]: (지역, 인코딩된 메시지)
+        """
+        max_in_flight = self.processes * 2
+        in_flight: Dict[asyncio.Task, List[Tuple[Location, Optional[Forecast], Optional[int]]]] = {}
+        batch: List[Tuple[Location, Optional[Forecast], Optional[int]]] = []
+
+        def submit():
+            chunk = [(location.name, forecast, aqi) for location, forecast, aqi in batch]
+            in_flight[asyncio.ensure_future(self._run_chunk(chunk))] = batch[:]
+            batch.clear()
+
+        def collect(tasks):
+            for task in tasks:
+                items = in_flight.pop(task)
+                for (location, forecast, aqi), message in zip(items, task.result()):
+                    cohort_messages.put(location.name, forecast, aqi, message)
+                    yield location, message
+
+        try:
+            async for location, forecast, aqi in forecasts:
+                cached = cohort_messages.peek(location.name, forecast, aqi)
+                if cached is not None:
+                    yield location, cached
+                    continue
+
+                batch.append((location, forecast, aqi))
+                if len(batch) >= self.chunk_size:
+                    submit()
+
+                # 끝난 청크는 바로 반환하고, 진행 중인 청크가 많으면 하나가 끝날 때까지 대기
+                done = [task for task in in_flight if task.done()]
+                if not done and len(in_flight) >= max_in_flight:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for item in collect(done):
+                    yield item
+
+            if batch:
+                submit()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for item in collect(done):
+                    yield item
+        finally:
+            # 중간에 소비가 중단되면 남은 청크 취소
+            for task in in_flight:
+                task.cancel()
+
+    # 작업자 종료
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 공유 렌더러
+_pool: Optional[RenderPool] = None
+_pool_lock = threading.Lock()
+
+
+# 공유 렌더러 반환 함수 (RENDER_PROCESSES 가 0 이면 None)
+def get_render_pool() -> Optional[RenderPool]:
+    global _pool
+
+    if RENDER_PROCESSES <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool(RENDER_PROCESSES, RENDER_CHUNK_SIZE)
+        return _pool
+
+
+# 예보 스트림 렌더링 함수
+async def render_messages(
+    forecasts: AsyncIterator[Tuple[Location, Optional[Forecast], Optional[int]]]
+) -> AsyncIterator[Tuple[Location, EncodedMessage]]:
+    """
+    RENDER_PROCESSES 가 설정되어 있으면 프로세스 풀로, 아니면 현재 프로세스에서 렌더링합니다.
+
+    Args:
+        forecasts: (지역, 예보, 대기 질 지수) 스트림
+
+    Yields:
+        Tuple[Location, EncodedMessage]: (지역, 인코딩된 메시지)
+    """
+    pool = get_render_pool()
+    if pool is None:
+        async for location, forecast, aqi in forecasts:
+            yield location, cohort_messages.get(location.name, forecast, aqi)
+        return
+
+    async for item in pool.render(forecasts):
+        yield item
+
+
+# 공유 렌더러 종료 함수
+def close_render_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
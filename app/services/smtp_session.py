@@ -0,0 +1,240 @@
+## SMTP 연결 재사용 관리
+import logging
+import smtplib
+import threading
+import time
+from typing import List, Optional, Union
+
+from utils.metrics import metrics
+
+# 재연결이 필요한 SMTP 응답 코드 (421: 서비스 사용 불가, 연결 종료 예정)
+RECONNECT_CODES = {421}
+
+# SMTP 지표
+_connect_seconds = metrics.histogram("weather_mail_smtp_connect_seconds", "SMTP 서버 연결 소요 시간 (초)")
+_auth_seconds = metrics.histogram("weather_mail_smtp_auth_seconds", "SMTP 로그인 소요 시간 (초)")
+_send_seconds = metrics.histogram("weather_mail_smtp_send_seconds", "SMTP 메시지 전송 소요 시간 (초)")
+_bytes_sent = metrics.counter("weather_mail_smtp_bytes_sent_total", "SMTP 로 전송한 메시지 바이트 수")
+_connections = metrics.counter("weather_mail_smtp_connections_total", "새로 연 SMTP 연결 수")
+_retries = metrics.counter("weather_mail_smtp_retries_total", "연결 끊김/421 응답으로 재연결 후 재시도한 횟수")
+
+
+# SMTP 세션 관리 클래스 - 로그인된 연결을 여러 메시지에 재사용
+class SMTPSessionManager:
+    """
+    인증된 SMTP 연결을 열어 두고 여러 메시지 전송에 재사용합니다.
+
+    - 두 번째 메시지부터는 RSET 으로 트랜잭션을 초기화한 뒤 전송합니다.
+    - 연결이 끊기거나 421 응답을 받으면 다시 연결하여 한 번 재시도합니다.
+    - 세션당 메시지 수가 max_messages 에 도달하면 새 연결을 엽니다.
+    - idle_timeout 초 동안 사용하지 않은 연결은 백그라운드 타이머가 닫습니다.
+      (타이머는 메시지마다 새로 만들지 않고 하나만 두며, 만료 시 마지막 사용 시각을 확인합니다)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: Union[int, str],
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        timeout: float = 30,
+        idle_timeout: float = 60,
+        max_messages: int = 100
+    ):
+        """
+        Args:
+            host: SMTP 서버 주소
+            port: SMTP 포트 번호
+            user: 로그인 사용자 (없으면 로그인하지 않음)
+            password: 로그인 비밀번호
+            timeout: 소켓 타임아웃 (초)
+            idle_timeout: 유휴 연결을 닫기까지의 시간 (초, 0 이하이면 전송 직후 닫음)
+            max_messages: 한 연결로 보낼 최대 메시지 수
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.max_messages = max_messages
+
+        self._server: Optional[smtplib.SMTP] = None
+        self._messages_in_session = 0
+        self._last_used = 0.0
+        self._idle_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+        # 통계
+        self.connects = 0
+        self.messages_sent = 0
+
+    # 새 연결 생성 및 로그인
+    def _connect(self) -> smtplib.SMTP:
+        with _connect_seconds.time():
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.user:
+                with _auth_seconds.time():
+                    server.login(self.user, self.password)
+        except Exception:
+            self._quietly_close(server)
+            raise
+
+        self.connects += 1
+        _connections.inc()
+        self._messages_in_session = 0
+        logging.info(f"SMTP 세션 연결 ({self.host}:{self.port})")
+        return server
+
+    # 예외 없이 연결 닫기
+    @staticmethod
+    def _quietly_close(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    # 재사용 가능한 세션 반환
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        재사용 가능한 세션을 반환합니다. 기존 세션은 RSET 으로 상태를 초기화하며,
+        이 과정에서 연결이 끊긴 것이 확인되면 새로 연결합니다.
+        (미리 연결만 해 둔 세션은 초기화할 트랜잭션이 없으므로 RSET 없이 사용)
+        """
+        if self._server is not None and self._messages_in_session >= self.max_messages:
+            self._close_server()                                # 세션당 최대 메시지 수 도달
+
+        if self._server is not None and self._messages_in_session == 0:
+            return self._server
+
+        if self._server is not None:
+            try:
+                self._server.rset()                             # 이전 트랜잭션 초기화
+                return self._server
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPResponseException, OSError):
+                self._close_server()                            # 끊긴 연결 정리 후 재연결
+
+        self._server = self._connect()
+        return self._server
+
+    # 현재 세션 닫기
+    def _close_server(self):
+        if self._server is not None:
+            self._quietly_close(self._server)
+            self._server = None
+            self._messages_in_session = 0
+
+    # 유휴 타이머 시작 (이미 실행 중이면 그대로 두고 만료 시 마지막 사용 시각 기준으로 다시 설정)
+    def _schedule_idle_close(self):
+        if self.idle_timeout <= 0:
+            self._close_server()
+            return
+
+        if self._idle_timer is None:
+            self._start_idle_timer(self.idle_timeout)
+
+    def _start_idle_timer(self, delay: float):
+        self._idle_timer = threading.Timer(delay, self._on_idle_timer)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    # 유휴 타이머 만료 - 그사이 사용된 세션은 남은 시간만큼 타이머를 다시 설정
+    def _on_idle_timer(self):
+        with self._lock:
+            if self._idle_timer is not threading.current_thread():
+                return                                          # close() 로 취소된 타이머
+            self._idle_timer = None
+            if self._server is None:
+                return
+            remaining = self.idle_timeout - (time.monotonic() - self._last_used)
+            if remaining > 0:
+                self._start_idle_timer(remaining)
+            else:
+                self.close_idle()
+
+    # 미리 연결 및 로그인
+    def warm_up(self) -> bool:
+        """
+        첫 메시지를 보내기 전에 연결과 로그인을 미리 해 둡니다. 날씨 데이터를 가져오는 동안
+        별도 스레드에서 호출하면 첫 전송에서 연결 시간을 기다리지 않습니다.
+        실패해도 예외를 발생시키지 않으며, 전송 시 다시 연결합니다.
+
+        Returns:
+            bool: 연결 성공 여부
+        """
+        with self._lock:
+            if self._server is not None:
+                return True
+            try:
+                self._server = self._connect()
+            except Exception as e:
+                logging.warning(f"SMTP 미리 연결 실패 - 전송 시 다시 연결합니다: {e}")
+                return False
+            self._last_used = time.monotonic()
+            if self.idle_timeout > 0:
+                self._schedule_idle_close()
+            return True
+
+    # 메시지 전송
+    def send(self, from_addr: str, to_addrs: List[str], message: Union[str, bytes]) -> dict:
+        """
+        세션을 재사용하여 메시지를 전송합니다. 연결 끊김이나 421 응답은 재연결 후 한 번 재시도합니다.
+
+        Args:
+            from_addr: 보내는 주소
+            to_addrs: 받는 주소 목록
+            message: 전송할 메시지 (문자열 또는 바이트)
+
+        Returns:
+            dict: 거부된 수신자 정보 (smtplib.SMTP.sendmail 반환값)
+        """
+        with self._lock:
+            for attempt in range(2):
+                server = self._get_server()
+                try:
+                    with _send_seconds.time():
+                        refused = server.sendmail(from_addr, to_addrs, message)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    self._close_server()
+                    if attempt:
+                        raise
+                    _retries.inc()
+                except smtplib.SMTPResponseException as e:
+                    if e.smtp_code not in RECONNECT_CODES or attempt:
+                        raise
+                    self._close_server()
+                    _retries.inc()
+                    logging.warning(f"SMTP {e.smtp_code} 응답으로 재연결합니다.")
+
+            self._messages_in_session += 1
+            self.messages_sent += 1
+            _bytes_sent.inc(len(message.encode("utf-8")) if isinstance(message, str) else len(message))
+            self._last_used = time.monotonic()
+            self._schedule_idle_close()
+            return refused
+
+    # 유휴 세션 닫기
+    def close_idle(self):
+        """
+        idle_timeout 이상 사용하지 않은 세션을 닫습니다.
+        """
+        with self._lock:
+            if self._server is not None and time.monotonic() - self._last_used >= self.idle_timeout:
+                logging.info("유휴 SMTP 세션 종료")
+                self._close_server()
+
+    # 세션 종료
+    def close(self):
+        """
+        타이머를 취소하고 열려 있는 세션을 닫습니다.
+        """
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            self._close_server()
@@ -0,0 +1,346 @@
+## 구독자 저장소 (SQLite)
+# 관리 명령 (app 디렉토리에서, 스케줄러 실행 중에도 사용 가능):
+#   python -m services.subscriber_store add a@example.com 서울 --timezone Asia/Seoul --at 07:00
+#   python -m services.subscriber_store remove a@example.com [서울]
+#   python -m services.subscriber_store list [--location 서울]
+#   python -m services.subscriber_store import subscribers.txt     # 한 줄에 "이메일|지역|시간대|HH:MM" ('-' 이면 표준 입력)
+#   python -m services.subscriber_store import-env                 # SUBSCRIBERS 와 BCC_RECIPIENTS 를 저장소로 옮기기
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from config.settings import (
+    DEFAULT_TIMEZONE, SCHEDULE_TIME, SUBSCRIBER_DB, SUBSCRIBER_BATCH_SIZE, RECIPIENT, BCC_RECIPIENTS
+)
+from config.locations import get_locations
+from config.subscribers import Subscriber, get_subscribers, parse_subscribers, validate_subscriber
+from utils.metrics import metrics
+
+# 테이블 정의 - (지역, 발송 시각, 시간대, 이메일) 을 기본 키로 하는 WITHOUT ROWID 테이블이므로
+# 발송 그룹 목록과 그룹별 수신자 조회는 기본 키 인덱스의 범위 탐색으로 끝남
+# (이메일, 지역) 고유 인덱스는 구독자 추가(갱신)/삭제용
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscribers (
+    location TEXT NOT NULL,
+    send_time TEXT NOT NULL,
+    timezone TEXT NOT NULL,
+    email TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    PRIMARY KEY (location, send_time, timezone, email)
+) WITHOUT ROWID;
+CREATE UNIQUE INDEX IF NOT EXISTS subscribers_email ON subscribers (email, location);
+"""
+
+_UPSERT = (
+    "INSERT INTO subscribers (location, send_time, timezone, email, created_at) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (email, location) DO UPDATE SET send_time = excluded.send_time, timezone = excluded.timezone"
+)
+
+# 발송 그룹 (지역, 시간대, 현지 발송 시각) 과 구독자 수
+GroupCount = Tuple[Tuple[str, str, str], int]
+
+# 저장소 지표
+_subscriber_batches = metrics.counter("weather_mail_subscriber_batches_total", "구독자 저장소에서 읽은 수신자 배치 수")
+_subscriber_changes = metrics.counter("weather_mail_subscriber_changes_total", "구독자 저장소 변경 수 (action: added/removed)")
+
+
+# 구독자 저장소 클래스
+class SubscriberStore:
+    """
+    구독자(이메일, 지역, 시간대, 현지 발송 시각)를 SQLite 파일에 보관합니다.
+
+    - 발송 시에는 그룹별 수신자를 batch_size 명씩 키 순서로 나눠 읽으므로 전체 구독자를 메모리에 올리지 않습니다.
+      배치마다 새로 조회하므로 발송 중에 삭제된 구독자는 남은 배치에서 빠집니다.
+    - 다른 프로세스(관리 명령)가 변경한 내용은 changed() 로 확인할 수 있어, 스케줄러를 다시 시작하지 않고 반영합니다.
+    - 연결은 처음 사용할 때 엽니다.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500):
+        """
+        Args:
+            path: SQLite 파일 경로
+            batch_size: 한 번에 읽을 최대 수신자 수
+        """
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._version: Optional[Tuple[int, int]] = None
+
+    # 연결 열기 (처음 사용할 때 한 번)
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=10)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    # 구독자 추가 (같은 이메일과 지역이 있으면 시간대와 발송 시각 갱신)
+    def add(
+        self,
+        email: str,
+        location: str,
+        timezone: str = DEFAULT_TIMEZONE,
+        send_time: str = SCHEDULE_TIME
+    ) -> Subscriber:
+        """
+        Returns:
+            Subscriber: 저장된 구독자 정보
+
+        Raises:
+            ValueError: 구독자 정보가 올바르지 않은 경우
+        """
+        subscriber = Subscriber(email.strip(), location.strip(), timezone.strip(), send_time.strip())
+        error = validate_subscriber(subscriber)
+        if error:
+            raise ValueError(error)
+
+        self.add_many([subscriber])
+        return subscriber
+
+    # 구독자 여러 명 추가
+    def add_many(self, subscribers: Iterable[Subscriber]) -> int:
+        """
+        구독자를 batch_size 명씩 한 트랜잭션으로 추가(갱신)합니다. 올바르지 않은 항목은 로그를 남기고 건너뜁니다.
+
+        Args:
+            subscribers: 구독자 목록 (제너레이터도 가능)
+
+        Returns:
+            int: 추가(갱신)한 구독자 수
+        """
+        saved = 0
+        batch: List[tuple] = []
+        now = int(time.time())
+
+        for subscriber in subscribers:
+            error = validate_subscriber(subscriber)
+            if error:
+                logging.warning(f"구독자를 건너뜁니다 ({subscriber.email}, {subscriber.location}): {error}")
+                continue
+            batch.append((subscriber.location, subscriber.send_time, subscriber.timezone, subscriber.email, now))
+            if len(batch) >= self.batch_size:
+                saved += self._upsert(batch)
+                batch = []
+
+        if batch:
+            saved += self._upsert(batch)
+        return saved
+
+    def _upsert(self, rows: List[tuple]) -> int:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany(_UPSERT, rows)
+        _subscriber_changes.inc(len(rows), action="added")
+        return len(rows)
+
+    # 구독자 삭제
+    def remove(self, email: str, location: Optional[str] = None) -> int:
+        """
+        Args:
+            email: 수신자 이메일 주소
+            location: 지역 이름 (None 이면 모든 지역에서 삭제)
+
+        Returns:
+            int: 삭제한 구독 수
+        """
+        with self._lock:
+            connection = self._connect()
+            if location is None:
+                cursor = connection.execute("DELETE FROM subscribers WHERE email = ?", (email,))
+            else:
+                cursor = connection.execute("DELETE FROM subscribers WHERE email = ? AND location = ?", (email, location))
+        if cursor.rowcount:
+            _subscriber_changes.inc(cursor.rowcount, action="removed")
+        return cursor.rowcount
+
+    # 이메일로 구독 조회
+    def get(self, email: str) -> List[Subscriber]:
+        rows = self._query(
+            "SELECT email, location, timezone, send_time FROM subscribers WHERE email = ? ORDER BY location", (email,)
+        )
+        return [Subscriber(*row) for row in rows]
+
+    # 구독 수 (지역 지정 시 해당 지역만)
+    def count(self, location: Optional[str] = None) -> int:
+        if location is None:
+            return self._query("SELECT COUNT(*) FROM subscribers")[0][0]
+        return self._query("SELECT COUNT(*) FROM subscribers WHERE location = ?", (location,))[0][0]
+
+    # 발송 그룹 목록
+    def groups(self) -> List[GroupCount]:
+        """
+        (지역, 시간대, 현지 발송 시각) 별 구독자 수를 반환합니다. 스케줄러는 그룹 키만 보관합니다.
+
+        Returns:
+            List[GroupCount]: ((지역, 시간대, 발송 시각), 구독자 수) 목록
+        """
+        rows = self._query(
+            "SELECT location, timezone, send_time, COUNT(*) FROM subscribers GROUP BY location, send_time, timezone"
+        )
+        return [((location, timezone, send_time), count) for location, timezone, send_time, count in rows]
+
+    # 그룹별 수신자를 배치 단위로 읽기
+    def iter_recipients(
+        self,
+        location: str,
+        timezone: str,
+        send_time: str,
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[str]]:
+        """
+        발송 그룹의 수신자를 이메일 순서로 batch_size 명씩 반환합니다.
+        마지막으로 읽은 이메일 다음부터 다시 조회하므로 배치 사이에 잠금이나 커서를 유지하지 않습니다.
+
+        Args:
+            location: 지역 이름
+            timezone: IANA 시간대 이름
+            send_time: 현지 발송 시각 ("HH:MM")
+            batch_size: 배치 크기 (기본값: 저장소의 batch_size)
+
+        Yields:
+            List[str]: 수신자 목록
+        """
+        batch_size = batch_size or self.batch_size
+        last_email = ""
+        while True:
+            rows = self._query(
+                "SELECT email FROM subscribers WHERE location = ? AND send_time = ? AND timezone = ? AND email > ? "
+                "ORDER BY email LIMIT ?",
+                (location, send_time, timezone, last_email, batch_size)
+            )
+            if not rows:
+                return
+            _subscriber_batches.inc()
+            yield [email for email, in rows]
+            if len(rows) < batch_size:
+                return
+            last_email = rows[-1][0]
+
+    # 전체 구독자를 배치 단위로 읽기 (관리 명령용)
+    def iter_subscribers(self, location: Optional[str] = None) -> Iterator[Subscriber]:
+        last_key: Tuple[str, str, str, str] = ("", "", "", "")
+        while True:
+            rows = self._query(
+                "SELECT location, send_time, timezone, email FROM subscribers "
+                "WHERE (location, send_time, timezone, email) > (?, ?, ?, ?) AND (? IS NULL OR location = ?) "
+                "ORDER BY location, send_time, timezone, email LIMIT ?",
+                (*last_key, location, location, self.batch_size)
+            )
+            for row_location, send_time, timezone, email in rows:
+                yield Subscriber(email, row_location, timezone, send_time)
+            if len(rows) < self.batch_size:
+                return
+            last_key = rows[-1]
+
+    # 마지막 확인 이후 변경 여부 (다른 프로세스의 변경 포함)
+    def changed(self) -> bool:
+        """
+        처음 호출하거나, 이전 호출 이후 이 연결 또는 다른 연결이 구독자를 변경했으면 True 를 반환합니다.
+        """
+        with self._lock:
+            connection = self._connect()
+            version = (connection.execute("PRAGMA data_version").fetchone()[0], connection.total_changes)
+            changed, self._version = version != self._version, version
+        return changed
+
+    # 연결 종료
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# 파일의 구독자 읽기 ("이메일|지역|시간대|HH:MM", 한 줄에 하나 또는 쉼표로 구분)
+def _read_subscriber_lines(lines: Iterable[str]) -> Iterator[Subscriber]:
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield from parse_subscribers(line)
+
+
+# 환경 변수의 구독자 읽기 (SUBSCRIBERS, 그리고 BCC_RECIPIENTS 는 등록된 모든 지역의 SCHEDULE_TIME 구독자로)
+def _env_subscribers() -> Iterator[Subscriber]:
+    yield from get_subscribers()
+    recipients = dict.fromkeys(email for email in [RECIPIENT, *BCC_RECIPIENTS] if email)
+    for location in get_locations():
+        for email in recipients:
+            yield Subscriber(email, location.name, DEFAULT_TIMEZONE, SCHEDULE_TIME)
+
+
+# 관리 명령
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="구독자 저장소 관리")
+    parser.add_argument("--db", default=SUBSCRIBER_DB or "subscribers.db", help="SQLite 파일 경로 (기본값: SUBSCRIBER_DB)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = commands.add_parser("add", help="구독자 추가 (있으면 시간대와 발송 시각 갱신)")
+    add_parser.add_argument("email")
+    add_parser.add_argument("location")
+    add_parser.add_argument("--timezone", default=DEFAULT_TIMEZONE)
+    add_parser.add_argument("--at", dest="send_time", default=SCHEDULE_TIME, help="현지 발송 시각 (HH:MM)")
+
+    remove_parser = commands.add_parser("remove", help="구독자 삭제 (지역 생략 시 모든 지역)")
+    remove_parser.add_argument("email")
+    remove_parser.add_argument("location", nargs="?")
+
+    list_parser = commands.add_parser("list", help="구독자 목록")
+    list_parser.add_argument("--location")
+
+    import_parser = commands.add_parser("import", help="파일에서 구독자 추가")
+    import_parser.add_argument("file", help="'-' 이면 표준 입력")
+
+    commands.add_parser("import-env", help="SUBSCRIBERS/BCC_RECIPIENTS 환경 변수의 구독자 추가")
+    commands.add_parser("groups", help="발송 그룹별 구독자 수")
+
+    args = parser.parse_args(argv)
+    store = SubscriberStore(args.db, SUBSCRIBER_BATCH_SIZE)
+
+    try:
+        if args.command == "add":
+            subscriber = store.add(args.email, args.location, args.timezone, args.send_time)
+            print(f"추가: {subscriber.email} {subscriber.location} {subscriber.timezone} {subscriber.send_time}")
+        elif args.command == "remove":
+            print(f"삭제: {store.remove(args.email, args.location)}건")
+        elif args.command == "list":
+            for subscriber in store.iter_subscribers(args.location):
+                print("|".join(subscriber))
+        elif args.command == "import":
+            if args.file == "-":
+                saved = store.add_many(_read_subscriber_lines(sys.stdin))
+            else:
+                with open(args.file, "r", encoding="utf-8") as f:
+                    saved = store.add_many(_read_subscriber_lines(f))
+            print(f"추가(갱신): {saved}명")
+        elif args.command == "import-env":
+            print(f"추가(갱신): {store.add_many(_env_subscribers())}명")
+        elif args.command == "groups":
+            for (location, timezone, send_time), count in store.groups():
+                print(f"{location}|{timezone}|{send_time}\t{count}")
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
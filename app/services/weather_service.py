@@ -1,13 +1,316 @@
 ## 날씨 데이터 서비스
+import asyncio
+import logging
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Iterable, AsyncIterator
+
+from config.settings import (
+    OWM_API_KEY, OWM_ENDPOINT, AIR_POLLUTION_ENDPOINT, SEOUL_LAT, SEOUL_LON,
+    HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_POOL_SIZE, FETCH_CONCURRENCY,
+    WEATHER_CACHE_TTL, AIR_QUALITY_CACHE_TTL, CACHE_MAX_ENTRIES, CACHE_FILE, STALE_FORECAST_MAX_AGE,
+    HTTP_RETRIES, HTTP_RETRY_BASE_DELAY, HTTP_RETRY_MAX_DELAY, HTTP_HEDGE_PERCENTILE, HTTP_HEDGE_MIN_SAMPLES,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT, FORECAST_HISTORY_DB, FORECAST_HISTORY_RETENTION_DAYS,
+    OWM_CALLS_PER_MINUTE, OWM_CALLS_PER_DAY, OWM_DAILY_RESERVE, OWM_QUOTA_FILE
+)
+from config.locations import Location
+from services.forecast_model import Forecast, parse_onecall, parse_air_quality
+from utils.cache import ForecastCache
+from utils.metrics import metrics
+from utils.quota import QuotaBudget, QuotaExceededError, RequestCoalescer
+from utils.resilience import HALF_OPEN, CircuitBreaker, CircuitOpenError, LatencyTracker, backoff_delay
+
+if TYPE_CHECKING:
+    from services.forecast_history import ForecastHistory       # 예보 기록을 사용할 때만 가져옴 (sqlite3 포함)
+
+# 캐시에서 사용할 엔드포인트 이름
+WEATHER_CACHE_KEY = "onecall"
+AIR_QUALITY_CACHE_KEY = "air_pollution"
+
+# 파싱된 예보 캐시 (엔드포인트 + 반올림한 좌표 기준)
+# 원본 JSON 대신 필요한 필드만 남긴 Forecast / AQI 를 보관
+# 만료된 항목도 STALE_FORECAST_MAX_AGE 동안 남겨 두어 요청 실패 시 대신 사용
+forecast_cache = ForecastCache(
+    ttls={WEATHER_CACHE_KEY: WEATHER_CACHE_TTL, AIR_QUALITY_CACHE_KEY: AIR_QUALITY_CACHE_TTL},
+    max_entries=CACHE_MAX_ENTRIES,
+    path=CACHE_FILE,
+    codecs={WEATHER_CACHE_KEY: (Forecast.to_state, Forecast.from_state)},
+    stale_ttl=STALE_FORECAST_MAX_AGE
+)
+
+# 예보 기록 저장소 (FORECAST_HISTORY_DB 가 설정된 경우 처음 기록할 때 생성, get_forecast_history 로 사용)
+_forecast_history: Optional["ForecastHistory"] = None
+_history_lock = threading.Lock()
+
+# 요청 지표
+_fetch_seconds = metrics.histogram("weather_mail_fetch_seconds", "OpenWeatherMap API 요청 소요 시간 (초)")
+_fetch_errors = metrics.counter("weather_mail_fetch_errors_total", "OpenWeatherMap API 요청 실패 횟수")
+_http_retries = metrics.counter("weather_mail_http_retries_total", "OpenWeatherMap API 재시도 횟수")
+_http_hedged = metrics.counter("weather_mail_http_hedged_total", "응답이 늦어 보낸 보조 요청 수 (winner: primary/hedge)")
+_stale_fallbacks = metrics.counter("weather_mail_stale_fallbacks_total", "요청 실패로 마지막으로 받은 응답을 대신 사용한 횟수")
+
+# 엔드포인트별 회로 차단기와 응답 시간 추적
+_breakers = {
+    endpoint: CircuitBreaker(endpoint, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+    for endpoint in (WEATHER_CACHE_KEY, AIR_QUALITY_CACHE_KEY)
+}
+_latencies = {
+    endpoint: LatencyTracker(min_samples=HTTP_HEDGE_MIN_SAMPLES)
+    for endpoint in (WEATHER_CACHE_KEY, AIR_QUALITY_CACHE_KEY)
+}
+
+# 모든 요청이 함께 사용하는 호출 한도 (정기 발송 우선)
+api_quota = QuotaBudget(OWM_CALLS_PER_MINUTE, OWM_CALLS_PER_DAY, OWM_DAILY_RESERVE, OWM_QUOTA_FILE)
+
+# 같은 엔드포인트, 같은 좌표의 진행 중인 요청 합치기
+_coalescers = {
+    endpoint: RequestCoalescer(endpoint)
+    for endpoint in (WEATHER_CACHE_KEY, AIR_QUALITY_CACHE_KEY)
+}
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과, 서버 오류)
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# 공유 HTTP 클라이언트 (keep-alive 연결 재사용)
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_client_lock = threading.Lock()
+
+
+# 공유 세션 가져오기
+def _get_session() -> requests.Session:
+    """
+    모든 요청이 함께 사용하는 requests 세션을 반환합니다.
+    처음 호출될 때 연결 풀 크기를 설정한 세션을 생성합니다.
+
+    Returns:
+        requests.Session: 연결이 재사용되는 공유 세션
+    """
+    global _session
+
+    if _session is None:
+        with _client_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount("http://", adapter)           # 대기질 API (http)
+                session.mount("https://", adapter)          # One Call API (https)
+                _session = session
+    return _session
+
+
+# 요청 전용 스레드 풀 가져오기
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    블로킹 HTTP 요청을 이벤트 루프 밖에서 실행할 스레드 풀을 반환합니다.
+
+    Returns:
+        ThreadPoolExecutor: HTTP 요청 전용 스레드 풀
+    """
+    global _executor
+
+    if _executor is None:
+        with _client_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="owm-http")
+    return _executor
+
+
+# 블로킹 GET 요청을 스레드 풀에서 실행
+async def _get(url: str, params: Dict[str, Any], endpoint: str) -> requests.Response:
+    """
+    공유 세션으로 GET 요청을 보내되, 이벤트 루프를 막지 않도록 스레드 풀에서 실행합니다.
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        endpoint: 지표에 기록할 엔드포인트 이름
+
+    Returns:
+        requests.Response: 응답 객체
+    """
+    loop = asyncio.get_running_loop()
+    session = _get_session()
+    timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)     # (연결, 읽기) 타임아웃
+
+    # 스레드 풀 대기 시간을 제외한 실제 요청 시간 기록
+    def request() -> requests.Response:
+        start = time.perf_counter()
+        with _fetch_seconds.time(endpoint=endpoint):
+            response = session.get(url, params=params, timeout=timeout)
+        _latencies[endpoint].record(time.perf_counter() - start)
+        return response
+
+    return await loop.run_in_executor(_get_executor(), request)
+
+
+# 보조 요청(hedged request)을 포함한 GET 요청
+async def _hedged_get(url: str, params: Dict[str, Any], endpoint: str) -> requests.Response:
+    """
+    첫 요청이 최근 응답 시간의 HTTP_HEDGE_PERCENTILE 백분위보다 늦어지면 같은 요청을 하나 더 보내고,
+    먼저 도착한 응답을 사용합니다. 느린 연결 하나 때문에 전체 발송이 늦어지는 것을 막습니다.
+    (진행 중인 요청은 중단할 수 없으므로 늦게 도착한 응답은 버려지며, 그만큼 API 호출 수가 늘어납니다)
+    보조 요청은 호출 한도에 여유가 있을 때만 보냅니다 (분당 한도 대기 중이거나 정기 발송용 몫을 써야 하면 보내지 않음).
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        endpoint: 엔드포인트 이름
+
+    Returns:
+        requests.Response: 먼저 도착한 응답
+    """
+    delay = _latencies[endpoint].percentile(HTTP_HEDGE_PERCENTILE) if HTTP_HEDGE_PERCENTILE > 0 else None
+    if delay is None:
+        return await _get(url, params, endpoint)
+
+    primary = asyncio.ensure_future(_get(url, params, endpoint))
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done or not api_quota.try_acquire():
+        return await primary
+
+    hedge = asyncio.ensure_future(_get(url, params, endpoint))
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    _http_hedged.inc(endpoint=endpoint, winner="primary" if task is primary else "hedge")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+# 요청 실패 사유 (HTTP 상태 코드 또는 예외 이름)
+def _error_reason(error: Exception) -> str:
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, QuotaExceededError):
+        return "quota"
+    if isinstance(error, requests.exceptions.InvalidJSONError):
+        return "invalid_json"
+    if isinstance(error, requests.RequestException) and error.response is not None:
+        return str(error.response.status_code)
+    return type(error).__name__
+
+
+# 재시도할 오류인지 확인 (연결/타임아웃 오류, 429, 5xx - 손상된 응답 본문은 제외)
+def _is_retryable(error: requests.RequestException) -> bool:
+    if isinstance(error, requests.exceptions.InvalidJSONError):
+        return False
+    if error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUS
+    return True
+
+
+# 재시도와 회로 차단기를 적용한 JSON 요청
+async def _fetch_json(url: str, params: Dict[str, Any], endpoint: str) -> Dict[str, Any]:
+    """
+    연결 오류, 타임아웃, 429/5xx 응답이면 지수 백오프(jitter 포함)로 HTTP_RETRIES 번까지 재시도합니다.
+    응답 JSON 을 해석할 수 없으면 재시도하지 않고 InvalidJSONError 를 발생시킵니다.
+    엔드포인트의 회로가 열려 있으면 요청하지 않고 바로 CircuitOpenError 를 발생시킵니다.
+    재시도를 포함한 모든 호출은 api_quota 에서 한도를 차감하며, 분당 한도가 부족하면 우선순위 순서로 기다립니다.
+
+    Args:
+        url: 요청 URL
+        params: 쿼리 파라미터
+        endpoint: 엔드포인트 이름
+
+    Returns:
+        Dict[str, Any]: 응답 JSON
+
+    Raises:
+        CircuitOpenError: 회로가 열려 있는 경우
+        QuotaExceededError: 일일 호출 한도를 모두 사용한 경우
+        requests.RequestException: 재시도 후에도 실패한 경우
+    """
+    # 첫 호출 한도는 회로 확인 전에 획득 (확인 중 상태의 시험 요청이 한도 대기로 멈추지 않도록)
+    try:
+        await api_quota.acquire()
+    except QuotaExceededError:
+        _fetch_errors.inc(endpoint=endpoint, reason="quota")
+        raise
+
+    breaker = _breakers[endpoint]
+    if not breaker.allow():
+        api_quota.release()
+        _fetch_errors.inc(endpoint=endpoint, reason="circuit_open")
+        raise CircuitOpenError(f"{endpoint} 요청이 일시적으로 차단되었습니다 (연속 실패 {breaker.failures}회)")
+
+    # 결과(성공/실패)를 회로 차단기에 기록했는지 여부
+    settled = False
+    try:
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                if attempt:
+                    await api_quota.acquire()
+                response = await _hedged_get(url, params, endpoint)
+                response.raise_for_status()             # 요청 실패 시 예외 발생
+                try:
+                    data = response.json()
+                except ValueError as e:
+                    # 손상된 응답 본문은 일시적인 오류가 아니므로 재시도하지 않음 (호출 한도 절약)
+                    logging.warning(f"{endpoint} 응답 JSON 파싱 실패 - 재시도하지 않습니다: {e}")
+                    raise requests.exceptions.InvalidJSONError(f"응답 JSON 파싱 실패: {e}", response=response) from e
+                breaker.record_success()
+                settled = True
+                return data
+
+            except requests.RequestException as e:
+                _fetch_errors.inc(endpoint=endpoint, reason=_error_reason(e))
+                if not _is_retryable(e):
+                    breaker.record_success()            # 서버는 응답했으므로 (예: 잘못된 API 키) 차단하지 않음
+                    settled = True
+                    raise
+                if attempt == HTTP_RETRIES or not breaker.allow():
+                    breaker.record_failure()
+                    settled = True
+                    raise
+
+                # 서버가 Retry-After 를 보내면 그 시간 이상 대기
+                delay = backoff_delay(attempt, HTTP_RETRY_BASE_DELAY, HTTP_RETRY_MAX_DELAY)
+                retry_after = e.response.headers.get("Retry-After", "") if e.response is not None else ""
+                if retry_after.isdigit():
+                    delay = max(delay, min(float(retry_after), HTTP_RETRY_MAX_DELAY))
+                _http_retries.inc(endpoint=endpoint)
+                await asyncio.sleep(delay)
+
+            except QuotaExceededError:
+                # 재시도할 한도가 없으면 직전 실패로 처리
+                _fetch_errors.inc(endpoint=endpoint, reason="quota")
+                breaker.record_failure()
+                settled = True
+                raise
+
+    except asyncio.CancelledError:
+        # 취소는 API 실패가 아니므로 세지 않지만, 시험 요청이었다면 다시 차단하여 다음 시험 요청을 허용
+        if not settled and breaker.state == HALF_OPEN:
+            breaker.record_failure()
+        raise
+
+    except BaseException:
+        # 예상하지 못한 오류 - 결과를 남기지 않으면 시험 요청이 끝나지 않으므로 실패로 기록
+        if not settled:
+            breaker.record_failure()
+        raise
 
-from config.settings import OWM_API_KEY, OWM_ENDPOINT, AIR_POLLUTION_ENDPOINT, SEOUL_LAT, SEOUL_LON
 
 # 날씨 데이터 가져오기 
-async def get_weather_data() -> Dict[str, Any]:
+async def get_weather_data(lat: float = SEOUL_LAT, lon: float = SEOUL_LON) -> Dict[str, Any]:
     """
-    OpenWeatherMap API를 사용하여 서울의 날씨 데이터를 가져옵니다.
+    OpenWeatherMap API를 사용하여 지정한 좌표(기본값: 서울)의 날씨 데이터를 가져옵니다.
+    
+    Args:
+        lat: 위도
+        lon: 경도
     
     Returns:
         Dict[str, Any]: 날씨 데이터 (JSON 형식)
@@ -16,28 +319,30 @@ async def get_weather_data() -> Dict[str, Any]:
     """
     # 날씨 요청 파라미터 설정 
     weather_params = {
-        "lat": SEOUL_LAT,                       # 서울 위도 
-        "lon": SEOUL_LON,                       # 서울 경도 
+        "lat": lat,                             # 위도 
+        "lon": lon,                             # 경도 
         "appid": OWM_API_KEY,                   # OpenWeatherMap API 키 
         "exclude": "minutely",                  # 분 단위 데이터 제외 
         "units": "metric"                       # 섭씨 온도로 변환
     }
     
     try:
-        # 날씨 데이터 요청 
-        response = requests.get(OWM_ENDPOINT, params=weather_params)
-        response.raise_for_status()             # 요청 실패 시 예외 발생 
-        return response.json()                  # JSON 형식으로 반환 
+        # 날씨 데이터 요청 (실패 시 재시도)
+        return await _fetch_json(OWM_ENDPOINT, weather_params, WEATHER_CACHE_KEY)
     
-    except requests.RequestException as e:
+    except (requests.RequestException, CircuitOpenError, QuotaExceededError) as e:
         print(f"날씨 데이터 가져오기 실패: {e}")      # 오류 메시지 출력 
         return {}                               # 빈 딕셔너리 반환 
     
 
 # 대기 질 데이터 가져오기 
-async def get_air_quality() -> Optional[Dict[str, Any]]:
+async def get_air_quality(lat: float = SEOUL_LAT, lon: float = SEOUL_LON) -> Optional[Dict[str, Any]]:
     """
-    OpenWeatherMap API를 사용하여 서울의 대기 질 데이터를 가져옵니다.
+    OpenWeatherMap API를 사용하여 지정한 좌표(기본값: 서울)의 대기 질 데이터를 가져옵니다.
+    
+    Args:
+        lat: 위도
+        lon: 경도
     
     Returns:
         Optional[Dict[str, Any]]: 대기 질 데이터 (JSON 형식)
@@ -46,18 +351,214 @@ async def get_air_quality() -> Optional[Dict[str, Any]]:
     """
     # 대기 질 요청 파라미터 설정 
     air_params = {
-        "lat": SEOUL_LAT,                           # 서울 위도 
-        "lon": SEOUL_LON,                           # 서울 경도 
+        "lat": lat,                                 # 위도 
+        "lon": lon,                                 # 경도 
         "appid": OWM_API_KEY                        # OpenWeatherMap API 키 
     }
     
     try:
-        # 대기 질 데이터 요청
-        response = requests.get(AIR_POLLUTION_ENDPOINT, params=air_params)
-        if response.status_code != 200:
-            return None                             # 응답 코드가 200이 아닐 경우 None 반환 
-        return response.json()                      # JSON 형식으로 반환 
+        # 대기 질 데이터 요청 (실패 시 재시도)
+        return await _fetch_json(AIR_POLLUTION_ENDPOINT, air_params, AIR_QUALITY_CACHE_KEY)
     
-    except requests.RequestException as e:
+    except (requests.RequestException, CircuitOpenError, QuotaExceededError) as e:
         print(f"대기질 데이터 가져오기 실패: {e}")         # 오류 메시지 출력 
-        return None                                 # None 반환 
\ No newline at end of file
+        return None                                 # None 반환 
+
+
+# 파싱된 예보 가져오기
+async def get_forecast(lat: float = SEOUL_LAT, lon: float = SEOUL_LON) -> Optional[Forecast]:
+    """
+    날씨 데이터를 가져와 메일에 필요한 필드만 남긴 예보로 변환합니다.
+    원본 JSON 은 변환 직후 버려지며, 캐시에는 변환된 예보만 보관됩니다.
+    요청에 실패하면 마지막으로 받은 예보를 stale=True 로 표시하여 대신 반환합니다.
+    같은 좌표의 요청이 이미 진행 중이면 새로 요청하지 않고 그 결과를 함께 사용합니다.
+
+    Args:
+        lat: 위도
+        lon: 경도
+
+    Returns:
+        Optional[Forecast]: 파싱된 예보 (실패하고 대신 사용할 예보도 없으면 None)
+    """
+    # 캐시된 예보가 있으면 바로 반환
+    cached = forecast_cache.get(WEATHER_CACHE_KEY, lat, lon)
+    if cached is not None:
+        return cached
+
+    key = forecast_cache.make_key(WEATHER_CACHE_KEY, lat, lon)
+    return await _coalescers[WEATHER_CACHE_KEY].run(key, lambda: _load_forecast(lat, lon))
+
+
+# 예보 요청 및 캐시/기록 저장 (실패 시 마지막으로 받은 예보로 대체)
+async def _load_forecast(lat: float, lon: float) -> Optional[Forecast]:
+    forecast = parse_onecall(await get_weather_data(lat, lon))
+    if forecast is not None:
+        forecast_cache.set(WEATHER_CACHE_KEY, lat, lon, forecast)
+        history = get_forecast_history()
+        if history is not None:
+            history.record_forecast(lat, lon, forecast)
+        return forecast
+
+    # 마지막으로 받은 예보로 대체
+    stale = forecast_cache.get_stale(WEATHER_CACHE_KEY, lat, lon)
+    if stale is None:
+        return None
+    forecast, age = stale
+    _stale_fallbacks.inc(endpoint=WEATHER_CACHE_KEY)
+    logging.warning(f"날씨 데이터 요청 실패 - {age / 60:.0f}분 전에 받은 예보를 대신 사용합니다 ({lat}, {lon})")
+    return forecast.as_stale()
+
+
+# 대기 질 지수 가져오기
+async def get_aqi(lat: float = SEOUL_LAT, lon: float = SEOUL_LON) -> Optional[int]:
+    """
+    대기 질 데이터를 가져와 대기 질 지수(AQI)만 반환합니다.
+
+    Args:
+        lat: 위도
+        lon: 경도
+
+    Returns:
+        Optional[int]: 대기 질 지수 (1-5, 실패하고 대신 사용할 지수도 없으면 None)
+    """
+    # 캐시된 지수가 있으면 바로 반환
+    cached = forecast_cache.get(AIR_QUALITY_CACHE_KEY, lat, lon)
+    if cached is not None:
+        return cached
+
+    key = forecast_cache.make_key(AIR_QUALITY_CACHE_KEY, lat, lon)
+    return await _coalescers[AIR_QUALITY_CACHE_KEY].run(key, lambda: _load_aqi(lat, lon))
+
+
+# 대기 질 지수 요청 및 캐시/기록 저장 (실패 시 마지막으로 받은 지수로 대체)
+async def _load_aqi(lat: float, lon: float) -> Optional[int]:
+    aqi = parse_air_quality(await get_air_quality(lat, lon))
+    if aqi is not None:
+        forecast_cache.set(AIR_QUALITY_CACHE_KEY, lat, lon, aqi)
+        history = get_forecast_history()
+        if history is not None:
+            history.record_aqi(lat, lon, aqi)
+        return aqi
+
+    # 마지막으로 받은 지수로 대체
+    stale = forecast_cache.get_stale(AIR_QUALITY_CACHE_KEY, lat, lon)
+    if stale is None:
+        return None
+    _stale_fallbacks.inc(endpoint=AIR_QUALITY_CACHE_KEY)
+    return stale[0]
+
+
+# 예보와 대기 질 지수 동시에 가져오기
+async def fetch_weather_bundle(
+    lat: float = SEOUL_LAT,
+    lon: float = SEOUL_LON
+) -> Tuple[Optional[Forecast], Optional[int]]:
+    """
+    날씨 데이터와 대기 질 데이터를 동시에 요청하여 파싱된 예보와 대기 질 지수로 반환합니다.
+    전체 소요 시간은 두 요청 시간의 합이 아니라 더 느린 쪽의 시간에 가까워집니다.
+
+    Args:
+        lat: 위도
+        lon: 경도
+
+    Returns:
+        Tuple[Optional[Forecast], Optional[int]]: (예보, 대기 질 지수)
+    """
+    forecast, aqi = await asyncio.gather(get_forecast(lat, lon), get_aqi(lat, lon))
+    return forecast, aqi
+
+
+# 여러 지역의 날씨 데이터 가져오기
+async def iter_location_forecasts(
+    locations: Iterable[Location],
+    concurrency: int = FETCH_CONCURRENCY
+) -> AsyncIterator[Tuple[Location, Optional[Forecast], Optional[int]]]:
+    """
+    여러 지역의 예보/대기 질 지수를 제한된 동시성으로 가져와 완료되는 순서대로 반환합니다.
+    동시에 진행되는 지역 수는 concurrency 이하로 유지되고, 실제 열린 연결 수는
+    HTTP_POOL_SIZE 로 제한되므로 지역 수가 많아도 소켓과 메모리 사용량이 일정합니다.
+
+    Args:
+        locations: 지역 목록 (제너레이터도 가능)
+        concurrency: 동시에 처리할 최대 지역 수
+
+    Yields:
+        Tuple[Location, Optional[Forecast], Optional[int]]: (지역, 예보, 대기 질 지수)
+    """
+    location_iter = iter(locations)
+    pending: Dict[asyncio.Task, Location] = {}
+
+    # 대기 중인 작업이 concurrency 개가 될 때까지 새 지역 요청 시작
+    def fill():
+        while len(pending) < max(1, concurrency):
+            location = next(location_iter, None)
+            if location is None:
+                return
+            task = asyncio.ensure_future(fetch_weather_bundle(location.lat, location.lon))
+            pending[task] = location
+
+    fill()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                location = pending.pop(task)
+                forecast, aqi = task.result()
+                yield location, forecast, aqi
+            fill()
+    finally:
+        # 중간에 소비가 중단되면 남은 요청 취소
+        for task in pending:
+            task.cancel()
+
+
+# 예보 기록 저장소 (처음 사용할 때 생성)
+def get_forecast_history() -> Optional["ForecastHistory"]:
+    """
+    예보 기록 저장소를 반환합니다. 처음 호출할 때 생성하며 (sqlite3 모듈도 이때 가져옴),
+    FORECAST_HISTORY_DB 가 설정되지 않았으면 None 을 반환합니다.
+    새로 가져온 예보와 대기 질 지수만 기록하며, 캐시와 같은 좌표 반올림을 사용합니다.
+    """
+    global _forecast_history
+
+    if not FORECAST_HISTORY_DB:
+        return None
+    with _history_lock:
+        if _forecast_history is None:
+            from services.forecast_history import ForecastHistory
+            _forecast_history = ForecastHistory(
+                FORECAST_HISTORY_DB, FORECAST_HISTORY_RETENTION_DAYS, precision=forecast_cache.precision
+            )
+        return _forecast_history
+
+
+# 예보 기록 저장 (저장소를 사용한 경우에만)
+def flush_forecast_history():
+    if _forecast_history is not None:
+        _forecast_history.flush()
+
+
+# 예보 기록 저장 후 저장소 종료
+def close_forecast_history():
+    global _forecast_history
+
+    with _history_lock:
+        history, _forecast_history = _forecast_history, None
+    if history is not None:
+        history.close()
+
+
+# HTTP 클라이언트 종료
+def close_http_client():
+    """
+    공유 세션과 스레드 풀을 정리합니다. 서비스 종료 시 호출합니다.
+    """
+    global _session, _executor
+
+    with _client_lock:
+        if _session is not None:
+            _session.close()                        # 유지 중인 연결 닫기
+            _session = None
+        if _executor is not None:
+            _executor.shutdown(wait=False)          # 스레드 풀 종료
+            _executor = None
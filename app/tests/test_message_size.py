@@ -0,0 +1,55 @@
+## 압축 HTML 이메일 내용 테스트
+# 압축(compact_html/share_styles) 전후로 읽는 사람이 보는 내용이 같은지 확인합니다.
+# 실행 방법 (app 디렉토리에서): python -m unittest discover -s tests -t .
+import email
+import unittest
+from unittest import mock
+
+from benchmarks.payloads import FIXTURE_KINDS, load_fixture
+from services import email_service
+from utils.html_compact import html_to_text
+
+# 예보 본문이 있는 응답 종류 ("empty" 는 압축하지 않는 짧은 오류 안내만 생성)
+FORECAST_KINDS = tuple(kind for kind in FIXTURE_KINDS if kind != "empty")
+
+
+# 고정된 예보로 이메일 내용 생성 (compact: 압축 사용 여부)
+def _render(kind: str, compact: bool) -> dict:
+    weather_data, air_quality_data = load_fixture(kind)
+    with mock.patch.object(email_service, "EMAIL_COMPACT_HTML", compact), \
+            mock.patch.object(email_service, "EMAIL_SHARED_STYLES", True):
+        return email_service.create_email_content(weather_data, air_quality_data, "서울")
+
+
+class CompactHtmlContentTest(unittest.TestCase):
+    def test_compact_body_has_same_text(self):
+        for kind in FIXTURE_KINDS:
+            with self.subTest(kind=kind):
+                original = _render(kind, compact=False)["body"]
+                compact = _render(kind, compact=True)["body"]
+                self.assertEqual(html_to_text(original), html_to_text(compact))
+
+    def test_compact_body_is_smaller(self):
+        for kind in FORECAST_KINDS:
+            with self.subTest(kind=kind):
+                original = _render(kind, compact=False)["body"]
+                compact = _render(kind, compact=True)["body"]
+                self.assertLess(len(compact.encode("utf-8")), len(original.encode("utf-8")))
+
+    def test_text_alternative_present(self):
+        for kind in FIXTURE_KINDS:
+            with self.subTest(kind=kind):
+                original = _render(kind, compact=False)
+                compact = _render(kind, compact=True)
+                with mock.patch.object(email_service, "EMAIL_TEXT_ALTERNATIVE", True):
+                    message = email_service.EncodedMessage(compact["subject"], compact["body"])
+                parsed = email.message_from_bytes(message.for_recipients(["someone@example.com"]))
+                parts = {part.get_content_type(): part for part in parsed.walk()}
+                self.assertIn("text/plain", parts)
+                self.assertIn("text/html", parts)
+                text = parts["text/plain"].get_payload(decode=True).decode("utf-8")
+                self.assertEqual(text, html_to_text(original["body"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
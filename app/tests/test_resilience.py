@@ -0,0 +1,107 @@
+## 회로 차단기 시험 요청 및 재시도 테스트
+# 실행 방법 (app 디렉토리에서): python -m unittest discover -s tests -t .
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from services import weather_service
+from utils.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+# 회로를 열고 reset_timeout 이 지난 상태로 만들기
+def _expired_open_breaker(name: str, reset_timeout: float = 60.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(name, failure_threshold=1, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    breaker._opened_at = time.monotonic() - reset_timeout
+    return breaker
+
+
+class CircuitBreakerTrialTest(unittest.TestCase):
+    def test_half_open_allows_single_trial(self):
+        breaker = _expired_open_breaker("test")
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow())
+
+    def test_abandoned_trial_allows_new_trial_after_reset_timeout(self):
+        breaker = _expired_open_breaker("test")
+        self.assertTrue(breaker.allow())
+        breaker._trial_at = time.monotonic() - breaker.reset_timeout   # 시험 요청이 결과 없이 끝남
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+
+
+class FetchJsonCancelledTrialTest(unittest.TestCase):
+    def setUp(self):
+        self.breaker = _expired_open_breaker(weather_service.WEATHER_CACHE_KEY)
+        patcher = mock.patch.dict(weather_service._breakers, {weather_service.WEATHER_CACHE_KEY: self.breaker})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_cancelled_fetch(self):
+        started = asyncio.Event()
+
+        async def hanging_get(url, params, endpoint):
+            started.set()
+            await asyncio.Event().wait()
+
+        async def scenario():
+            with mock.patch.object(weather_service, "_hedged_get", hanging_get):
+                task = asyncio.create_task(
+                    weather_service._fetch_json("http://example.invalid", {}, weather_service.WEATHER_CACHE_KEY)
+                )
+                await started.wait()
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(scenario())
+
+    def test_cancelled_trial_reopens_circuit(self):
+        self._run_cancelled_fetch()
+        self.assertEqual(self.breaker.state, OPEN)
+
+        # reset_timeout 이 지나면 다시 시험 요청을 허용
+        self.breaker._opened_at = time.monotonic() - self.breaker.reset_timeout
+        self.assertTrue(self.breaker.allow())
+
+    def test_cancelled_request_does_not_count_as_failure_when_closed(self):
+        self.breaker.record_success()
+        self._run_cancelled_fetch()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.failures, 0)
+
+
+class FetchJsonInvalidBodyTest(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(weather_service.WEATHER_CACHE_KEY, failure_threshold=1, reset_timeout=60.0)
+        patcher = mock.patch.dict(weather_service._breakers, {weather_service.WEATHER_CACHE_KEY: self.breaker})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_malformed_json_is_not_retried_or_counted_as_failure(self):
+        calls = []
+
+        async def malformed_get(url, params, endpoint):
+            calls.append(url)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"<html>not json</html>"
+            return response
+
+        async def scenario():
+            with mock.patch.object(weather_service, "_hedged_get", malformed_get):
+                with self.assertRaises(requests.exceptions.InvalidJSONError):
+                    await weather_service._fetch_json("http://example.invalid", {}, weather_service.WEATHER_CACHE_KEY)
+
+        asyncio.run(scenario())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.failures, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
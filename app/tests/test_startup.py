@@ -0,0 +1,31 @@
+## 즉시 1회 발송(--now) 시작 시간 예산 테스트
+# python -X importtime 으로 oneshot 을 가져와 로드 시간과 가져온 모듈을 확인합니다.
+# 실행 방법 (app 디렉토리에서): python -m unittest discover -s tests -t .
+import unittest
+
+from benchmarks.startup_benchmark import DEFAULT_BUDGET_MS, FORBIDDEN_MODULES, import_profile
+
+# 측정 반복 횟수 (최솟값 사용 - 일시적인 부하로 인한 오탐 방지)
+REPEAT = 3
+
+
+class OneshotStartupTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        samples = [import_profile("oneshot") for _ in range(REPEAT)]
+        cls.load_ms = min(ms for ms, _ in samples)
+        cls.modules = set(samples[0][1])
+
+    def test_import_time_within_budget(self):
+        self.assertLessEqual(
+            self.load_ms, DEFAULT_BUDGET_MS,
+            f"oneshot 로드 시간이 예산을 넘었습니다: {self.load_ms:.1f}ms > {DEFAULT_BUDGET_MS:.0f}ms"
+        )
+
+    def test_forbidden_modules_not_imported(self):
+        imported = [name for name in FORBIDDEN_MODULES if name in self.modules]
+        self.assertEqual(imported, [], f"oneshot 이 가져오지 않아야 할 모듈: {', '.join(imported)}")
+
+
+if __name__ == "__main__":
+    unittest.main()
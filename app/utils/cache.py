@@ -0,0 +1,228 @@
+## 날씨 API 응답 캐시
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.metrics import metrics
+
+# 디스크 저장 시 값 변환 함수 쌍 (값 -> JSON 호환 값, JSON 호환 값 -> 값)
+Codec = Tuple[Callable[[Any], Any], Callable[[Any], Any]]
+
+# 캐시 조회 지표
+_cache_requests = metrics.counter("weather_mail_cache_requests_total", "API 응답 캐시 조회 횟수 (result: hit/miss/stale)")
+
+
+# TTL + LRU 캐시 클래스 - 엔드포인트와 좌표별로 API 응답을 보관
+class ForecastCache:
+    """
+    엔드포인트와 반올림한 좌표를 키로 API 응답을 보관하는 캐시입니다.
+
+    - 엔드포인트별로 유효 시간(TTL)이 다르게 적용됩니다.
+    - 메모리에는 최대 max_entries 개까지 보관하며, 넘치면 가장 오래 사용하지 않은 항목을 제거합니다.
+    - stale_ttl 이 지정되면 만료된 항목도 그 시간 동안 남겨 두어, 요청이 실패했을 때 get_stale() 로 대신 사용할 수 있습니다.
+    - path 가 지정되면 save() 시 디스크에 저장하고, 생성 시 만료되지 않은 항목을 다시 불러옵니다.
+      JSON 으로 바로 저장할 수 없는 값은 엔드포인트별 codecs 로 변환합니다.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        precision: int = 2,
+        codecs: Optional[Dict[str, Codec]] = None,
+        stale_ttl: float = 0
+    ):
+        """
+        Args:
+            ttls: 엔드포인트 이름별 유효 시간 (초)
+            max_entries: 메모리에 보관할 최대 항목 수
+            path: 디스크 저장 파일 경로 (None 이면 메모리에만 보관)
+            precision: 좌표 반올림 자릿수 (2 -> 약 1km)
+            codecs: 엔드포인트별 (인코딩, 디코딩) 함수 - 디스크 저장/불러오기에만 사용
+            stale_ttl: 만료 후에도 get_stale() 용으로 보관할 시간 (초)
+        """
+        self.ttls = ttls
+        self.max_entries = max_entries
+        self.path = path
+        self.precision = precision
+        self.codecs = codecs or {}
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()   # 키 -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+        if self.path:
+            self.load()
+
+    # 캐시 키 생성
+    def make_key(self, endpoint: str, lat: float, lon: float) -> str:
+        return f"{endpoint}:{lat:.{self.precision}f}:{lon:.{self.precision}f}"
+
+    # 캐시 조회
+    def get(self, endpoint: str, lat: float, lon: float) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다. 없거나 만료되었으면 None 을 반환합니다.
+
+        Args:
+            endpoint: 엔드포인트 이름 (예: "onecall", "air_pollution")
+            lat: 위도
+            lon: 경도
+
+        Returns:
+            Optional[Any]: 캐시된 응답
+        """
+        key = self.make_key(endpoint, lat, lon)
+
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)                      # 최근 사용 항목으로 이동
+                self._hits[endpoint] = self._hits.get(endpoint, 0) + 1
+                _cache_requests.inc(endpoint=endpoint, result="hit")
+                return entry[1]
+
+            if entry is not None and entry[0] + self.stale_ttl <= now:
+                del self._entries[key]                              # 대체용 보관 시간도 지난 항목 제거
+            self._misses[endpoint] = self._misses.get(endpoint, 0) + 1
+            _cache_requests.inc(endpoint=endpoint, result="miss")
+            return None
+
+    # 만료된 항목 조회 (요청 실패 시 대체용)
+    def get_stale(self, endpoint: str, lat: float, lon: float) -> Optional[Tuple[Any, float]]:
+        """
+        만료되었더라도 stale_ttl 안에 있는 항목을 저장된 지 얼마나 지났는지와 함께 반환합니다.
+
+        Args:
+            endpoint: 엔드포인트 이름
+            lat: 위도
+            lon: 경도
+
+        Returns:
+            Optional[Tuple[Any, float]]: (캐시된 응답, 저장 후 경과 시간(초)) - 없으면 None
+        """
+        key = self.make_key(endpoint, lat, lon)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] + self.stale_ttl <= now:
+                return None
+            _cache_requests.inc(endpoint=endpoint, result="stale")
+            return entry[1], now - (entry[0] - self.ttls.get(endpoint, 0))
+
+    # 캐시 저장
+    def set(self, endpoint: str, lat: float, lon: float, value: Any):
+        """
+        응답을 캐시에 저장합니다. 유효 시간이 설정되지 않은 엔드포인트는 저장하지 않습니다.
+
+        Args:
+            endpoint: 엔드포인트 이름
+            lat: 위도
+            lon: 경도
+            value: 저장할 응답 (JSON 직렬화 가능해야 함)
+        """
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0:
+            return
+
+        key = self.make_key(endpoint, lat, lon)
+
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+
+            # 최대 항목 수 초과 시 가장 오래 사용하지 않은 항목 제거
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # 캐시 비우기
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # 캐시 통계 반환
+    def stats(self) -> Dict[str, Any]:
+        """
+        엔드포인트별 적중/실패 횟수와 현재 항목 수를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 캐시 통계
+        """
+        with self._lock:
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            return {
+                "entries": len(self._entries),
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "by_endpoint": {
+                    endpoint: {"hits": self._hits.get(endpoint, 0), "misses": self._misses.get(endpoint, 0)}
+                    for endpoint in sorted(set(self._hits) | set(self._misses))
+                }
+            }
+
+    # 디스크에서 불러오기
+    def load(self):
+        """
+        디스크에 저장된 항목 중 만료되지 않은 항목(대체용 보관 시간 포함)을 불러옵니다.
+        """
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"캐시 파일을 읽을 수 없습니다: {e}")
+            return
+
+        now = time.time()
+        with self._lock:
+            for entry in stored if isinstance(stored, list) else ():
+                try:
+                    key, expires_at, value = entry
+                    if expires_at + self.stale_ttl > now:
+                        codec = self.codecs.get(key.split(":", 1)[0])
+                        self._entries[key] = (expires_at, codec[1](value) if codec else value)
+                except (AttributeError, TypeError, ValueError):
+                    continue                                        # 형식이 바뀌거나 손상된 항목은 무시
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # 디스크에 저장
+    def save(self):
+        """
+        만료되지 않은 항목(대체용 보관 시간 포함)을 디스크에 저장합니다. 임시 파일에 쓴 뒤 교체하므로
+        저장 중 중단되어도 기존 파일이 손상되지 않습니다.
+        """
+        if not self.path:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = [
+                (key, expires_at, value) for key, (expires_at, value) in self._entries.items()
+                if expires_at + self.stale_ttl > now
+            ]
+
+        stored = []
+        for key, expires_at, value in entries:
+            codec = self.codecs.get(key.split(":", 1)[0])
+            stored.append([key, expires_at, codec[0](value) if codec else value])
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"캐시 파일을 저장할 수 없습니다: {e}")
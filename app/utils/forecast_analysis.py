@@ -0,0 +1,184 @@
+## 시간별 예보 단일 패스 분석
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from utils.helpers import get_weather_condition
+
+if TYPE_CHECKING:
+    from services.forecast_model import Forecast
+
+
+# 시간별 예보 한 행 (표 렌더링용)
+class HourlyRow(NamedTuple):
+    time_label: str         # 현지 시각 (예: "07:00")
+    weather_id: int         # 날씨 코드
+    temp: float             # 온도 (°C)
+    humidity: int           # 습도 (%)
+
+
+# 시간별 예보 분석 결과
+class HourlySummary(NamedTuple):
+    overall_condition: str              # 종합 날씨 상태
+    overall_icon: str                   # 종합 날씨 아이콘
+    weather_counts: Dict[int, int]      # 날씨 코드별 시간 수 (처음 나온 순서)
+    will_rain: bool                     # 비 예보 여부
+    will_snow: bool                     # 눈 예보 여부
+    will_shower: bool                   # 소나기 예보 여부
+    will_heavy_rain: bool               # 강한 비 예보 여부
+    morning_humidity: float             # 오전(0-11시) 평균 습도
+    afternoon_humidity: float           # 오후(12-23시) 평균 습도
+    overall_humidity: float             # 전체 평균 습도
+    rows: List[HourlyRow]               # 표에 표시할 시간별 행
+
+
+# 시간 라벨 캐시 (현지 시각의 분 단위 -> "HH:MM")
+_TIME_LABELS = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(24 * 60)]
+
+
+# 우선순위 그룹 판별 함수 (뇌우 > 비 > 눈 > 안개 > 구름/맑음)
+def _priority_group(weather_id: int) -> Optional[int]:
+    if 200 <= weather_id <= 299:
+        return 0
+    if (300 <= weather_id <= 399) or (500 <= weather_id <= 599):
+        return 1
+    if 600 <= weather_id <= 699:
+        return 2
+    if 700 <= weather_id <= 799:
+        return 3
+    if 800 <= weather_id <= 899:
+        return 4
+    return None
+
+
+# 종합 날씨 결정 함수
+def pick_overall_weather(weather_counts: Dict[int, int], total_hours: int) -> Tuple[str, str]:
+    """
+    날씨 코드별 시간 수로 종합 날씨를 결정합니다.
+    우선순위가 높은 그룹부터, 그룹 내 가장 많은 코드가 전체의 25% 이상이면 해당 날씨로 판단합니다.
+
+    Args:
+        weather_counts: 날씨 코드별 시간 수 (처음 나온 순서)
+        total_hours: 전체 시간 수
+
+    Returns:
+        Tuple[str, str]: (종합 날씨 상태, 날씨 아이콘)
+    """
+    # 그룹별 가장 빈도가 높은 코드 (동률이면 먼저 나온 코드)
+    group_best: Dict[int, Tuple[int, int]] = {}
+    for weather_id, count in weather_counts.items():
+        group = _priority_group(weather_id)
+        if group is not None and (group not in group_best or count > group_best[group][1]):
+            group_best[group] = (weather_id, count)
+
+    most_significant_id = 800  # 기본값은 맑음
+
+    for group in sorted(group_best):
+        weather_id, count = group_best[group]
+        if count >= total_hours / 4:
+            most_significant_id = weather_id
+            break
+
+    return get_weather_condition(most_significant_id)
+
+
+# 시간별 예보 분석 함수
+def analyze_hourly(hourly_data: Sequence[Dict[str, Any]], timezone_offset: Optional[int] = None) -> HourlySummary:
+    """
+    시간별 예보를 한 번만 순회하면서 종합 날씨, 강수 예보, 오전/오후 습도, 표 행을 함께 계산합니다.
+
+    Args:
+        hourly_data: 시간별 날씨 정보 (One Call 응답의 hourly 항목)
+        timezone_offset: UTC 기준 시차 (초, One Call 응답의 timezone_offset).
+            지정하면 서버 시간대와 상관없이 해당 지역의 현지 시각으로 오전/오후와 시간을 구분합니다.
+            None 이면 서버의 현지 시각을 사용합니다.
+
+    Returns:
+        HourlySummary: 분석 결과
+    """
+    hours = (
+        (hour.get("dt", 0), hour.get("temp", 0), hour.get("humidity", 0), _weather_id(hour))
+        for hour in hourly_data
+    )
+    return _analyze(hours, timezone_offset)
+
+
+# 파싱된 예보 분석 함수
+def analyze_forecast(forecast: "Forecast") -> HourlySummary:
+    """
+    parse_onecall 로 만든 예보의 시간별 열(column)을 분석합니다.
+
+    Args:
+        forecast: 파싱된 예보
+
+    Returns:
+        HourlySummary: 분석 결과
+    """
+    hours = zip(forecast.hourly_dt, forecast.hourly_temp, forecast.hourly_humidity, forecast.hourly_weather_id)
+    return _analyze(hours, forecast.timezone_offset)
+
+
+# 날씨 코드 추출 함수
+def _weather_id(hour: Dict[str, Any]) -> int:
+    weather = hour.get("weather")
+    return weather[0].get("id", 800) if weather else 800
+
+
+# 단일 패스 분석 (dt, 온도, 습도, 날씨 코드) 순회
+def _analyze(hours: Iterable[Tuple[int, float, int, int]], timezone_offset: Optional[int]) -> HourlySummary:
+    weather_counts: Dict[int, int] = Counter()
+    will_rain = will_snow = will_shower = will_heavy_rain = False
+    morning_sum = afternoon_sum = overall_sum = 0
+    morning_count = afternoon_count = 0
+    rows: List[HourlyRow] = []
+
+    for dt_value, temp, humidity, weather_id in hours:
+        # 현지 시각 (분 단위) 계산
+        if timezone_offset is None:
+            local = time.localtime(dt_value)
+            minute_of_day = local.tm_hour * 60 + local.tm_min
+        else:
+            minute_of_day = (dt_value + timezone_offset) // 60 % (24 * 60)
+
+        # 날씨 코드 집계
+        weather_counts[weather_id] += 1
+
+        # 강수 예보 확인 (소나기 500-504, 520-531 / 보통의 비 511 / 강한 비 502-504, 522-531 / 눈 600-622)
+        if (500 <= weather_id <= 504) or (520 <= weather_id <= 531):
+            will_rain = True
+            will_shower = True
+        elif weather_id == 511:
+            will_rain = True
+        elif (502 <= weather_id <= 504) or (522 <= weather_id <= 531):
+            will_rain = True
+            will_heavy_rain = True
+        elif 600 <= weather_id <= 622:
+            will_snow = True
+
+        # 오전(0-11시)과 오후(12-23시) 습도 구분
+        if minute_of_day < 12 * 60:
+            morning_sum += humidity
+            morning_count += 1
+        else:
+            afternoon_sum += humidity
+            afternoon_count += 1
+        overall_sum += humidity
+
+        rows.append(HourlyRow(_TIME_LABELS[minute_of_day], weather_id, temp, humidity))
+
+    total_hours = len(rows)
+    overall_condition, overall_icon = pick_overall_weather(weather_counts, total_hours)
+
+    return HourlySummary(
+        overall_condition=overall_condition,
+        overall_icon=overall_icon,
+        weather_counts=weather_counts,
+        will_rain=will_rain,
+        will_snow=will_snow,
+        will_shower=will_shower,
+        will_heavy_rain=will_heavy_rain,
+        morning_humidity=morning_sum / morning_count if morning_count else 0,
+        afternoon_humidity=afternoon_sum / afternoon_count if afternoon_count else 0,
+        overall_humidity=overall_sum / total_hours if total_hours else 0,
+        rows=rows
+    )
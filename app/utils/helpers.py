@@ -1,13 +1,7 @@
 ## 유틸리티 함수 모음
-import gc
-import os
-import logging
-import psutil
-import time
-from datetime import datetime
 import datetime as dt
 from enum import Enum
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 
 # 열거형 클래스 정의 - 날씨 상태 코드에 따른 설명
 class WeatherCondition(Enum):
@@ -296,121 +290,24 @@ def get_humidity_condition(current_humidity: float, min_optimal: int, max_optima
 
 
 # 시간대별 습도를 분석하여 오전/오후 평균 습도 계산
-def analyze_humidity(hourly_data: List[Dict[str, Any]]) -> Dict[str, float]:
+def analyze_humidity(hourly_data: List[Dict[str, Any]], timezone_offset: Optional[int] = None) -> Dict[str, float]:
     """
     시간대별 습도 데이터를 분석하여 오전과 오후의 평균 습도를 계산합니다.
     
     Args:
         hourly_data (List[Dict[str, Any]]): 시간별 날씨 정보
+        timezone_offset (Optional[int]): UTC 기준 시차 (초, 없으면 서버 현지 시각 사용)
     
     Returns:
         Dict[str, float]: 오전/오후/전체 평균 습도 정보
     """
-    if not hourly_data:
-        return {"morning_avg": 0, "afternoon_avg": 0, "overall_avg": 0}
+    # 단일 패스 분석기를 사용 (순환 import 방지를 위해 함수 안에서 import)
+    from utils.forecast_analysis import analyze_hourly
     
-    morning_humidity = []
-    afternoon_humidity = []
-    
-    for hour in hourly_data:
-        dt_value = hour.get("dt", 0)
-        humidity = hour.get("humidity", 0)
-        
-        # Unix 시간을 시간으로 변환
-        hour_of_day = datetime.fromtimestamp(dt_value).hour
-        
-        # 오전(0-11시)과 오후(12-23시)로 구분
-        if 0 <= hour_of_day < 12:
-            morning_humidity.append(humidity)
-        else:
-            afternoon_humidity.append(humidity)
-    
-    # 평균 계산 (데이터가 없는 경우 0으로 처리)
-    morning_avg = sum(morning_humidity) / len(morning_humidity) if morning_humidity else 0
-    afternoon_avg = sum(afternoon_humidity) / len(afternoon_humidity) if afternoon_humidity else 0
-    overall_avg = sum([h.get("humidity", 0) for h in hourly_data]) / len(hourly_data) if hourly_data else 0
+    summary = analyze_hourly(hourly_data, timezone_offset)
     
     return {
-        "morning_avg": morning_avg,
-        "afternoon_avg": afternoon_avg,
-        "overall_avg": overall_avg
+        "morning_avg": summary.morning_humidity,
+        "afternoon_avg": summary.afternoon_humidity,
+        "overall_avg": summary.overall_humidity
     }
-
-# 메모리 정리 및 로그 기록 함수
-def memory_cleanup():
-    """
-    가비지 컬렉션을 강제 실행하고 메모리 사용량을 기록합니다.
-    
-    Returns:
-        int: 수집된 객체 수
-    """
-    # 시작 메모리 사용량 기록
-    # 현재 프로세스 정보 가져오기 
-    process = psutil.Process(os.getpid())
-    
-    # 시작 메모리 사용량 기록 (RSS: Resident Set Size)
-    start_memory = process.memory_info().rss / 1024 / 1024  # MB 단위로 변환
-    
-    # 가비지 컬렉션 강제 실행
-    collected = gc.collect(2)  # 모든 세대의 객체 수집 (2: 모든 세대)
-    
-    # 종료 메모리 사용량 기록
-    end_memory = process.memory_info().rss / 1024 / 1024  # MB 단위로 변환
-    
-    # 로그 기록: 회수된 객체 수와 메모리 사용량 차이 기록
-    logging.info(f"메모리 정리 수행: {collected}개 객체 회수")
-    logging.info(f"메모리 사용량: {start_memory:.2f}MB -> {end_memory:.2f}MB (차이: {start_memory - end_memory:.2f}MB)")
-    
-    return collected
-
-
-# 로그 파일 회전 함수
-def log_rotation(log_file, max_size_mb=10, backup_count=5):
-    """
-    로그 파일이 특정 크기를 초과하면 로테이션합니다.
-    
-    Args:
-        log_file: 로그 파일 경로
-        max_size_mb: 최대 로그 파일 크기 (MB)
-        backup_count: 보관할 백업 파일 수
-    """
-    # 로그 파일이 존재하지 않으면 종료
-    if not os.path.exists(log_file):
-        return
-        
-    # 현재 로그 파일 크기 확인 (MB 단위로 변환)
-    file_size_mb = os.path.getsize(log_file) / (1024 * 1024)
-    
-    # 로그 파일 크기가 최대 크기를 초과하는 경우 
-    if file_size_mb >= max_size_mb:
-        # 기존 백업 파일 처리
-        for i in range(backup_count - 1, 0, -1):
-            old_backup = f"{log_file}.{i}"                  # 기존 백업 파일 이름 
-            new_backup = f"{log_file}.{i+1}"                # 새로운 백업 파일 이름      
-            
-            # 기존 백업 파일이 존재할 경우 
-            if os.path.exists(old_backup):
-                # 새로운 백업 파일이 존재할 경우 삭제
-                if os.path.exists(new_backup):
-                    os.remove(new_backup)
-                    
-                # 기존 백업 파일을 새로운 백업 파일로 이름 변경
-                os.rename(old_backup, new_backup)
-                
-        # 현재 로그 파일을 첫 번째 백업으로 이동
-        backup_1 = f"{log_file}.1"
-        
-        # 첫 번째 백업 파일이 존재할 경우 삭제
-        if os.path.exists(backup_1):
-            os.remove(backup_1)
-        
-        # 현재 로그 파일을 첫 번째 백업 파일로 이름 변경
-        os.rename(log_file, backup_1)
-        
-        # 새 로그 파일 생성 메시지
-        with open(log_file, 'w') as f:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            f.write(f"===== 새 로그 파일 생성: {timestamp} =====\n")
-        
-        # 로그 기록: 로그 파일 로테이션 수행 메시지
-        logging.info(f"로그 파일 로테이션 수행: {file_size_mb:.2f}MB -> 0MB")
\ No newline at end of file
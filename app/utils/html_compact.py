@@ -0,0 +1,140 @@
+## 이메일 HTML 압축 및 텍스트 변환
+import re
+from collections import Counter
+from html.parser import HTMLParser
+from typing import Dict, List
+
+# 태그 밖의 연속 공백 (줄바꿈 포함 여부에 따라 하나의 줄바꿈 또는 공백으로 줄임)
+_WHITESPACE = re.compile(r"\s+")
+
+# style 속성
+_STYLE_ATTR = re.compile(r' style="([^"]*)"')
+
+# 스타일 선언 구분자 주변 공백 ("padding: 8px; border: 1px" -> "padding:8px;border:1px")
+_DECLARATION_SPACES = re.compile(r"\s*([:;])\s*")
+
+# 텍스트 변환 시 줄을 바꾸는 태그
+_BLOCK_TAGS = frozenset({"p", "div", "h1", "h2", "h3", "h4", "table", "tr", "br", "li"})
+
+
+# 연속 공백 줄이기 (HTML 은 연속 공백을 하나로 표시하므로 보이는 내용은 같음)
+def _collapse_whitespace(match: "re.Match") -> str:
+    return "\n" if "\n" in match.group(0) else " "
+
+
+# style 속성 값 압축
+def _compact_style(style: str) -> str:
+    return _DECLARATION_SPACES.sub(r"\1", style.strip()).rstrip(";")
+
+
+# 반복되는 style 속성을 <style> 블록의 클래스로 모으기
+def share_styles(html: str, min_uses: int = 2) -> str:
+    """
+    min_uses 번 이상 반복되는 인라인 style 속성을 클래스로 바꾸고, 규칙은 <head> 의 <style> 블록 하나에 모읍니다.
+    다른 CSS 규칙이 없으므로 인라인 스타일을 클래스로 옮겨도 적용되는 스타일은 같습니다.
+    (<head> 의 <style> 을 지원하지 않는 메일 클라이언트에서는 스타일이 빠지므로 설정으로 끌 수 있습니다)
+
+    Args:
+        html: 이메일 HTML (class 속성이 없는 요소에만 사용)
+        min_uses: 클래스로 바꿀 최소 반복 횟수
+
+    Returns:
+        str: 스타일을 공유하는 HTML
+    """
+    counts = Counter(_STYLE_ATTR.findall(html))
+    shared: Dict[str, str] = {}
+    for style, uses in counts.most_common():
+        if uses >= min_uses:
+            shared[style] = f"s{len(shared)}"
+    if not shared:
+        return html
+
+    css = "".join(f".{name}{{{style}}}" for style, name in shared.items())
+    html = _STYLE_ATTR.sub(
+        lambda match: f' class="{shared[match.group(1)]}"' if match.group(1) in shared else match.group(0),
+        html
+    )
+    head = f"<head><style>{css}</style></head>"
+    if "<head>" in html:
+        return html.replace("<head>", head[:-len("</head>")], 1)
+    return html.replace("<html>", f"<html>{head}", 1)
+
+
+# 이메일 HTML 압축
+def compact_html(html: str, shared_styles: bool = True) -> str:
+    """
+    템플릿 들여쓰기로 생긴 공백을 줄이고 style 속성을 압축합니다. 보이는 내용은 바뀌지 않습니다.
+    (템플릿에 <pre>, <textarea> 가 없으므로 모든 연속 공백을 줄여도 됩니다)
+
+    Args:
+        html: 이메일 HTML
+        shared_styles: 반복되는 스타일을 <style> 블록의 클래스로 모을지 여부
+
+    Returns:
+        str: 압축된 HTML
+    """
+    html = _WHITESPACE.sub(_collapse_whitespace, html).strip()
+    html = _STYLE_ATTR.sub(lambda match: f' style="{_compact_style(match.group(1))}"', html)
+    return share_styles(html) if shared_styles else html
+
+
+# HTML -> 텍스트 변환기
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: List[str] = []
+        self._line: List[str] = []
+        self._cells = 0
+        self._skip = 0
+
+    def _break(self):
+        line = " ".join("".join(self._line).split())
+        if line or (self.lines and self.lines[-1]):
+            self.lines.append(line)
+        self._line = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("style", "head", "title"):
+            self._skip += 1
+        elif tag in ("td", "th"):
+            if self._cells:
+                self._line.append(" | ")
+            self._cells += 1
+        elif tag == "hr":
+            self._break()
+            self.lines.append("-" * 20)
+        elif tag in _BLOCK_TAGS:
+            self._break()
+            if tag == "tr":
+                self._cells = 0
+
+    def handle_endtag(self, tag):
+        if tag in ("style", "head", "title"):
+            self._skip = max(0, self._skip - 1)
+        elif tag in _BLOCK_TAGS:
+            self._break()
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._line.append(data)
+
+    def text(self) -> str:
+        self._break()
+        return "\n".join(self.lines).strip() + "\n"
+
+
+# 텍스트 대체 본문 생성
+def html_to_text(html: str) -> str:
+    """
+    HTML 본문에서 text/plain 대체 본문을 만듭니다. 문단과 표 행은 줄로, 표 칸은 " | " 로 구분합니다.
+
+    Args:
+        html: 이메일 HTML
+
+    Returns:
+        str: 텍스트 본문
+    """
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.text()
@@ -0,0 +1,135 @@
+## 큐 기반 비동기 로깅 및 압축 로테이션
+import atexit
+import glob
+import gzip
+import itertools
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# 로그 형식
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 큐 리스너 (setup_logging 에서 생성)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+# 크기 기준 로테이션 + 백그라운드 gzip 압축 핸들러
+class GzipRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    로그 파일이 max_bytes 를 넘으면 로테이션하고, 백업 파일은 별도 스레드에서 gzip 으로 압축합니다.
+
+    - 로그를 쓰는 스레드에서는 현재 파일의 이름을 바꾸고 새 파일을 여는 일만 합니다.
+    - 백업 번호 이동(.1.gz -> .2.gz)과 압축은 압축 전용 스레드가 순서대로 처리합니다.
+    - 압축 도중 종료되어 남은 파일(.pending)은 다음 시작 시 이어서 압축합니다.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, encoding: str = "utf-8"):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self._sequence = itertools.count()
+        self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+        for pending in sorted(glob.glob(f"{glob.escape(self.baseFilename)}.*.pending")):
+            self._compressor.submit(self._compress, pending)
+
+    # 로테이션 (이름 변경만 수행하고 압축은 압축 스레드로 넘김)
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            pending = f"{self.baseFilename}.{os.getpid()}-{next(self._sequence)}.pending"
+            os.rename(self.baseFilename, pending)
+            self._compressor.submit(self._compress, pending)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    # 백업 번호 이동 및 압축 (압축 스레드에서 실행)
+    def _compress(self, pending: str):
+        try:
+            oldest = f"{self.baseFilename}.{self.backupCount}.gz"
+            if os.path.exists(oldest):
+                os.remove(oldest)
+            for index in range(self.backupCount - 1, 0, -1):
+                source = f"{self.baseFilename}.{index}.gz"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.baseFilename}.{index + 1}.gz")
+
+            target = f"{self.baseFilename}.1.gz"
+            with open(pending, "rb") as src, gzip.open(f"{target}.tmp", "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(f"{target}.tmp", target)
+            os.remove(pending)
+        except OSError as e:
+            logging.getLogger(__name__).error(f"로그 백업 압축 중 오류 발생 ({pending}): {e}")
+
+    # 핸들러 종료 (진행 중인 압축이 끝날 때까지 대기)
+    def close(self):
+        super().close()
+        self._compressor.shutdown(wait=True)
+
+
+# 로깅 설정 함수
+def setup_logging(
+    log_file: str,
+    level: int = logging.INFO,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5
+) -> logging.handlers.QueueListener:
+    """
+    로그를 큐에 넣고 백그라운드 스레드가 파일/콘솔에 기록하도록 설정합니다.
+    로그를 남기는 쪽은 큐에 넣기만 하므로 디스크 I/O 나 로테이션 때문에 전송이 멈추지 않습니다.
+
+    Args:
+        log_file: 로그 파일 경로
+        level: 로그 레벨
+        max_bytes: 로테이션할 로그 파일 크기 (바이트)
+        backup_count: 보관할 압축 백업 파일 수
+
+    Returns:
+        logging.handlers.QueueListener: 실행 중인 큐 리스너
+    """
+    global _listener
+
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = GzipRotatingFileHandler(log_file, max_bytes, backup_count)   # 로그 파일 핸들러
+    console_handler = logging.StreamHandler()                                    # 콘솔 핸들러
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()                          # 크기 제한 없는 큐 (넣을 때 대기 없음)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+# 로깅 종료 함수
+def shutdown_logging():
+    """
+    큐에 남은 로그를 모두 기록한 뒤 리스너와 핸들러를 종료합니다.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()                                # 남은 로그 기록 후 스레드 종료
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -0,0 +1,189 @@
+## RSS 수위 기반 메모리 관리 및 GC 비용 측정
+import ctypes
+import gc
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+import psutil
+
+from utils.metrics import metrics
+
+# GC 일시 정지 시간 구간 (초)
+GC_PAUSE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+# 메모리 페이지 크기 (/proc/self/statm 값 변환용)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# /proc 를 사용할 수 없는 환경에서 사용할 프로세스 객체
+_process: Optional[psutil.Process] = None
+
+# 지표
+_gc_pause_seconds = metrics.histogram(
+    "weather_mail_gc_pause_seconds", "세대별 GC 일시 정지 시간 (초)", buckets=GC_PAUSE_BUCKETS
+)
+_gc_collected = metrics.counter("weather_mail_gc_collected_total", "세대별 GC 로 회수된 객체 수")
+_rss_bytes = metrics.gauge("weather_mail_rss_bytes", "마지막으로 측정한 RSS (바이트)")
+_memory_actions = metrics.counter(
+    "weather_mail_memory_actions_total", "수위 초과로 수행한 메모리 정리 (action: collect_young/collect_full/trim)"
+)
+
+
+# 현재 RSS 측정
+def read_rss() -> int:
+    """
+    현재 프로세스의 RSS(Resident Set Size)를 바이트 단위로 반환합니다.
+    리눅스에서는 /proc/self/statm 한 줄만 읽으므로 매 작업마다 호출해도 부담이 적습니다.
+
+    Returns:
+        int: RSS (바이트)
+    """
+    global _process
+
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        if _process is None:
+            _process = psutil.Process(os.getpid())
+        return _process.memory_info().rss
+
+
+# malloc_trim 함수 찾기 (glibc 가 아니면 None)
+def _load_malloc_trim() -> Optional[Callable[[int], int]]:
+    try:
+        malloc_trim = ctypes.CDLL(None).malloc_trim
+    except (OSError, AttributeError):
+        return None
+    malloc_trim.argtypes = [ctypes.c_size_t]
+    malloc_trim.restype = ctypes.c_int
+    return malloc_trim
+
+
+# 메모리 관리자 클래스
+class MemoryGovernor:
+    """
+    작업이 끝날 때마다 RSS 를 측정하여, 기준값보다 수위 이상 늘었을 때만 GC 를 실행합니다.
+
+    - 낮은 수위를 넘으면 젊은 세대(0, 1)만 수집하고, 높은 수위를 넘으면 전체 수집 후 해제된 힙을 OS 에 반환(malloc_trim)합니다.
+    - 수집 후의 RSS 를 새 기준값으로 삼으므로, 캐시처럼 계속 유지되는 메모리 때문에 매번 수집하지 않습니다.
+      RSS 가 기준값 아래로 내려가면 기준값도 낮춥니다.
+    - 시작 시 만들어진 객체(모듈, 설정, 등록 정보)를 freeze() 로 GC 검사 대상에서 제외할 수 있습니다.
+    - gc.callbacks 로 세대별 GC 일시 정지 시간과 회수 객체 수를 기록합니다.
+    """
+
+    def __init__(self, low_watermark_mb: float = 64, high_watermark_mb: float = 256, trim: bool = True):
+        """
+        Args:
+            low_watermark_mb: 젊은 세대를 수집할 기준값 대비 증가량 (MB)
+            high_watermark_mb: 전체 수집할 기준값 대비 증가량 (MB, 0 이면 사용하지 않음)
+            trim: 전체 수집 후 malloc_trim 으로 해제된 힙을 OS 에 반환할지 여부
+        """
+        self.low_watermark = int(low_watermark_mb * 1024 * 1024)
+        self.high_watermark = int(high_watermark_mb * 1024 * 1024)
+        self._malloc_trim = _load_malloc_trim() if trim else None
+        self.baseline = read_rss()
+        self.gc_seconds = 0.0                   # 누적 GC 일시 정지 시간
+        self.gc_max_pause = 0.0                 # 가장 긴 GC 일시 정지 시간
+        self.gc_runs = [0, 0, 0]                # 세대별 GC 실행 횟수
+        self._gc_started = 0.0
+        self._installed = False
+
+    # GC 시작/종료 콜백 (GC 를 실행한 스레드에서 호출됨)
+    def _on_gc(self, phase: str, info: Dict[str, Any]):
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+            return
+
+        pause = time.perf_counter() - self._gc_started
+        generation = info["generation"]
+        self.gc_seconds += pause
+        self.gc_max_pause = max(self.gc_max_pause, pause)
+        self.gc_runs[generation] += 1
+        _gc_pause_seconds.observe(pause, generation=generation)
+        if info["collected"]:
+            _gc_collected.inc(info["collected"], generation=generation)
+
+    # GC 측정 시작
+    def install(self):
+        if not self._installed:
+            gc.callbacks.append(self._on_gc)
+            self._installed = True
+
+    # GC 측정 종료
+    def uninstall(self):
+        if self._installed:
+            gc.callbacks.remove(self._on_gc)
+            self._installed = False
+
+    # 시작 시 만들어진 객체를 GC 검사 대상에서 제외
+    def freeze(self):
+        """
+        지금까지 살아 있는 객체를 영구 세대로 옮겨 이후 GC 가 검사하지 않도록 합니다.
+        모듈 import 와 설정 로드가 끝난 뒤 한 번 호출하면 전체 수집 시간이 줄어듭니다.
+        """
+        gc.collect()                            # 이미 버려진 객체가 영구 세대로 옮겨지지 않도록 먼저 정리
+        gc.freeze()
+        self.baseline = read_rss()
+        logging.info(f"시작 객체 {gc.get_freeze_count()}개를 GC 검사 대상에서 제외")
+
+    # 해제된 힙을 OS 에 반환
+    def _trim(self) -> bool:
+        if self._malloc_trim is None:
+            return False
+        _memory_actions.inc(action="trim")
+        return bool(self._malloc_trim(0))
+
+    # 수위 확인 및 필요 시 정리
+    def check(self, reason: str = "") -> int:
+        """
+        RSS 를 측정하여 수위를 넘었을 때만 GC 를 실행합니다.
+
+        Args:
+            reason: 로그에 표시할 확인 시점 (예: "발송 작업 종료")
+
+        Returns:
+            int: 확인 후 RSS (바이트)
+        """
+        rss = read_rss()
+        growth = rss - self.baseline
+
+        if self.high_watermark and growth >= self.high_watermark:
+            _memory_actions.inc(action="collect_full")
+            collected = gc.collect()
+            trimmed = self._trim()
+            after = read_rss()
+            self.baseline = after               # 정리 후에도 남은 메모리는 유지되는 데이터로 보고 기준값 갱신
+            logging.info(
+                f"메모리 높은 수위 초과{f' ({reason})' if reason else ''}: 전체 GC {collected}개 회수"
+                f"{', 힙 반환' if trimmed else ''}, RSS {rss / 1024 / 1024:.1f}MB -> {after / 1024 / 1024:.1f}MB"
+            )
+            rss = after
+
+        elif self.low_watermark and growth >= self.low_watermark:
+            _memory_actions.inc(action="collect_young")
+            collected = gc.collect(1)
+            after = read_rss()
+            logging.info(
+                f"메모리 낮은 수위 초과{f' ({reason})' if reason else ''}: 젊은 세대 GC {collected}개 회수, "
+                f"RSS {rss / 1024 / 1024:.1f}MB -> {after / 1024 / 1024:.1f}MB (기준 대비 {(after - self.baseline) / 1024 / 1024:+.1f}MB)"
+            )
+            self.baseline = after               # 다음 수위 확인은 정리 후 RSS 기준
+            rss = after
+
+        elif rss < self.baseline:
+            self.baseline = rss                 # 메모리가 줄어든 경우 기준값도 낮춤
+
+        _rss_bytes.set(rss)
+        return rss
+
+    # GC 비용 요약
+    def report(self) -> str:
+        rss = read_rss()
+        _rss_bytes.set(rss)
+        return (
+            f"GC {sum(self.gc_runs)}회 (세대별 {'/'.join(map(str, self.gc_runs))}), "
+            f"누적 {self.gc_seconds * 1000:.1f}ms, 최대 {self.gc_max_pause * 1000:.1f}ms | "
+            f"RSS {rss / 1024 / 1024:.1f}MB (기준 {self.baseline / 1024 / 1024:.1f}MB)"
+        )
@@ -0,0 +1,183 @@
+## tracemalloc 기반 단계별 메모리 프로파일링
+import gc
+import logging
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+# 보고서에서 제외할 할당 위치 (프로파일러 자체 및 import 과정)
+# Snapshot.filter_traces 는 할당 블록마다 파이썬 코드로 비교하여 느리므로, 위치별로 묶은 비교 결과에서 제외합니다.
+_IGNORED_FILES = frozenset({
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+})
+
+
+# 단계별 측정 결과
+class StageReport(NamedTuple):
+    name: str                               # 단계 이름
+    elapsed: float                          # 소요 시간 (초)
+    size_diff: int                          # 단계 전후 메모리 증감 (바이트)
+    count_diff: int                         # 단계 전후 메모리 블록 수 증감
+    peak: int                               # 단계 중 최대 추가 사용량 (바이트)
+    top: List[tracemalloc.StatisticDiff]    # 증가량이 큰 할당 위치
+
+
+# 메모리 프로파일러 클래스
+class MemoryProfiler:
+    """
+    tracemalloc 스냅샷을 단계 전후로 찍어 비교하고, 단계별로 메모리가 늘어난 할당 위치를 보고서로 기록합니다.
+
+    - stage() 구간마다 전후 스냅샷 차이와 구간 중 최대 사용량을 기록합니다.
+    - 첫 실행 종료 시점의 스냅샷을 보관하여, 이후 실행마다 누적 증가량(장기 실행 중 누수 여부)을 함께 기록합니다.
+    - 추적 중에는 할당마다 비용이 들기 때문에 필요할 때만 켜서 사용합니다.
+    """
+
+    def __init__(self, report_dir: str = "memory_profiles", top: int = 10, frames: int = 1):
+        """
+        Args:
+            report_dir: 보고서를 저장할 디렉토리
+            top: 단계별로 기록할 할당 위치 수
+            frames: 할당 위치마다 보관할 호출 스택 깊이 (1 이면 파일:줄 번호만)
+        """
+        self.report_dir = report_dir
+        self.top = top
+        self.frames = max(1, frames)
+        self.key_type = "traceback" if self.frames > 1 else "lineno"
+        self.runs = 0
+        self._stages: List[StageReport] = []
+        self._run_start: Optional[tracemalloc.Snapshot] = None
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+
+    # 스냅샷 생성
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        gc.collect()                                    # 회수 가능한 객체를 정리한 뒤 남은 메모리 비교
+        return tracemalloc.take_snapshot()
+
+    # 스냅샷 비교 (프로파일러 자체 할당 제외)
+    def _compare(self, after: tracemalloc.Snapshot, before: tracemalloc.Snapshot) -> List[tracemalloc.StatisticDiff]:
+        return [
+            stat for stat in after.compare_to(before, self.key_type)
+            if stat.traceback[0].filename not in _IGNORED_FILES
+        ]
+
+    # 실행 시작
+    def begin_run(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self._stages = []
+        self._run_start = self._snapshot()
+
+    # 단계 측정
+    @contextmanager
+    def stage(self, name: str):
+        """
+        with 구간의 메모리 증감과 최대 사용량을 기록합니다.
+
+        Args:
+            name: 단계 이름 (예: "fetch", "render")
+        """
+        before = self._snapshot()
+        tracemalloc.reset_peak()
+        start_current, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            after = self._snapshot()
+            diff = self._compare(after, before)
+            self._stages.append(StageReport(
+                name=name,
+                elapsed=elapsed,
+                size_diff=sum(stat.size_diff for stat in diff),
+                count_diff=sum(stat.count_diff for stat in diff),
+                peak=peak - start_current,
+                top=diff[:self.top]
+            ))
+
+    # 할당 위치 출력 형식
+    def _format_stat(self, stat: tracemalloc.StatisticDiff) -> List[str]:
+        lines = [f"  {stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8d} blocks  {stat.traceback[0]}"]
+        if self.frames > 1:
+            lines.extend(f"{'':34}{frame}" for frame in list(stat.traceback)[1:])
+        return lines
+
+    # 실행 종료 및 보고서 작성
+    def end_run(self, label: str = "send_weather_email") -> str:
+        """
+        실행 전체의 메모리 증감과 단계별 결과를 보고서 파일로 기록합니다.
+
+        Args:
+            label: 보고서에 표시할 실행 이름
+
+        Returns:
+            str: 보고서 파일 경로
+        """
+        self.runs += 1
+        end = self._snapshot()
+        current, _ = tracemalloc.get_traced_memory()
+
+        lines = [
+            f"===== 메모리 프로파일: {label} #{self.runs} ({datetime.now():%Y-%m-%d %H:%M:%S}) =====",
+            f"추적 중인 메모리: {current / 1024 / 1024:.2f}MiB",
+            ""
+        ]
+
+        for report in self._stages:
+            lines.append(
+                f"[{report.name}] {report.elapsed:.3f}초 | 증감 {report.size_diff / 1024:+.1f} KiB "
+                f"({report.count_diff:+d} blocks) | 최대 추가 사용량 {report.peak / 1024:.1f} KiB"
+            )
+            for stat in report.top:
+                lines.extend(self._format_stat(stat))
+            lines.append("")
+
+        # 실행 전후 남은 메모리 (실행 후에도 해제되지 않은 할당)
+        run_diff = self._compare(end, self._run_start)
+        lines.append(f"[실행 전후] 증감 {sum(stat.size_diff for stat in run_diff) / 1024:+.1f} KiB")
+        for stat in run_diff[:self.top]:
+            lines.extend(self._format_stat(stat))
+        lines.append("")
+
+        # 첫 실행 이후 누적 증가 (장기 실행 중 누수 확인)
+        if self._baseline is None:
+            self._baseline = end
+        else:
+            total_diff = self._compare(end, self._baseline)
+            lines.append(
+                f"[첫 실행 이후 누적] 증감 {sum(stat.size_diff for stat in total_diff) / 1024:+.1f} KiB "
+                f"({self.runs - 1}회 실행)"
+            )
+            for stat in total_diff[:self.top]:
+                lines.extend(self._format_stat(stat))
+            lines.append("")
+
+        os.makedirs(self.report_dir, exist_ok=True)
+        path = os.path.join(self.report_dir, f"memory_{datetime.now():%Y%m%d_%H%M%S}_{self.runs}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+        for report in self._stages:
+            logging.info(
+                f"메모리 프로파일 [{report.name}]: 증감 {report.size_diff / 1024:+.1f} KiB, "
+                f"최대 추가 사용량 {report.peak / 1024:.1f} KiB"
+            )
+        logging.info(f"메모리 프로파일 보고서 저장: {path}")
+
+        self._stages = []
+        self._run_start = None
+        return path
+
+    # 추적 종료
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._baseline = None
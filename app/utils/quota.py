@@ -0,0 +1,280 @@
+## 외부 API 호출 한도 관리 및 동일 요청 합치기
+import asyncio
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from utils.metrics import metrics
+from utils.rate_limit import TokenBucket
+
+# 요청 우선순위 (작을수록 먼저 처리)
+SCHEDULED = 0       # 정기 발송 (구독자 배치 포함)
+POLL = 1            # 예보 변경 확인
+AD_HOC = 2          # --now 등 수동 실행
+
+_PRIORITY_NAMES = {SCHEDULED: "scheduled", POLL: "poll", AD_HOC: "ad_hoc"}
+
+# 현재 작업의 요청 우선순위 (작업 안에서 만든 태스크에 그대로 전달됨)
+_request_priority: contextvars.ContextVar = contextvars.ContextVar("request_priority", default=SCHEDULED)
+
+# 지표
+_quota_calls = metrics.counter("weather_mail_api_quota_calls_total", "호출 한도에서 차감한 API 호출 수 (priority)")
+_quota_rejected = metrics.counter("weather_mail_api_quota_rejected_total", "일일 한도 초과로 보내지 않은 API 호출 수 (priority)")
+_quota_wait_seconds = metrics.histogram("weather_mail_api_quota_wait_seconds", "분당 한도로 대기한 시간 (초)")
+_quota_used_today = metrics.gauge("weather_mail_api_quota_used_today", "오늘(UTC) 사용한 API 호출 수")
+_coalesced_requests = metrics.counter("weather_mail_coalesced_requests_total", "진행 중인 같은 요청의 결과를 함께 사용한 횟수 (endpoint)")
+
+
+# 일일 호출 한도를 넘어 요청하지 않았을 때 발생하는 예외
+class QuotaExceededError(RuntimeError):
+    pass
+
+
+# 현재 작업의 요청 우선순위 설정
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """
+    with 블록 안에서 시작한 요청(블록 안에서 만든 태스크 포함)에 우선순위를 지정합니다.
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_priority() -> int:
+    return _request_priority.get()
+
+
+# UTC 기준 날짜 (OpenWeatherMap 일일 호출 수는 UTC 자정에 초기화됨)
+def _utc_day(now: Optional[float] = None) -> str:
+    return time.strftime("%Y-%m-%d", time.gmtime(now if now is not None else time.time()))
+
+
+# API 호출 한도 관리 클래스
+class QuotaBudget:
+    """
+    모든 API 호출이 함께 사용하는 분당/일일 호출 한도입니다.
+
+    - 분당 한도는 토큰 버킷으로 관리하며, 토큰이 부족하면 우선순위가 높은 요청부터 차례로 보냅니다.
+    - 일일 한도의 reserve 비율은 정기 발송(SCHEDULED)용으로 남겨 두어, 변경 확인이나 수동 실행이
+      한도를 다 써서 아침 메일을 보내지 못하는 일이 없도록 합니다.
+    - 일일 한도가 있고 path 가 지정되면 오늘 사용량을 파일에 저장하여, cron 으로 따로 실행되는 프로세스와
+      재시작 후에도 이어서 셉니다. (분당 한도는 프로세스마다 따로 적용되며, 일일 한도가 없으면 파일을 쓰지 않습니다)
+    """
+
+    def __init__(
+        self,
+        per_minute: int = 0,
+        per_day: int = 0,
+        reserve: float = 0.2,
+        path: Optional[str] = None
+    ):
+        """
+        Args:
+            per_minute: 분당 최대 호출 수 (0 이면 제한 없음)
+            per_day: 일일(UTC) 최대 호출 수 (0 이면 제한 없음)
+            reserve: 일일 한도 중 정기 발송용으로 남겨 둘 비율 (0-1)
+            path: 오늘 사용량 저장 파일 경로 (None 이거나 일일 한도가 없으면 메모리에만 보관)
+        """
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self.reserve = min(max(reserve, 0.0), 1.0)
+        self.path = path if per_day > 0 else None
+        self._bucket = TokenBucket(per_minute / 60, capacity=per_minute) if per_minute > 0 else None
+        self._lock = threading.Lock()
+        self._day = _utc_day()
+        self._used = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        if self.path:
+            self.load()
+
+    # 우선순위별 일일 한도
+    def daily_limit(self, priority: int) -> int:
+        if priority == SCHEDULED:
+            return self.per_day
+        return int(self.per_day * (1 - self.reserve))
+
+    # 오늘 사용량 (날짜가 바뀌면 초기화)
+    @property
+    def used_today(self) -> int:
+        with self._lock:
+            self._roll_day()
+            return self._used
+
+    def _roll_day(self):
+        today = _utc_day()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+
+    # 일일 한도 차감 (부족하면 QuotaExceededError)
+    def _charge(self, priority: int):
+        with self._lock:
+            self._roll_day()
+            if self.per_day and self._used >= self.daily_limit(priority):
+                _quota_rejected.inc(priority=_PRIORITY_NAMES.get(priority, str(priority)))
+                raise QuotaExceededError(
+                    f"API 일일 호출 한도에 도달했습니다 ({self._used}/{self.daily_limit(priority)}, "
+                    f"우선순위 {_PRIORITY_NAMES.get(priority, priority)})"
+                )
+            self._used += 1
+            used = self._used
+        _quota_calls.inc(priority=_PRIORITY_NAMES.get(priority, str(priority)))
+        _quota_used_today.set(used)
+
+    # 호출 한도 획득 (분당 한도가 부족하면 우선순위 순서대로 대기)
+    async def acquire(self, priority: Optional[int] = None):
+        """
+        API 를 한 번 호출할 수 있을 때까지 기다린 뒤 한도를 차감합니다.
+
+        Args:
+            priority: 요청 우선순위 (기본값: request_priority 로 지정한 현재 작업의 우선순위)
+
+        Raises:
+            QuotaExceededError: 이 우선순위가 사용할 수 있는 일일 한도를 모두 쓴 경우
+        """
+        priority = current_priority() if priority is None else priority
+        if self._bucket is None or (not self._waiters and self._bucket.try_acquire()):
+            try:
+                self._charge(priority)
+            except QuotaExceededError:
+                if self._bucket is not None:
+                    self._bucket.refund()
+                raise
+            return
+
+        # 대기열에 등록하고 분당 토큰이 채워지는 대로 우선순위 순서로 허용
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        await future
+        _quota_wait_seconds.observe(time.perf_counter() - start)
+
+    # 대기 중인 요청에 토큰 배분
+    async def _dispatch(self):
+        while self._waiters:
+            await asyncio.sleep(self._bucket.time_until(1))
+            if not self._bucket.try_acquire():
+                continue
+
+            while self._waiters:
+                priority, _, future = heapq.heappop(self._waiters)
+                if future.done():                   # 기다리던 요청이 취소됨
+                    continue
+                try:
+                    self._charge(priority)
+                    future.set_result(None)
+                except QuotaExceededError as e:
+                    future.set_exception(e)
+                    continue                        # 토큰은 다음 요청이 사용
+                break
+            else:
+                self._bucket.refund()
+
+    # 바로 호출할 수 있을 때만 한도 차감 (보조 요청처럼 없어도 되는 호출용)
+    def try_acquire(self, priority: Optional[int] = None) -> bool:
+        """
+        기다리지 않고 호출할 수 있으면 한도를 차감하고 True 를 반환합니다.
+        대기 중인 요청이 있거나 일일 한도의 정기 발송용 몫을 써야 한다면 False 를 반환합니다.
+        """
+        priority = current_priority() if priority is None else priority
+        if self._waiters:
+            return False
+        with self._lock:
+            self._roll_day()
+            if self.per_day and self._used >= self.daily_limit(max(priority, POLL)):
+                return False
+        if self._bucket is not None and not self._bucket.try_acquire():
+            return False
+        try:
+            self._charge(priority)
+        except QuotaExceededError:
+            if self._bucket is not None:
+                self._bucket.refund()
+            return False
+        return True
+
+    # 사용하지 않은 호출 한도 반환 (예: 회로가 열려 요청하지 않은 경우)
+    def release(self):
+        with self._lock:
+            self._used = max(0, self._used - 1)
+        if self._bucket is not None:
+            self._bucket.refund()
+
+    # 디스크에서 오늘 사용량 불러오기
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"API 호출 수 파일을 읽을 수 없습니다: {e}")
+            return
+        with self._lock:
+            if stored.get("day") == self._day:
+                self._used = max(self._used, int(stored.get("used", 0)))
+                _quota_used_today.set(self._used)
+
+    # 디스크에 오늘 사용량 저장 (임시 파일에 쓴 뒤 교체)
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            self._roll_day()
+            stored = {"day": self._day, "used": self._used}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"API 호출 수 파일을 저장할 수 없습니다: {e}")
+
+
+# 진행 중인 같은 요청 합치기 클래스
+class RequestCoalescer:
+    """
+    같은 키의 요청이 이미 진행 중이면 새로 보내지 않고 그 결과를 함께 기다립니다.
+    한 호출자가 취소되어도 공유 요청은 취소되지 않습니다 (다른 호출자가 기다리고 있을 수 있으므로).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Args:
+            key: 요청 키 (예: 엔드포인트 + 반올림한 좌표)
+            factory: 진행 중인 요청이 없을 때 호출할 코루틴 함수
+
+        Returns:
+            Any: 요청 결과 (모든 호출자가 같은 객체를 받음)
+        """
+        future = self._in_flight.get(key)
+        if future is not None and not future.done():
+            _coalesced_requests.inc(endpoint=self.name)
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(factory())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None) if self._in_flight.get(key) is future else None)
+        return await asyncio.shield(future)
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
@@ -0,0 +1,87 @@
+## 전송 속도 제한
+import threading
+import time
+from typing import Optional
+
+
+# 토큰 버킷 클래스 - 초당 허용 횟수를 넘지 않도록 대기
+class TokenBucket:
+    """
+    초당 rate 개의 토큰이 채워지고 최대 capacity 개까지 쌓이는 토큰 버킷입니다.
+    여러 스레드가 함께 사용할 수 있습니다. rate 가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수
+            capacity: 버킷 최대 크기 (기본값: rate, 최소 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # 경과 시간만큼 토큰 채우기
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    # 토큰 즉시 획득 시도
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        토큰이 충분하면 차감하고 True 를, 부족하면 기다리지 않고 False 를 반환합니다.
+        """
+        if self.rate <= 0:
+            return True
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    # 토큰이 채워질 때까지 남은 시간
+    def time_until(self, tokens: float = 1) -> float:
+        """
+        tokens 개를 획득할 수 있을 때까지 남은 시간(초)을 반환합니다. 토큰을 차감하지 않습니다.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (tokens - self._tokens) / self.rate)
+
+    # 사용하지 않은 토큰 반환
+    def refund(self, tokens: float = 1):
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    # 토큰 획득 (부족하면 대기)
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        토큰을 획득할 때까지 대기합니다.
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate     # 부족한 토큰이 채워질 때까지의 시간
+            time.sleep(delay)
+            waited += delay
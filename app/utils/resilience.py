@@ -0,0 +1,128 @@
+## 외부 API 요청 재시도, 회로 차단기, 지연 시간 추적
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional
+
+from utils.metrics import metrics
+
+# 회로 차단기 상태
+CLOSED = "closed"           # 정상 - 모든 요청 허용
+OPEN = "open"               # 차단 - 요청하지 않고 바로 실패 처리
+HALF_OPEN = "half_open"     # 확인 중 - 시험 요청 하나만 허용
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# 회로 차단기 상태 지표
+_circuit_state = metrics.gauge("weather_mail_circuit_state", "엔드포인트별 회로 차단기 상태 (0: 정상, 1: 확인 중, 2: 차단)")
+
+
+# 회로가 열려 있어 요청하지 않았을 때 발생하는 예외
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+# 지수 백오프 대기 시간 (full jitter)
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 8.0) -> float:
+    """
+    attempt 번째 재시도 전에 기다릴 시간을 반환합니다.
+    0 ~ min(cap, base * 2^attempt) 사이에서 무작위로 골라, 여러 요청이 같은 순간에 다시 몰리지 않도록 합니다.
+
+    Args:
+        attempt: 재시도 순번 (0부터)
+        base: 첫 재시도의 최대 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# 회로 차단기 클래스
+class CircuitBreaker:
+    """
+    연속으로 failure_threshold 번 실패하면 reset_timeout 초 동안 요청을 막습니다.
+    시간이 지나면 시험 요청 하나만 보내 보고, 성공하면 다시 열고 실패하면 다시 막습니다.
+    시험 요청이 결과를 남기지 못하고 끝나더라도(취소 등) reset_timeout 이 지나면 새 시험 요청을 허용합니다.
+    장애가 난 API 에 요청과 재시도를 계속 보내 발송 시간을 허비하지 않도록 합니다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Args:
+            name: 엔드포인트 이름 (로그와 지표에 사용)
+            failure_threshold: 차단할 연속 실패 횟수
+            reset_timeout: 차단 후 시험 요청까지 기다릴 시간 (초)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_at = 0.0                        # 마지막 시험 요청을 허용한 시각
+        self._lock = threading.Lock()
+        _circuit_state.set(_STATE_VALUES[CLOSED], endpoint=name)
+
+    def _set_state(self, state: str):
+        if state != self.state:
+            logging.warning(f"회로 차단기 상태 변경 ({self.name}): {self.state} -> {state}")
+            self.state = state
+            _circuit_state.set(_STATE_VALUES[state], endpoint=self.name)
+
+    # 요청 허용 여부
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN and now - self._opened_at >= self.reset_timeout:
+                self._set_state(HALF_OPEN)          # 시험 요청 하나만 허용
+                self._trial_at = now
+                return True
+            if self.state == HALF_OPEN and now - self._trial_at >= self.reset_timeout:
+                self._trial_at = now                # 이전 시험 요청이 결과 없이 끝남 - 새 시험 요청 허용
+                return True
+            return False
+
+    # 요청 성공 기록
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._set_state(CLOSED)
+
+    # 요청 실패 기록
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(OPEN)
+
+
+# 최근 응답 시간 추적 클래스
+class LatencyTracker:
+    """
+    최근 window 개 요청의 응답 시간을 보관하고 백분위 값을 계산합니다.
+    보조 요청(hedged request)을 보낼 기준 시간을 정하는 데 사용합니다.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    # 백분위 응답 시간 (표본이 부족하면 None)
+    def percentile(self, p: float) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(p * len(samples)))]
@@ -0,0 +1,419 @@
+## 이벤트 루프 기반 스케줄러
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+# 한 번에 잠드는 최대 시간 (초) - 시스템 시각이 바뀌어도 이 간격 안에 다음 실행 시각을 다시 계산
+MAX_SLEEP_SECONDS = 3600
+
+
+# 매일 실행되는 작업 정보
+class DailyJob:
+    """
+    매일 지정된 시각(HH:MM, 서버 현지 시각)에 실행되는 작업입니다.
+    """
+
+    def __init__(self, at: str, func: Callable[[], Any], name: Optional[str] = None):
+        """
+        Args:
+            at: 실행 시각 ("HH:MM")
+            func: 실행할 함수 (일반 함수 또는 코루틴 함수)
+            name: 로그에 표시할 작업 이름
+        """
+        hour, minute = (int(part) for part in at.split(":"))
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"잘못된 실행 시각입니다: {at}")
+
+        self.at = at
+        self.hour = hour
+        self.minute = minute
+        self.func = func
+        self.name = name or getattr(func, "__name__", "job")
+        self.next_run = self.compute_next_run(datetime.now())
+        self.task: Optional[asyncio.Task] = None
+
+    # 다음 실행 시각 계산
+    def compute_next_run(self, now: datetime) -> datetime:
+        candidate = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        return candidate
+
+    def __repr__(self) -> str:
+        return f"DailyJob({self.name} @ {self.at}, next={self.next_run:%Y-%m-%d %H:%M})"
+
+
+# 스케줄러 클래스 - 하나의 이벤트 루프에서 다음 실행 시각까지 잠들었다가 작업을 실행
+class AsyncScheduler:
+    """
+    하나의 이벤트 루프에서 다음 작업 시각까지 잠들었다가 작업을 태스크로 실행하는 스케줄러입니다.
+
+    - 1초마다 깨어나 확인하는 대신 가장 가까운 실행 시각까지 한 번에 대기하므로 대기 중 CPU 를 쓰지 않습니다.
+    - 작업은 별도 태스크로 실행되어 오래 걸리는 작업이 다른 작업의 시작을 늦추지 않습니다.
+    - 같은 작업의 이전 실행이 끝나지 않았으면 이번 실행은 건너뜁니다.
+    """
+
+    def __init__(self):
+        self.jobs: List[DailyJob] = []
+        self._wakeup = asyncio.Event()
+        self._stopped = False
+
+    # 매일 실행할 작업 등록
+    def every_day_at(self, at: str, func: Callable[[], Any], name: Optional[str] = None) -> DailyJob:
+        """
+        매일 지정된 시각에 실행할 작업을 등록합니다.
+
+        Args:
+            at: 실행 시각 ("HH:MM")
+            func: 실행할 함수 (일반 함수 또는 코루틴 함수)
+            name: 로그에 표시할 작업 이름
+
+        Returns:
+            DailyJob: 등록된 작업
+        """
+        job = DailyJob(at, func, name)
+        self.jobs.append(job)
+        self._wakeup.set()                              # 대기 중이면 다음 실행 시각 다시 계산
+        return job
+
+    # 작업 실행
+    async def _run_job(self, job: DailyJob, scheduled: datetime):
+        delay_ms = (datetime.now() - scheduled).total_seconds() * 1000
+        logging.info(f"예약 작업 시작: {job.name} (예정 시각 대비 {delay_ms:.1f}ms)")
+
+        try:
+            result = job.func()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logging.error(f"예약 작업 실행 중 오류 발생 ({job.name}): {e}")
+
+    # 실행 시각이 된 작업 시작
+    def _start_due_jobs(self, now: datetime):
+        for job in self.jobs:
+            if job.next_run > now:
+                continue
+
+            if job.task is not None and not job.task.done():
+                logging.warning(f"이전 실행이 끝나지 않아 건너뜁니다: {job.name}")
+            else:
+                job.task = asyncio.create_task(self._run_job(job, job.next_run), name=job.name)
+
+            job.next_run = job.compute_next_run(max(now, job.next_run))
+
+    # 다음 실행 시각까지 대기
+    async def _sleep_until_next(self):
+        if not self.jobs:
+            await self._wakeup.wait()
+            return
+
+        next_run = min(job.next_run for job in self.jobs)
+        delay = (next_run - datetime.now()).total_seconds()
+        if delay <= 0:
+            return
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, MAX_SLEEP_SECONDS))
+        except asyncio.TimeoutError:
+            pass
+
+    # 스케줄러 실행
+    async def run(self):
+        """
+        stop() 이 호출될 때까지 작업을 실행합니다. 종료 시 실행 중인 작업이 끝나기를 기다립니다.
+        """
+        self._stopped = False
+        try:
+            while not self._stopped:
+                self._wakeup.clear()
+                self._start_due_jobs(datetime.now())
+                await self._sleep_until_next()
+        finally:
+            running = [job.task for job in self.jobs if job.task is not None and not job.task.done()]
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    # 스케줄러 중지
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+
+
+# 발송 그룹 키 (지역, 시간대, 현지 발송 시각)
+GroupKey = Tuple[str, str, str]
+
+
+# 같은 지역/시간대/발송 시각을 가진 수신자 묶음
+class _SendGroup:
+    __slots__ = ("key", "zone", "hour", "minute", "members", "stored", "due")
+
+    def __init__(self, key: GroupKey):
+        location, timezone, send_time = key
+        hour, minute = (int(part) for part in send_time.split(":"))
+        self.key = key
+        self.zone = ZoneInfo(timezone)
+        self.hour = hour
+        self.minute = minute
+        self.members: Set[str] = set()
+        self.stored = False                         # 구독자 저장소 그룹 (수신자는 발송 시 저장소에서 읽음)
+        self.due = 0                                # 다음 발송 시각 (Unix 시간, 분 단위)
+
+    # 주어진 시각 이후의 다음 현지 발송 시각 (Unix 시간) 계산
+    def next_due(self, after: float) -> int:
+        local_now = datetime.fromtimestamp(after, self.zone)
+        candidate = local_now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate.timestamp() <= after:
+            candidate = (local_now + timedelta(days=1)).replace(
+                hour=self.hour, minute=self.minute, second=0, microsecond=0
+            )
+        return int(candidate.timestamp()) // 60 * 60
+
+
+# 구독자별 현지 발송 시각 큐
+class SendTimeQueue:
+    """
+    수신자마다 다른 시간대의 현지 발송 시각을 힙(우선순위 큐)으로 관리합니다.
+
+    - 같은 지역/시간대/발송 시각의 수신자는 하나의 그룹으로 묶어 힙에는 그룹당 항목 하나만 둡니다.
+    - 가장 가까운 발송 시각만 확인하므로 수십만 명이 등록되어 있어도 매번 전체를 훑지 않습니다.
+    - 같은 분(minute)에 같은 지역으로 발송할 수신자는 시간대가 달라도 하나의 배치로 묶어 전달합니다.
+    - 수신자 추가/삭제는 실행 중에도 가능하며, 삭제된 그룹은 힙에서 꺼낼 때 버립니다.
+    - 구독자 저장소를 사용하면 수신자 대신 그룹 키만 보관하고(add_group/sync_groups),
+      run(..., stored=True) 의 handler 는 수신자 목록 대신 발송할 그룹 키 목록을 받습니다.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, GroupKey]] = []
+        self._groups: Dict[GroupKey, _SendGroup] = {}
+        self._member_groups: Dict[Tuple[str, str], GroupKey] = {}   # (수신자, 지역) -> 그룹
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopped = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._member_groups)
+
+    # 수신자 추가
+    def add(self, member: str, location: str, timezone: str, send_time: str):
+        """
+        수신자를 추가합니다. 같은 수신자와 지역이 이미 있으면 시간대와 발송 시각을 갱신합니다.
+
+        Args:
+            member: 수신자 이메일 주소
+            location: 지역 이름
+            timezone: IANA 시간대 이름
+            send_time: 현지 발송 시각 ("HH:MM")
+        """
+        self.remove(member, location)
+
+        key = (location, timezone, send_time)
+        group = self._get_or_create_group(key)
+        group.members.add(member)
+        self._member_groups[(member, location)] = key
+
+    def _get_or_create_group(self, key: GroupKey) -> _SendGroup:
+        group = self._groups.get(key)
+        if group is None:
+            group = _SendGroup(key)
+            group.due = group.next_due(time.time())
+            self._groups[key] = group
+            heapq.heappush(self._heap, (group.due, next(self._counter), key))
+            if self._wakeup is not None:
+                self._wakeup.set()                  # 더 이른 발송 시각일 수 있으므로 대기 시간 다시 계산
+        return group
+
+    # 수신자 삭제
+    def remove(self, member: str, location: str) -> bool:
+        """
+        수신자를 삭제합니다.
+
+        Args:
+            member: 수신자 이메일 주소
+            location: 지역 이름
+
+        Returns:
+            bool: 삭제 여부
+        """
+        key = self._member_groups.pop((member, location), None)
+        if key is None:
+            return False
+
+        group = self._groups[key]
+        group.members.discard(member)
+        if not group.members and not group.stored:
+            del self._groups[key]                   # 힙 항목은 꺼낼 때 버림
+        return True
+
+    # 저장소 그룹 추가
+    def add_group(self, location: str, timezone: str, send_time: str) -> bool:
+        """
+        구독자 저장소의 발송 그룹을 추가합니다. 수신자는 발송 시각에 handler 가 저장소에서 읽습니다.
+
+        Returns:
+            bool: 새로 추가했는지 여부
+        """
+        group = self._get_or_create_group((location, timezone, send_time))
+        added, group.stored = not group.stored, True
+        return added
+
+    # 저장소 그룹 삭제
+    def remove_group(self, location: str, timezone: str, send_time: str) -> bool:
+        key = (location, timezone, send_time)
+        group = self._groups.get(key)
+        if group is None or not group.stored:
+            return False
+
+        group.stored = False
+        if not group.members:
+            del self._groups[key]                   # 힙 항목은 꺼낼 때 버림
+        return True
+
+    # 저장소 그룹 맞추기
+    def sync_groups(self, keys: Iterable[GroupKey]) -> Tuple[int, int]:
+        """
+        저장소 그룹을 주어진 그룹 키 목록과 같게 맞춥니다. 이미 있는 그룹의 다음 발송 시각은 그대로 둡니다.
+
+        Args:
+            keys: 구독자 저장소의 (지역, 시간대, 발송 시각) 목록
+
+        Returns:
+            Tuple[int, int]: (추가한 그룹 수, 삭제한 그룹 수)
+        """
+        keys = set(keys)
+        added = sum(self.add_group(*key) for key in keys)
+        stale = [key for key, group in self._groups.items() if group.stored and key not in keys]
+        removed = sum(self.remove_group(*key) for key in stale)
+        return added, removed
+
+    # 저장소 그룹 수
+    @property
+    def stored_groups(self) -> int:
+        return sum(group.stored for group in self._groups.values())
+
+    # 다음 발송 시각
+    def next_deadline(self) -> Optional[int]:
+        """
+        가장 가까운 발송 시각(Unix 시간)을 반환합니다. 수신자가 없으면 None 을 반환합니다.
+        """
+        while self._heap:
+            due, _, key = self._heap[0]
+            group = self._groups.get(key)
+            if group is not None and group.due == due:
+                return due
+            heapq.heappop(self._heap)               # 삭제되었거나 갱신된 그룹
+        return None
+
+    # 발송 시각이 된 그룹 꺼내기
+    def pop_due_groups(self, now: float) -> Dict[Tuple[int, str], List[GroupKey]]:
+        """
+        발송 시각이 지난 그룹을 꺼내 (발송 시각, 지역)별 그룹 키 목록으로 묶고, 각 그룹의 다음 발송 시각을 예약합니다.
+
+        Args:
+            now: 현재 시각 (Unix 시간)
+
+        Returns:
+            Dict[Tuple[int, str], List[GroupKey]]: (발송 시각, 지역) -> 그룹 키 목록
+        """
+        batches: Dict[Tuple[int, str], List[GroupKey]] = {}
+
+        while True:
+            due = self.next_deadline()
+            if due is None or due > now:
+                break
+
+            _, _, key = heapq.heappop(self._heap)
+            group = self._groups[key]
+            batches.setdefault((due, key[0]), []).append(key)
+
+            group.due = group.next_due(max(now, due))
+            heapq.heappush(self._heap, (group.due, next(self._counter), key))
+
+        return batches
+
+    # 발송 시각이 된 배치 꺼내기
+    def pop_due(self, now: float) -> Dict[Tuple[int, str], List[str]]:
+        """
+        발송 시각이 지난 그룹을 꺼내 (발송 시각, 지역)별 수신자 목록으로 묶고, 각 그룹의 다음 발송 시각을 예약합니다.
+
+        Args:
+            now: 현재 시각 (Unix 시간)
+
+        Returns:
+            Dict[Tuple[int, str], List[str]]: (발송 시각, 지역) -> 수신자 목록
+        """
+        batches: Dict[Tuple[int, str], List[str]] = {}
+        for batch_key, keys in self.pop_due_groups(now).items():
+            members = [member for key in keys for member in self._groups[key].members]
+            if members:
+                batches[batch_key] = members
+        return batches
+
+    # 발송 배치 실행
+    async def _run_batch(
+        self,
+        handler: Callable[[datetime, str, List[str]], Awaitable[Any]],
+        due: int,
+        location: str,
+        members: List[Any],
+        stored: bool = False
+    ):
+        scheduled = datetime.fromtimestamp(due, dt_timezone.utc)
+        delay_ms = (time.time() - due) * 1000
+        size = f"저장소 그룹 {len(members)}개" if stored else f"{len(members)}명"
+        logging.info(f"발송 배치 시작: {location} {size} (예정 시각 대비 {delay_ms:.1f}ms)")
+
+        try:
+            await handler(scheduled, location, members)
+        except Exception as e:
+            logging.error(f"발송 배치 실행 중 오류 발생 ({location}): {e}")
+
+    # 큐 실행
+    async def run(self, handler: Callable[[datetime, str, List[Any]], Awaitable[Any]], stored: bool = False):
+        """
+        stop() 이 호출될 때까지 발송 시각마다 handler(발송 시각(UTC), 지역, 수신자 목록) 을 태스크로 실행합니다.
+        stored 가 True 이면 수신자 목록 대신 저장소 그룹 키 목록을 전달합니다.
+        종료 시 실행 중인 배치가 끝나기를 기다립니다.
+        """
+        self._wakeup = asyncio.Event()
+        self._stopped = False
+
+        try:
+            while not self._stopped:
+                self._wakeup.clear()
+
+                for (due, location), keys in self.pop_due_groups(time.time()).items():
+                    if stored:
+                        members = [key for key in keys if self._groups[key].stored]
+                    else:
+                        members = [member for key in keys for member in self._groups[key].members]
+                    if not members:
+                        continue
+                    task = asyncio.create_task(self._run_batch(handler, due, location, members, stored))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+                deadline = self.next_deadline()
+                timeout = MAX_SLEEP_SECONDS if deadline is None else min(deadline - time.time(), MAX_SLEEP_SECONDS)
+                if timeout <= 0:
+                    continue
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # 큐 실행 중지
+    def stop(self):
+        self._stopped = True
+        if self._wakeup is not None:
+            self._wakeup.set()